@@ -0,0 +1,25 @@
+# Copyright 2026 Camptocamp SA
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html).
+
+from odoo import http
+
+from odoo.addons.portal.controllers import portal
+
+
+class CustomerPortal(portal.CustomerPortal):
+    @http.route(
+        ["/my/orders/<int:order_id>/availability"],
+        type="json",
+        auth="public",
+    )
+    def portal_order_availability(self, order_id, access_token=None, **kw):
+        """Return the availability of the lines of the sale order
+
+        The lines are returned as a list of dicts with the keys ``id``,
+        ``availability_status``, ``expected_availability_date``,
+        ``available_qty`` and ``delayed_qty``.
+        """
+        order_sudo = self._document_check_access(
+            "sale.order", order_id, access_token=access_token
+        )
+        return order_sudo.order_line._get_availability_status_json()
@@ -9,9 +9,18 @@ class ProductProduct(models.Model):
 
     def _get_next_replenishment_date(self):
         self.ensure_one()
-        move_line = self.env["stock.move"].search(
+        return self._get_next_replenishment_dates().get(self.id, False)
+
+    def _get_next_replenishment_dates(self):
+        """Return {product id: date of its next incoming move}
+
+        The dates of all the products are read with one grouped query.
+        """
+        if not self:
+            return {}
+        groups = self.env["stock.move"].read_group(
             [
-                ("product_id", "=", self.id),
+                ("product_id", "in", self.ids),
                 (
                     "state",
                     "in",
@@ -25,7 +34,7 @@ class ProductProduct(models.Model):
                 ),
                 ("picking_type_id.code", "=", "incoming"),
             ],
-            limit=1,
-            order="date asc",
+            ["product_id", "date:min"],
+            ["product_id"],
         )
-        return move_line and move_line.date or False
+        return {group["product_id"][0]: group["date"] for group in groups}
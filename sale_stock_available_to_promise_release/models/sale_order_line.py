@@ -42,11 +42,52 @@ class SaleOrderLine(models.Model):
         "is_delivery",
     )
     def _compute_availability_status(self):
-        for record in self:
-            data = record._get_availability_data()
+        for record, data in self._get_availability_data_batch().items():
             record.update(data)
 
-    def _get_availability_data(self):
+    def _get_availability_data_batch(self):
+        """Return {line: availability data} for all the lines
+
+        The promised quantities of the moves of all the lines are computed in
+        one pass per warehouse and the next replenishment dates of all the
+        products are read with one query.
+        """
+        lines = self.filtered(
+            lambda line: not line.display_type
+            and line.product_id
+            and not line.is_delivery
+        )
+        # computed for all the moves at once
+        lines.move_ids.mapped("ordered_available_to_promise_uom_qty")
+        replenishment_dates = lines.product_id._get_next_replenishment_dates()
+        return {
+            line: line._get_availability_data(replenishment_dates=replenishment_dates)
+            for line in self
+        }
+
+    def _get_availability_status_json(self):
+        """Return the availability of the lines, as sent to the portal"""
+        data = self._get_availability_data_batch()
+        return [
+            {
+                "id": line.id,
+                "availability_status": values["availability_status"],
+                "expected_availability_date": fields.Datetime.to_string(
+                    values["expected_availability_date"]
+                ),
+                "available_qty": values["available_qty"],
+                "delayed_qty": values["delayed_qty"],
+            }
+            for line, values in data.items()
+        ]
+
+    def _get_availability_data(self, replenishment_dates=None):
+        """Return the availability data of the line
+
+        :param replenishment_dates: {product id: next replenishment date}, as
+            returned by ``_get_next_replenishment_dates``, read for the product
+            of the line when not given
+        """
         data = dict.fromkeys(
             (
                 "availability_status",
@@ -92,7 +133,10 @@ class SaleOrderLine(models.Model):
             delayed_qty = self.product_uom_qty - available_qty
         # No stock
         elif float_is_zero(available_qty, precision_rounding=rounding):
-            product_replenishment_date = product._get_next_replenishment_date()
+            if replenishment_dates is None:
+                product_replenishment_date = product._get_next_replenishment_date()
+            else:
+                product_replenishment_date = replenishment_dates.get(product.id)
             # Replenishment ordered
             if product_replenishment_date:
                 availability_status = "restock"
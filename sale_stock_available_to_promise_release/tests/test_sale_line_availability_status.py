@@ -3,6 +3,7 @@
 
 
 from datetime import datetime
+from unittest import mock
 
 from freezegun import freeze_time
 
@@ -77,3 +78,35 @@ class TestSaleLineAvailablilityStatus(Common):
         )
         self.assertEqual(self.line.available_qty, 0.0)
         self.assertEqual(self.line.delayed_qty, 0.0)
+
+    def test_availability_batch(self):
+        """The replenishment dates of all the lines are read at once."""
+        product2 = self.product.copy()
+        self._create_replenishment_picking(self.product, 100)
+        self._create_replenishment_picking(product2, 100)
+        line2 = self.line.copy({"order_id": self.sale.id, "product_id": product2.id})
+        self.sale.action_confirm()
+        lines = self.line | line2
+        lines.invalidate_recordset()
+        product_model = self.env.registry["product.product"]
+        with mock.patch.object(
+            product_model,
+            "_get_next_replenishment_dates",
+            autospec=True,
+            side_effect=product_model._get_next_replenishment_dates,
+        ) as get_dates:
+            self.assertEqual(lines.mapped("availability_status"), ["restock"] * 2)
+        self.assertEqual(get_dates.call_count, 1)
+        self.assertEqual(
+            lines._get_availability_status_json(),
+            [
+                {
+                    "id": line.id,
+                    "availability_status": "restock",
+                    "expected_availability_date": "2021-07-03 12:00:00",
+                    "available_qty": 0.0,
+                    "delayed_qty": 100.0,
+                }
+                for line in lines
+            ],
+        )
@@ -119,25 +119,121 @@ class MoveLineSearch(Component):
         sort_keys_func=None,
         picking_ready=True,
         enforce_empty_package=False,
+        limit=None,
+        offset=0,
+        after_line=None,
     ):
-        """Find lines that potentially need work in given locations."""
-        move_lines = self.env["stock.move.line"].search(
-            self._search_move_lines_domain(
-                locations,
-                picking_type,
-                package,
-                product,
-                lot,
-                match_user=match_user,
-                picking_ready=picking_ready,
-                enforce_empty_package=enforce_empty_package,
-            )
+        """Find lines that potentially need work in given locations.
+
+        The built-in orders are applied by the database, along with the
+        ``limit`` and ``offset``. ``after_line`` allows keyset pagination: only
+        the lines coming after this line in the order are returned.
+
+        The lines are sorted in Python when a ``sort_keys_func`` is given or
+        for the ``custom_code`` order, which can only be evaluated on records.
+        """
+        domain = self._search_move_lines_domain(
+            locations,
+            picking_type,
+            package,
+            product,
+            lot,
+            match_user=match_user,
+            picking_ready=picking_ready,
+            enforce_empty_package=enforce_empty_package,
         )
         order = order or self.sort_order
+        if sort_keys_func is None and order in self._sort_keys_sql_orders():
+            return self._search_move_lines_sql(
+                domain, order, limit=limit, offset=offset, after_line=after_line
+            )
+        move_lines = self.env["stock.move.line"].search(domain)
         sort_keys_func = sort_keys_func or self._sort_key_move_lines(order)
         move_lines = move_lines.sorted(sort_keys_func)
+        if after_line:
+            if after_line not in move_lines:
+                return move_lines.browse()
+            move_lines = move_lines[list(move_lines).index(after_line) + 1 :]
+        move_lines = move_lines[offset:]
+        if limit:
+            move_lines = move_lines[:limit]
         return move_lines
 
+    def _sort_keys_sql_orders(self):
+        """Orders which can be applied by the database"""
+        return ("priority", "location", "assigned_to_current_user")
+
+    def _sort_keys_sql(self, query, order):
+        """Return the SQL expressions sorting the lines, for a built-in order
+
+        The expressions match the keys of ``_sort_key_move_lines``. They are
+        all ascending and never NULL so they can be compared as a row for the
+        keyset pagination. The tables they need are joined on the query.
+        """
+        line_alias = self.env["stock.move.line"]._table
+        picking_alias = query.left_join(
+            line_alias, "picking_id", "stock_picking", "id", "picking_id"
+        )
+        user_id = (
+            f'COALESCE("{line_alias}".shopfloor_user_id, "{picking_alias}".user_id)'
+        )
+        keys = [
+            f"""
+            CASE
+                WHEN {user_id} = {int(self.env.uid)} THEN 0
+                WHEN {user_id} IS NULL THEN 1
+                ELSE 2
+            END
+            """
+        ]
+        if order in ("priority", "location"):
+            move_alias = query.left_join(
+                line_alias, "move_id", "stock_move", "id", "move_id"
+            )
+            if order == "priority":
+                keys.append(f"-COALESCE(\"{move_alias}\".priority, '0')::integer")
+            else:
+                location_alias = query.left_join(
+                    line_alias, "location_id", "stock_location", "id", "location_id"
+                )
+                # compared like python strings, whatever the collation of the
+                # database
+                keys += [
+                    f"COALESCE(\"{location_alias}\".shopfloor_picking_sequence, '')"
+                    ' COLLATE "C"',
+                    f'"{location_alias}".name COLLATE "C"',
+                ]
+            keys += [f'"{move_alias}".date', f'"{move_alias}".id']
+        keys.append(f'"{line_alias}".id')
+        return keys
+
+    def _search_move_lines_sql(
+        self, domain, order, limit=None, offset=0, after_line=None
+    ):
+        """Search the lines sorted, limited and paginated by the database"""
+        model = self.env["stock.move.line"]
+        model._flush_search(domain)
+        model.flush_model(["shopfloor_user_id", "picking_id", "move_id", "location_id"])
+        self.env["stock.picking"].flush_model(["user_id"])
+        self.env["stock.move"].flush_model(["priority", "date"])
+        self.env["stock.location"].flush_model(["shopfloor_picking_sequence", "name"])
+        query = model._where_calc(domain)
+        model._apply_ir_rules(query, "read")
+        keys = self._sort_keys_sql(query, order)
+        if after_line:
+            after_query = model._where_calc([("id", "=", after_line.id)])
+            after_keys = self._sort_keys_sql(after_query, order)
+            after_sql, after_params = after_query.select(", ".join(after_keys))
+            query.add_where(
+                "({}) > ({})".format(", ".join(keys), after_sql), after_params
+            )
+        query.order = ", ".join(keys)
+        query.limit = limit
+        query.offset = offset or None
+        query_str, params = query.select()
+        self.env.cr.execute(query_str, params)
+        return model.browse([row[0] for row in self.env.cr.fetchall()])
+
     def _sort_key_move_lines(self, order=None):
         """Return a sorting function to order lines."""
         if order is None:
@@ -153,7 +249,7 @@ class MoveLineSearch(Component):
             return self._sort_key_custom_code
 
         if order == "assigned_to_current_user":
-            return self._sort_key_assigned_to_current_user
+            return self._sort_key_move_lines_assigned_to_current_user
 
         raise ValueError(f"Unknown order '{order}'")
 
@@ -163,6 +259,7 @@ class MoveLineSearch(Component):
             -int(line.move_id.priority or "0"),
             line.move_id.date,
             line.move_id.id,
+            line.id,
         )
 
     def _sort_key_move_lines_location(self, line):
@@ -171,8 +268,12 @@ class MoveLineSearch(Component):
             line.location_id.name,
             line.move_id.date,
             line.move_id.id,
+            line.id,
         )
 
+    def _sort_key_move_lines_assigned_to_current_user(self, line):
+        return self._sort_key_assigned_to_current_user(line) + (line.id,)
+
     def _sort_key_assigned_to_current_user(self, line):
         user_id = line.shopfloor_user_id.id or line.picking_id.user_id.id or None
         # Determine sort priority
@@ -209,3 +310,69 @@ class MoveLineSearch(Component):
             "priority_lines_count": len(priority_lines),
             "priority_picking_count": len(priority_pickings),
         }
+
+    def counters_by_location_and_picking_type(self, locations, picking_type=None, **kw):
+        """Count the lines to work on by location and picking type
+
+        The lines are the ones of ``search_move_lines`` called with the same
+        arguments. They are counted for each location (lines of its children
+        included) and picking type of their transfer in a single grouped
+        query, without reading them.
+
+        :return: {(location id, picking type id): counters}, the counters
+            being the ones of ``counters_for_lines``
+        """
+        model = self.env["stock.move.line"]
+        domain = self._search_move_lines_domain(locations, picking_type, **kw)
+        model._flush_search(domain)
+        query = model._where_calc(domain)
+        model._apply_ir_rules(query, "read")
+        from_clause, where_clause, params = query.get_sql()
+        model.flush_model(["location_id", "move_id", "picking_id"])
+        self.env["stock.move"].flush_model(["priority"])
+        self.env["stock.picking"].flush_model(["priority", "picking_type_id"])
+        self.env["stock.location"].flush_model(["parent_path"])
+        self.env.cr.execute(
+            f"""
+            SELECT
+                counted_location.id,
+                counted_picking.picking_type_id,
+                COUNT(*),
+                COUNT(DISTINCT "stock_move_line".picking_id),
+                COUNT(*) FILTER (
+                    WHERE COALESCE(counted_move.priority, '0')::integer > 0
+                ),
+                COUNT(DISTINCT "stock_move_line".picking_id) FILTER (
+                    WHERE COALESCE(counted_picking.priority, '0')::integer > 0
+                )
+            FROM {from_clause}
+            JOIN stock_location line_location
+            ON line_location.id = "stock_move_line".location_id
+            JOIN stock_location counted_location
+            ON line_location.parent_path LIKE counted_location.parent_path || '%%'
+            LEFT JOIN stock_move counted_move
+            ON counted_move.id = "stock_move_line".move_id
+            LEFT JOIN stock_picking counted_picking
+            ON counted_picking.id = "stock_move_line".picking_id
+            WHERE ({where_clause or "TRUE"})
+            AND counted_location.id = ANY(%s)
+            GROUP BY counted_location.id, counted_picking.picking_type_id
+            """,
+            params + [locations.ids],
+        )
+        return {
+            (location_id, picking_type_id): {
+                "lines_count": lines_count,
+                "picking_count": picking_count,
+                "priority_lines_count": priority_lines_count,
+                "priority_picking_count": priority_picking_count,
+            }
+            for (
+                location_id,
+                picking_type_id,
+                lines_count,
+                picking_count,
+                priority_lines_count,
+                priority_picking_count,
+            ) in self.env.cr.fetchall()
+        }
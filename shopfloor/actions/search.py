@@ -59,6 +59,27 @@ class SearchAction(Component):
             "origin_move": self.origin_move_from_scan,
         }
 
+    @property
+    def _barcode_index_types(self):
+        """Types of ``shopfloor.barcode.index`` searched by the handlers
+
+        {handler type: index type}. A handler is only called when the code is
+        in the index for its type. Extending the search of one of these
+        handlers on other codes requires to extend the index too, see
+        ``shopfloor.barcode.index._get_index_sources``.
+        """
+        return {
+            "product": "product",
+            "package": "package",
+            "picking": "picking",
+            "location": "location",
+            "location_dest": "location",
+            "lot": "lot",
+            "serial": "lot",
+            "packaging": "packaging",
+            "delivery_packaging": "delivery_packaging",
+        }
+
     def _make_search_result(self, **kwargs):
         """Build a 'SearchResult' object describing the record found.
 
@@ -84,8 +105,20 @@ class SearchAction(Component):
 
     def generic_find(self, barcode, types=None, handler_kw=None):
         _types = types or self._barcode_type_handler.keys()
+        # the handlers given arguments may search on other codes (e.g. the
+        # origin of the transfers)
+        indexed_types = {
+            btype: index_type
+            for btype, index_type in self._barcode_index_types.items()
+            if btype in _types and not (handler_kw or {}).get(btype)
+        }
+        found_index_types = self.env["shopfloor.barcode.index"]._get_record_types(
+            barcode, set(indexed_types.values())
+        )
         # TODO: decide the best default order in case we don't pass `types`
         for btype in _types:
+            if btype in indexed_types and indexed_types[btype] not in found_index_types:
+                continue
             record = self._find_record_by_type(barcode, btype, handler_kw)
             if record:
                 return self._make_search_result(record=record, code=barcode, type=btype)
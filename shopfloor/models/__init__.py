@@ -10,3 +10,4 @@ from . import stock_picking
 from . import stock_picking_batch
 from . import stock_quant
 from . import stock_quant_package
+from . import shopfloor_barcode_index
@@ -0,0 +1,95 @@
+# Copyright 2026 Camptocamp SA (http://www.camptocamp.com)
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
+from odoo import api, fields, models, tools
+
+
+class ShopfloorBarcodeIndex(models.Model):
+    """Codes of the records which can be scanned
+
+    A view gathering the codes searched by the scan handlers of
+    ``shopfloor.search.action``, so the types of records matching a scanned
+    code are known with a single query, the condition on the code being
+    applied on the index of each table.
+
+    The view is not filtered on the companies or on the archived records: it
+    tells which handlers can find a record, the records are still searched by
+    the handlers.
+    """
+
+    _name = "shopfloor.barcode.index"
+    _description = "Shopfloor Barcode Index"
+    _auto = False
+
+    code = fields.Char(readonly=True)
+    record_type = fields.Char(readonly=True)
+    res_id = fields.Integer(readonly=True)
+
+    @api.model
+    def _get_index_sources(self):
+        """Codes gathered in the view
+
+        List of (index type, model, code field, additional condition). A
+        module extending a ``*_from_scan`` handler of
+        ``shopfloor.search.action`` to search other codes must add them here,
+        the handler is not called when the code is not in the index.
+        """
+        return [
+            ("product", "product.product", "barcode", ""),
+            ("product", "product.product", "default_code", ""),
+            ("package", "stock.quant.package", "name", ""),
+            ("picking", "stock.picking", "name", ""),
+            ("location", "stock.location", "barcode", ""),
+            ("location", "stock.location", "name", ""),
+            ("lot", "stock.lot", "name", ""),
+            ("packaging", "product.packaging", "barcode", "product_id IS NOT NULL"),
+            ("delivery_packaging", "stock.package.type", "barcode", ""),
+        ]
+
+    def init(self):
+        # the locations are searched by name when no barcode matches
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS stock_location_shopfloor_name_index
+            ON stock_location (name)
+            """
+        )
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        # the ids are only unique to please the ORM, the view is read in SQL
+        sources = self._get_index_sources()
+        selects = []
+        for index, (record_type, model, column, condition) in enumerate(sources):
+            table = self.env[model]._table
+            selects.append(
+                f"""
+                SELECT
+                    {table}.id * {len(sources)} + {index} AS id,
+                    {table}.{column} AS code,
+                    '{record_type}' AS record_type,
+                    {table}.id AS res_id
+                FROM {table}
+                WHERE {table}.{column} IS NOT NULL
+                {"AND " + condition if condition else ""}
+                """
+            )
+        # pylint: disable=sql-injection
+        self.env.cr.execute(
+            f"CREATE VIEW {self._table} AS ({' UNION ALL '.join(selects)})"
+        )
+
+    @api.model
+    def _get_record_types(self, code, record_types):
+        """Return the types of the records having the code, among record_types"""
+        if not code or not record_types:
+            return set()
+        for record_type, model, __, __ in self._get_index_sources():
+            if record_type in record_types:
+                self.env[model].flush_model()
+        # pylint: disable=sql-injection
+        self.env.cr.execute(
+            f"""
+            SELECT DISTINCT record_type FROM {self._table}
+            WHERE code = %s AND record_type = ANY(%s)
+            """,
+            (code, list(record_types)),
+        )
+        return {row[0] for row in self.env.cr.fetchall()}
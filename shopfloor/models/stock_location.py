@@ -1,6 +1,6 @@
 # Copyright 2020 Camptocamp SA (http://www.camptocamp.com)
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
-from odoo import fields, models
+from odoo import api, fields, models
 from odoo.tools.float_utils import float_compare
 
 
@@ -47,27 +47,72 @@ class StockLocation(models.Model):
         these move lines.
         """
         self.ensure_one()
-        quants = self.env["stock.quant"].search(
-            [("quantity", ">", 0), ("location_id", "=", self.id)]
+        return self.planned_qty_in_locations_are_empty([(self, move_lines)])[0]
+
+    @api.model
+    def planned_qty_in_locations_are_empty(self, location_move_lines):
+        """Bulk version of ``planned_qty_in_location_is_empty``
+
+        :param location_move_lines: list of (location, move lines or None)
+        :return: list of booleans, telling for each (location, move lines) if
+            the location will be empty
+        """
+        locations = self.browse().union(
+            *(location for location, __ in location_move_lines)
         )
-        remaining = sum(quants.mapped("quantity"))
-        move_line_qty_field = "qty_done"
-        if move_lines:
-            move_lines = move_lines.filtered(
-                lambda m: m.state not in ("cancel", "done")
+        quantities = self._get_quant_quantities_by_location(locations)
+        done_locations = self.browse().union(
+            *(
+                location
+                for location, move_lines in location_move_lines
+                if not move_lines
             )
-            move_line_qty_field = "reserved_uom_qty"
-        else:
-            move_lines = self.env["stock.move.line"].search(
-                [
-                    ("state", "not in", ("cancel", "done")),
-                    ("location_id", "=", self.id),
-                    ("qty_done", ">", 0),
-                ]
-            )
-        planned = remaining - sum(move_lines.mapped(move_line_qty_field))
-        compare = float_compare(planned, 0, precision_rounding=0.01)
-        return compare <= 0
+        )
+        qties_done = self._get_qty_done_by_location(done_locations)
+        res = []
+        for location, move_lines in location_move_lines:
+            remaining = quantities.get(location.id, 0.0)
+            if move_lines:
+                move_lines = move_lines.filtered(
+                    lambda m: m.state not in ("cancel", "done")
+                )
+                planned_qty = sum(move_lines.mapped("reserved_uom_qty"))
+            else:
+                planned_qty = qties_done.get(location.id, 0.0)
+            planned = remaining - planned_qty
+            compare = float_compare(planned, 0, precision_rounding=0.01)
+            res.append(compare <= 0)
+        return res
+
+    @api.model
+    def _get_quant_quantities_by_location(self, locations):
+        """Return {location id: quantity in stock}, with one grouped query"""
+        if not locations:
+            return {}
+        groups = self.env["stock.quant"].read_group(
+            [("quantity", ">", 0), ("location_id", "in", locations.ids)],
+            ["location_id", "quantity:sum"],
+            ["location_id"],
+        )
+        return {group["location_id"][0]: group["quantity"] for group in groups}
+
+    @api.model
+    def _get_qty_done_by_location(self, locations):
+        """Return {location id: quantity done of the ongoing move lines}, with
+        one grouped query
+        """
+        if not locations:
+            return {}
+        groups = self.env["stock.move.line"].read_group(
+            [
+                ("state", "not in", ("cancel", "done")),
+                ("location_id", "in", locations.ids),
+                ("qty_done", ">", 0),
+            ],
+            ["location_id", "qty_done:sum"],
+            ["location_id"],
+        )
+        return {group["location_id"][0]: group["qty_done"] for group in groups}
 
     def should_bypass_reservation(self):
         self.ensure_one()
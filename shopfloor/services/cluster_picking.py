@@ -194,8 +194,8 @@ class ClusterPicking(Component):
         * confirm_start: when it could find a batch
         * start: when no batch is available
         """
-        batches = self._batch_picking_search()
-        selected = self._select_a_picking_batch(batches)
+        batch = self._batch_picking_claim()
+        selected = self._select_a_picking_batch(batch)
         if selected:
             return self._response_for_confirm_start(selected)
         else:
@@ -239,6 +239,76 @@ class ClusterPicking(Component):
         records = records.filtered(self._batch_filter)
         return records
 
+    def _batch_picking_claim(self):
+        """Select and lock the next batch the user can work on
+
+        The batch is the first one ``_select_a_picking_batch`` would choose
+        among the batches of ``_batch_picking_search``, chosen and locked in
+        a single query: the batches locked by other users claiming a batch at
+        the same time are skipped instead of waited for, so every user gets a
+        different batch.
+
+        The batches are not read by ``_batch_picking_search``: when
+        ``find_batch`` must select other batches, override
+        ``_batch_picking_base_search_domain``,
+        ``_batch_picking_claim_condition`` (the SQL counterpart of
+        ``_batch_filter`` and ``_batch_picking_filter``) or
+        ``_batch_picking_claim_order`` (the SQL counterpart of
+        ``_select_a_picking_batch``).
+        """
+        model = self.env["stock.picking.batch"]
+        domain = self._batch_picking_base_search_domain()
+        model._flush_search(domain)
+        model.flush_model(["state", "user_id"])
+        self.env["stock.picking"].flush_model(["batch_id", "picking_type_id", "state"])
+        query = model._where_calc(domain)
+        model._apply_ir_rules(query, "read")
+        query.add_where(*self._batch_picking_claim_condition())
+        query.order = self._batch_picking_claim_order()
+        query.limit = 1
+        query_str, params = query.select()
+        self.env.cr.execute(
+            query_str + ' FOR UPDATE OF "stock_picking_batch" SKIP LOCKED', params
+        )
+        return model.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _batch_picking_claim_condition(self):
+        """Return the SQL condition and its params on the claimed batches
+
+        Same conditions as ``_batch_filter``, the batch table being
+        ``"stock_picking_batch"``.
+        """
+        return (
+            """
+            EXISTS (
+                SELECT 1 FROM stock_picking picking
+                WHERE picking.batch_id = "stock_picking_batch".id
+                AND picking.picking_type_id = ANY(%s)
+                AND (
+                    "stock_picking_batch".state = 'in_progress'
+                    OR picking.state IN ('assigned', 'done', 'cancel')
+                )
+            )
+            """,
+            [self.picking_types.ids],
+        )
+
+    def _batch_picking_claim_order(self):
+        """Return the SQL order of the claimed batches
+
+        Same preferences as ``_select_a_picking_batch``.
+        """
+        uid = int(self.env.uid)
+        return f"""
+            CASE
+                WHEN "stock_picking_batch".user_id = {uid}
+                AND "stock_picking_batch".state = 'in_progress' THEN 0
+                WHEN "stock_picking_batch".user_id = {uid} THEN 1
+                ELSE 2
+            END,
+            "stock_picking_batch".id
+        """
+
     def _batch_filter(self, batch):
         if not batch.picking_ids:
             return False
@@ -234,8 +234,8 @@ class LocationContentTransfer(Component):
         return self.env["stock.move"].create(move_vals_list)
 
     def _find_location_to_work_from(self):
-        move_lines = self.search_move_line.search_move_lines(match_user=True)
-        return first(move_lines).location_id
+        move_lines = self.search_move_line.search_move_lines(match_user=True, limit=1)
+        return move_lines.location_id
 
     def _select_move_lines_first_location(self, move_lines):
         location = first(move_lines).location_id
@@ -304,19 +304,26 @@ class ZonePicking(Component):
             # available picking types to choose from
             "picking_types": self.data.picking_types(picking_types),
         }
+        # counted for all the picking types at once
+        counters = self._counters_by_zone_and_picking_type(zone_location, picking_types)
         for datum in data["picking_types"]:
-            picking_type = self.env["stock.picking.type"].browse(datum["id"])
-            zone_lines = self._picking_type_zone_lines(zone_location, picking_type)
-            counters = self._counters_for_zone_lines(zone_lines)
-            datum.update(counters)
+            datum.update(
+                counters.get((zone_location.id, datum["id"]))
+                or self._counters_for_zone_lines([])
+            )
         return data
 
     def _counters_for_zone_lines(self, zone_lines):
         return self.search_move_line.counters_for_lines(zone_lines)
 
-    def _picking_type_zone_lines(self, zone_location, picking_type):
-        return self.search_move_line.search_move_lines(
-            zone_location, picking_type=picking_type
+    def _counters_by_zone_and_picking_type(self, zones, picking_types):
+        """Count the lines to work on in the zones by operation type
+
+        :return: {(zone id, picking type id): counters}, the counters being
+            the ones of ``_counters_for_zone_lines``
+        """
+        return self.search_move_line.counters_by_location_and_picking_type(
+            zones, picking_type=picking_types
         )
 
     def _data_for_move_line(
@@ -354,24 +361,36 @@ class ZonePicking(Component):
             data["sublocation"] = self.data.location(sublocation)
         if package:
             data["package"] = self.data.package(package)
-        for data_move_line in data["move_lines"]:
-            # TODO: this could be expensive, think about a better way
-            # to retrieve if location will be empty.
-            # Maybe group lines by location and compute only once.
-            move_line = self.env["stock.move.line"].browse(data_move_line["id"])
-            handle_complete_mix_pack = self._handle_complete_mix_pack(
+        move_lines = self.env["stock.move.line"].browse(
+            [data_move_line["id"] for data_move_line in data["move_lines"]]
+        )
+        complete_mix_packs = {}
+        for move_line in move_lines:
+            package = move_line.package_id
+            if package not in complete_mix_packs:
+                complete_mix_packs[package] = self._handle_complete_mix_pack(package)
+        # `location_will_be_empty` flag states if, by processing this move line
+        # and picking the product, the location will be emptied.
+        # It is computed for all the lines at once.
+        location_model = self.env["stock.location"]
+        locations_empty = location_model.planned_qty_in_locations_are_empty(
+            [
+                (
+                    move_line.location_id,
+                    move_line.package_id.move_line_ids
+                    if complete_mix_packs[move_line.package_id]
+                    else move_line,
+                )
+                for move_line in move_lines
+            ]
+        )
+        for data_move_line, move_line, location_will_be_empty in zip(
+            data["move_lines"], move_lines, locations_empty
+        ):
+            data_move_line["handle_complete_mix_pack"] = complete_mix_packs[
                 move_line.package_id
-            )
-            data_move_line["handle_complete_mix_pack"] = handle_complete_mix_pack
-            # `location_will_be_empty` flag states if, by processing this move line
-            # and picking the product, the location will be emptied.
-            data_move_line[
-                "location_will_be_empty"
-            ] = move_line.location_id.planned_qty_in_location_is_empty(
-                move_line.package_id.move_line_ids
-                if handle_complete_mix_pack
-                else move_line
-            )
+            ]
+            data_move_line["location_will_be_empty"] = location_will_be_empty
         return data
 
     def _data_for_location(self, location, zone_location=None, picking_type=None):
@@ -383,37 +402,40 @@ class ZonePicking(Component):
             "location": self.data.location(location),
         }
 
-    def _zone_lines(self, zones):
-        return self._find_location_move_lines(zones)
-
     def _data_for_select_zone(self, zones):
         """Retrieve detailed info for each zone.
 
         Zone without lines are skipped.
-        Zone with lines will have line counters by operation type.
+        Zone with lines will have line counters by operation type, the
+        operation types being in their sequence order.
 
         :param zones: zone location recordset
         :return: see _schema_for_select_zone
         """
+        # the lines are counted for all the zones and operation types at once
+        counters = self._counters_by_zone_and_picking_type(zones, self.picking_type)
+        picking_types = (
+            self.env["stock.picking.type"]
+            .browse({picking_type_id for __, picking_type_id in counters})
+            .sorted()
+        )
         res = []
         for zone in zones:
             zone_data = self.data.location(zone)
-            zone_lines = self._zone_lines(zone)
-            if not zone_lines:
-                continue
-            lines_by_op_type = defaultdict(list)
-            for line in zone_lines:
-                lines_by_op_type[line.picking_id.picking_type_id].append(line)
-
             zone_data["operation_types"] = []
             zone_counters = defaultdict(int)
-            for picking_type, lines in lines_by_op_type.items():
+            for picking_type in picking_types:
+                op_type_counters = counters.get((zone.id, picking_type.id))
+                if not op_type_counters:
+                    continue
                 op_type_data = self.data.picking_type(picking_type)
-                counters = self._counters_for_zone_lines(lines)
-                op_type_data.update(counters)
+                op_type_data.update(op_type_counters)
                 zone_data["operation_types"].append(op_type_data)
-                for k, v in counters.items():
+                for k, v in op_type_counters.items():
                     zone_counters[k] += v
+            if not zone_data["operation_types"]:
+                # Zone without lines are skipped
+                continue
             zone_data.update(zone_counters)
             res.append(zone_data)
         return res
@@ -427,6 +449,7 @@ class ZonePicking(Component):
         lot=None,
         match_user=False,
         enforce_empty_package=False,
+        limit=None,
     ):
         """Find lines that potentially need work in given locations."""
         return self.search_move_line.search_move_lines(
@@ -438,6 +461,7 @@ class ZonePicking(Component):
             lot=lot,
             match_user=match_user,
             enforce_empty_package=enforce_empty_package,
+            limit=limit,
         )
 
     def _find_buffer_move_lines_domain(self, dest_package=None):
@@ -570,6 +594,7 @@ class ZonePicking(Component):
             lot=lot,
             package=package,
             match_user=True,
+            limit=1,
         )
         if move_lines:
             move_line = first(move_lines)
@@ -2,6 +2,8 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
 # @author Simone Orsi <simahawk@gmail.com>
 
+from unittest import mock
+
 from .common import CommonCase
 
 
@@ -246,3 +248,19 @@ class TestFindCase(TestSearchBaseCase):
             ),
         )
         self.assertEqual(res.record, prod)
+
+    def test_find_barcode_index(self):
+        rec = self.customer_location
+        index = self.env["shopfloor.barcode.index"]
+        self.assertEqual(
+            index._get_record_types(rec.barcode, {"location", "product"}),
+            {"location"},
+        )
+        self.assertFalse(index._get_record_types("NONE", {"location", "product"}))
+        # the handlers of the types not having the code are not called
+        with mock.patch.object(
+            type(self.search), "product_from_scan", autospec=True
+        ) as product_from_scan:
+            res = self.search.find(rec.barcode, types=("product", "location"))
+        product_from_scan.assert_not_called()
+        self.assertEqual(res.record, rec)
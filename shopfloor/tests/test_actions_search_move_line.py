@@ -126,3 +126,47 @@ class TestActionsSearchMoveLine(CommonCase):
         # we must only get picking assigned to user2
         self.assertEqual(move_lines.picking_id.user_id, self.user2)
         self.assertEqual(move_lines.shopfloor_user_id, self.user2)
+
+    def test_search_move_line_sql_order(self):
+        self.picking_user2.move_ids.priority = "1"
+        location = self.picking_type.default_location_src_id
+        for user in (None, self.user1, self.user2):
+            for order in ("priority", "location", "assigned_to_current_user"):
+                with self.search_move_line(user=user) as move_line_search:
+                    move_lines = move_line_search.search_move_lines(
+                        locations=location, order=order
+                    )
+                    # sorted in python, from the lines as search() returns them
+                    expected = move_line_search.search_move_lines(
+                        locations=location,
+                        order=order,
+                        sort_keys_func=move_line_search._sort_key_move_lines(order),
+                    )
+                self.assertEqual(move_lines.ids, expected.ids)
+
+    def test_search_move_line_pagination(self):
+        location = self.picking_type.default_location_src_id
+        with self.search_move_line() as move_line_search:
+            move_lines = move_line_search.search_move_lines(locations=location)
+            self.assertGreaterEqual(len(move_lines), 3)
+            self.assertEqual(
+                move_line_search.search_move_lines(locations=location, limit=1),
+                move_lines[0],
+            )
+            self.assertEqual(
+                move_line_search.search_move_lines(
+                    locations=location, limit=1, offset=1
+                ),
+                move_lines[1],
+            )
+            self.assertEqual(
+                move_line_search.search_move_lines(
+                    locations=location, after_line=move_lines[0]
+                ),
+                move_lines[1:],
+            )
+            self.assertFalse(
+                move_line_search.search_move_lines(
+                    locations=location, after_line=move_lines[-1]
+                )
+            )
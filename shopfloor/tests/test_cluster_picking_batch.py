@@ -1,5 +1,6 @@
 # Copyright 2020 Camptocamp SA (http://www.camptocamp.com)
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
+from unittest import mock
 
 from .common import CommonCase, PickingBatchMixin
 
@@ -56,6 +57,48 @@ class ClusterPickingBatchCase(CommonCase, PickingBatchMixin):
             "cluster_picking", menu=self.menu, profile=self.profile
         )
 
+    def test_claim(self):
+        """Claim the batches in the order of the preferences"""
+        self.assertFalse(self.service._batch_picking_claim())
+        pickings = self.all_batches.mapped("picking_ids")
+        self._fill_stock_for_moves(pickings.mapped("move_ids"))
+        pickings.action_assign()
+        # not for the picking types of the menu
+        self.batch1.picking_ids.picking_type_id = self.wh.in_type_id
+        # first unassigned draft batch
+        self.assertEqual(self.service._batch_picking_claim(), self.batch2)
+        # then draft batch assigned to our user
+        self.batch5.user_id = self.env.user
+        self.assertEqual(self.service._batch_picking_claim(), self.batch5)
+        # then in progress batch assigned to our user
+        self.batch6.user_id = self.env.user
+        self.batch6.action_confirm()
+        self.assertEqual(self.service._batch_picking_claim(), self.batch6)
+        # never a batch assigned to another user
+        self.batch6.user_id = self.env.ref("base.user_demo")
+        self.batch5.user_id = self.env.ref("base.user_demo")
+        self.assertEqual(self.service._batch_picking_claim(), self.batch2)
+
+    def test_claim_hooks(self):
+        """The conditions and the order of the claim can be overridden"""
+        pickings = self.all_batches.mapped("picking_ids")
+        self._fill_stock_for_moves(pickings.mapped("move_ids"))
+        pickings.action_assign()
+        service_class = type(self.service)
+        with mock.patch.object(
+            service_class,
+            "_batch_picking_claim_order",
+            return_value='"stock_picking_batch".id DESC',
+        ):
+            self.assertEqual(
+                self.service._batch_picking_claim(),
+                self.service._batch_picking_search()[-1],
+            )
+        with mock.patch.object(
+            service_class, "_batch_picking_claim_condition", return_value=("FALSE", [])
+        ):
+            self.assertFalse(self.service._batch_picking_claim())
+
     def test_search_empty(self):
         """No batch is available"""
         # Simulate the client asking the list of picking batch
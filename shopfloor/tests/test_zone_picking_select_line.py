@@ -752,3 +752,19 @@ class ZonePickingSelectLineCase(ZonePickingCommonCase):
         # the location won't be considered empty with such pending move line
         move_line_will_empty_location = location_src.planned_qty_in_location_is_empty()
         self.assertFalse(move_line_will_empty_location)
+
+    def test_list_move_lines_empty_locations_batch(self):
+        """The bulk check gives the same result as the check by location"""
+        move_lines = self.service._find_location_move_lines()
+        move_lines[0].qty_done = move_lines[0].reserved_uom_qty
+        location_move_lines = [
+            (move_line.location_id, move_line) for move_line in move_lines
+        ] + [(location, None) for location in move_lines.location_id]
+        location_model = self.env["stock.location"]
+        self.assertEqual(
+            location_model.planned_qty_in_locations_are_empty(location_move_lines),
+            [
+                location.planned_qty_in_location_is_empty(lines)
+                for location, lines in location_move_lines
+            ],
+        )
@@ -123,6 +123,29 @@ class ZonePickingStartCase(ZonePickingCommonCase):
             [expected_sub1, expected_sub2, expected_sub3, expected_sub4, expected_sub5],
         )
 
+    def test_counters_by_zone_and_picking_type(self):
+        """The grouped counters match the counters of the lines of each zone"""
+        search = self.service.search_move_line
+        zones = self.zone_location.child_ids
+        self.picking1.move_ids.priority = "1"
+        counters = search.counters_by_location_and_picking_type(zones)
+        for zone in zones:
+            lines = self.service._find_location_move_lines(zone)
+            for picking_type in lines.picking_id.picking_type_id:
+                type_lines = lines.filtered(
+                    lambda line, picking_type=picking_type: (
+                        line.picking_id.picking_type_id == picking_type
+                    )
+                )
+                self.assertEqual(
+                    counters[(zone.id, picking_type.id)],
+                    search.counters_for_lines(type_lines),
+                )
+            self.assertEqual(
+                len([key for key in counters if key[0] == zone.id]),
+                len(lines.picking_id.picking_type_id),
+            )
+
     def test_select_zone(self):
         """Scanned location invalid, no location found."""
         response = self.service.dispatch("select_zone")
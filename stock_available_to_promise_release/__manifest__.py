@@ -3,7 +3,7 @@
 
 {
     "name": "Stock Available to Promise Release",
-    "version": "16.0.3.6.0",
+    "version": "16.0.3.7.0",
     "summary": "Release Operations based on available to promise",
     "author": "Camptocamp, BCIM, Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/wms",
@@ -11,6 +11,7 @@
     "depends": ["stock"],
     "data": [
         "security/ir.model.access.csv",
+        "data/ir_cron_data.xml",
         "views/product_product_views.xml",
         "views/stock_move_views.xml",
         "views/stock_picking_views.xml",
@@ -30,6 +30,34 @@ def init_release_policy(cr):
         openupgrade.add_fields(env, field_spec=field_spec)
 
 
+def init_picking_date_priority(cr):
+    if not sql.column_exists(cr, "stock_picking", "date_priority"):
+        # Use the default sql query instead relying on ORM as all records will
+        # be updated.
+        _logger.info("Create date_priority column on stock.picking")
+        cr.execute(
+            """
+            ALTER TABLE stock_picking
+            ADD COLUMN date_priority timestamp;
+        """
+        )
+        _logger.info("Initialize date_priority field on stock.picking")
+        cr.execute(
+            """
+            UPDATE stock_picking
+            SET date_priority = moves.date_priority
+            FROM (
+                SELECT picking_id, MIN(date_priority) AS date_priority
+                FROM stock_move
+                WHERE picking_id IS NOT NULL
+                GROUP BY picking_id
+            ) moves
+            WHERE moves.picking_id = stock_picking.id
+        """
+        )
+        _logger.info(f"{cr.rowcount} rows updated")
+
+
 def pre_init_hook(cr):
     """create and initialize the date priority column on the stock move"""
     if not sql.column_exists(cr, "stock_move", "date_priority"):
@@ -49,4 +77,5 @@ def pre_init_hook(cr):
         """
         )
         _logger.info(f"{cr.rowcount} rows updated")
+    init_picking_date_priority(cr)
     init_release_policy(cr)
@@ -0,0 +1,15 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+# pylint: disable=odoo-addons-relative-import
+from odoo.addons.stock_available_to_promise_release.hooks import (
+    init_picking_date_priority,
+)
+
+
+def migrate(cr, version):
+    """
+    Use the default sql query instead relying on ORM as all records will
+    be updated.
+    """
+    init_picking_date_priority(cr)
@@ -1,5 +1,6 @@
 from . import product_product
 from . import stock_move
+from . import stock_move_promise_ledger
 from . import stock_route
 from . import stock_picking
 from . import stock_picking_type
@@ -1,6 +1,6 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
-from odoo import fields, models
+from odoo import api, fields, models, tools
 
 
 class Company(models.Model):
@@ -20,3 +20,43 @@ class Company(models.Model):
         " Their scheduled date represents the latest the transfers should"
         " be done, and therefore, past this timestamp, considered late.",
     )
+    stock_promised_qty_engine = fields.Selection(
+        [
+            ("lateral", "Per move query"),
+            ("window", "Running sum query"),
+            ("ledger", "Stored ledger"),
+        ],
+        string="Promised Quantity Engine",
+        default="lateral",
+        required=True,
+        help="How the quantities promised to the moves with a higher priority "
+        "are computed.\n"
+        "* Per move query: each move sums all the moves before it.\n"
+        "* Running sum query: the moves of each product are ordered once and "
+        "their quantities summed in a single pass.\n"
+        "* Stored ledger: the running sums are stored per warehouse and "
+        "product, and only computed again for the products having changes.",
+    )
+
+    @api.model
+    @tools.ormcache()
+    def _promise_ledger_active(self):
+        return bool(
+            self.sudo().search_count([("stock_promised_qty_engine", "=", "ledger")])
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        companies = super().create(vals_list)
+        # the new companies may use the ledger
+        self.clear_caches()
+        return companies
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "stock_promised_qty_engine" in vals:
+            # The ledger is not maintained while no company uses it, start
+            # from scratch whenever the engine changes.
+            self.env["stock.move.promise.ledger"].sudo()._purge()
+            self.clear_caches()
+        return res
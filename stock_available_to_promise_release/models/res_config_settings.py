@@ -16,3 +16,7 @@ class ResConfigSettings(models.TransientModel):
         related="company_id.stock_release_max_prep_time",
         readonly=False,
     )
+    stock_promised_qty_engine = fields.Selection(
+        related="company_id.stock_promised_qty_engine",
+        readonly=False,
+    )
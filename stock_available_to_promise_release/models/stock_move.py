@@ -57,18 +57,24 @@ class StockMove(models.Model):
 
     @api.depends("need_release", "rule_id", "rule_id.available_to_promise_defer_pull")
     def _compute_unrelease_allowed(self):
-        for move in self:
-            unrelease_allowed = move._is_unreleaseable()
-            if unrelease_allowed:
-                iterator = move._get_chained_moves_iterator("move_orig_ids")
-                next(iterator)  # skip the current move
-                for origin_moves in iterator:
-                    unrelease_allowed = (
-                        not origin_moves._in_progress_for_unrelease()
-                        and move._is_unrelease_allowed_on_origin_moves(origin_moves)
-                    )
-                    if not unrelease_allowed:
-                        break
+        moves = self.filtered(lambda m: m._is_unreleaseable())
+        (self - moves).unrelease_allowed = False
+        graph = moves._get_chained_moves_graph("move_orig_ids")
+        allowed_on_origins = {}
+        for move in moves:
+            unrelease_allowed = True
+            iterator = move._get_chained_moves_iterator("move_orig_ids", graph=graph)
+            next(iterator)  # skip the current move
+            for origin_moves in iterator:
+                # merged moves share their origins, check them once
+                key = (move.product_id.uom_id, origin_moves)
+                if key not in allowed_on_origins:
+                    allowed_on_origins[key] = not (
+                        origin_moves._in_progress_for_unrelease()
+                    ) and move._is_unrelease_allowed_on_origin_moves(origin_moves)
+                unrelease_allowed = allowed_on_origins[key]
+                if not unrelease_allowed:
+                    break
             move.unrelease_allowed = unrelease_allowed
 
     def _is_unreleaseable(self):
@@ -145,6 +151,7 @@ class StockMove(models.Model):
 
     def _unrelease_not_allowed_error(self):
         message = _("You are not allowed to unrelease those deliveries:\n")
+        graph = self._get_chained_moves_graph("move_orig_ids")
 
         for picking, forbidden_moves_by_picking in groupby(
             self, lambda m: m.picking_id
@@ -155,7 +162,9 @@ class StockMove(models.Model):
             message += "\n\t- %s" % picking.name
             forbidden_origin_pickings = self.picking_id.browse()
             for move in forbidden_moves_by_picking:
-                iterator = move._get_chained_moves_iterator("move_orig_ids")
+                iterator = move._get_chained_moves_iterator(
+                    "move_orig_ids", graph=graph
+                )
                 next(iterator)  # skip the current move
                 for origin_moves in iterator:
                     for origin_picking, moves_by_picking in groupby(
@@ -232,12 +241,11 @@ class StockMove(models.Model):
         return "m.need_release IS false OR m.need_release IS null"
 
     def _previous_promised_qty_sql_lateral_where(self, warehouse):
-        locations = warehouse.view_location_id
+        moves_where, params = self._previous_promised_qty_sql_ordered_where(warehouse)
         sql = """
                 m.id != move.id
                 AND m.product_id = move.product_id
-                AND p_type.code = 'outgoing'
-                AND loc.parent_path LIKE ANY(%(location_paths)s)
+                AND {moves_where}
                 AND (
                     {moves_before}
                     OR (
@@ -245,18 +253,11 @@ class StockMove(models.Model):
                         AND ({moves_no_release})
                     )
                 )
-                AND m.state IN (
-                    'waiting', 'confirmed', 'partially_available', 'assigned'
-                )
         """.format(
+            moves_where=moves_where,
             moves_before=self._previous_promised_qty_sql_moves_before(),
             moves_no_release=self._previous_promised_qty_sql_moves_no_release(),
         )
-        params = {
-            "location_paths": [
-                "{}%".format(location.parent_path) for location in locations
-            ]
-        }
         horizon_date = self._promise_reservation_horizon_date()
         if horizon_date:
             sql += (
@@ -282,13 +283,260 @@ class StockMove(models.Model):
         )
         return query, params
 
+    def _previous_promised_qty_sql_order_by(self):
+        """Order of the groups of moves competing for the same product
+
+        Follows :meth:`_previous_promised_qty_sql_moves_before`: released
+        moves first, then by priority and priority date. Return a list of
+        (expression, direction). The order of the moves inside a group is
+        the one of :meth:`_previous_promised_qty_sql_moves_before` too, see
+        :meth:`_previous_promised_qty_sql_ordered`.
+        """
+        return [
+            ("COALESCE(m.need_release, False)", "ASC"),
+            ("m.priority", "DESC"),
+            ("m.date_priority", "ASC"),
+        ]
+
+    def _previous_promised_qty_sql_ordered_qty(self):
+        """Quantity of a move added to the running sum of promised qty"""
+        horizon_date = self._promise_reservation_horizon_date()
+        if not horizon_date:
+            return "m.product_qty", {}
+        sql = """
+            CASE
+                WHEN m.need_release IS true AND m.date <= %(horizon)s
+                    OR m.need_release IS false
+                THEN m.product_qty
+                ELSE 0.0
+            END
+        """
+        return sql, {"horizon": horizon_date}
+
+    def _previous_promised_qty_sql_ordered_where(self, warehouse):
+        """Conditions on the moves competing for the same product
+
+        Shared by all the engines: used in
+        :meth:`_previous_promised_qty_sql_lateral_where` and for the moves
+        taking part in the running sums. Conditions not comparing a move with
+        its predecessors must be added here.
+        """
+        sql = """
+                p_type.code = 'outgoing'
+                AND loc.parent_path LIKE ANY(%(location_paths)s)
+                AND m.state IN (
+                    'waiting', 'confirmed', 'partially_available', 'assigned'
+                )
+        """
+        params = {
+            "location_paths": [
+                "{}%".format(location.parent_path)
+                for location in warehouse.view_location_id
+            ]
+        }
+        return sql, params
+
+    def _previous_promised_qty_sql_ordered(self, warehouse, product_ids):
+        """Promised qty of all the open moves of the products in a warehouse
+
+        Return a query selecting (move id, product id, previous promised qty)
+        for every open outgoing move of the products, computed at once with
+        running sums over the moves.
+
+        The moves before a move are the ones of the groups ordered before its
+        group by :meth:`_previous_promised_qty_sql_order_by`, and in its own
+        group (same priority and priority date), as in
+        :meth:`_previous_promised_qty_sql_moves_before`: the moves of the same
+        picking type with a lower id and the moves of other picking types
+        with a higher id. The latter are the moves of the group with a
+        higher id minus the ones of the same picking type.
+        """
+        qty, params = self._previous_promised_qty_sql_ordered_qty()
+        where, where_params = self._previous_promised_qty_sql_ordered_where(warehouse)
+        params.update(where_params)
+        order_by = self._previous_promised_qty_sql_order_by()
+        query = """
+            SELECT m.id,
+                   m.product_id,
+                   COALESCE(SUM({qty}) OVER groups_before, 0.0)
+                   + COALESCE(SUM({qty}) OVER same_type_before, 0.0)
+                   + COALESCE(SUM({qty}) OVER group_after, 0.0)
+                   - COALESCE(SUM({qty}) OVER same_type_after, 0.0)
+            FROM stock_move m
+            INNER JOIN stock_location loc
+            ON loc.id = m.location_id
+            INNER JOIN stock_picking_type p_type
+            ON m.picking_type_id = p_type.id
+            WHERE
+                m.product_id IN %(product_ids)s
+                AND {where}
+            WINDOW
+                groups_before AS (
+                    PARTITION BY m.product_id
+                    ORDER BY {order_by}
+                    RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                    EXCLUDE GROUP
+                ),
+                same_type_before AS (
+                    PARTITION BY m.product_id, {group_by}, m.picking_type_id
+                    ORDER BY m.id
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                ),
+                group_after AS (
+                    PARTITION BY m.product_id, {group_by}
+                    ORDER BY m.id
+                    ROWS BETWEEN 1 FOLLOWING AND UNBOUNDED FOLLOWING
+                ),
+                same_type_after AS (
+                    PARTITION BY m.product_id, {group_by}, m.picking_type_id
+                    ORDER BY m.id
+                    ROWS BETWEEN 1 FOLLOWING AND UNBOUNDED FOLLOWING
+                )
+        """.format(
+            qty=qty,
+            order_by=", ".join(f"{expr} {direction}" for expr, direction in order_by),
+            group_by=", ".join(expr for expr, __ in order_by),
+            where=where,
+        )
+        params["product_ids"] = tuple(product_ids)
+        return query, params
+
+    def _previous_promised_qty_sql_window(self, warehouse):
+        """Lookup query for the promised qty of the moves with a running sum
+
+        Alternative to :meth:`_previous_promised_qty_sql`: the moves of each
+        product are ordered once instead of joining every move with all its
+        predecessors.
+        """
+        query, params = self._previous_promised_qty_sql_ordered(
+            warehouse, self.product_id.ids
+        )
+        query = """
+            SELECT ordered.id, ordered.previous_qty
+            FROM ({query}) ordered (id, product_id, previous_qty)
+            WHERE ordered.id IN %(move_ids)s
+        """.format(
+            query=query
+        )
+        params["move_ids"] = tuple(self.ids)
+        return query, params
+
     def _group_by_warehouse(self):
         return groupby(self, lambda m: m.warehouse_id)
 
-    def _get_previous_promised_qties(self):
+    def _previous_promised_qty_sql_pairwise_hooks(self):
+        """Methods comparing a move with the moves before it
+
+        Only the per move query calls them, the running sums reproduce the
+        conditions of this module.
+        """
+        return (
+            "_previous_promised_qty_sql_main_query",
+            "_previous_promised_qty_sql_lateral_where",
+            "_previous_promised_qty_sql_moves_before",
+            "_previous_promised_qty_sql_moves_before_matches",
+            "_previous_promised_qty_sql_moves_no_release",
+        )
+
+    def _previous_promised_qty_running_sum_supported(self):
+        """Whether the running sums give the result of the per move query
+
+        False when an extension overrides one of
+        :meth:`_previous_promised_qty_sql_pairwise_hooks`: its conditions
+        would be ignored by the running sums, so the per move query is used
+        whatever the engine. An extension reproducing its conditions in the
+        running sums can return True.
+        """
+        cls = type(self)
+        return all(
+            getattr(cls, hook) is getattr(StockMove, hook)
+            for hook in self._previous_promised_qty_sql_pairwise_hooks()
+        )
+
+    def _previous_promised_qty_engine(self, bulk=False):
+        """Engine computing the previous promised quantities
+
+        ``bulk`` is set when the quantities of all the moves needing a release
+        are computed at once: the per move query being quadratic on the
+        number of moves, the running sums are used instead.
+        """
+        engine = self.env.company.sudo().stock_promised_qty_engine
+        if not self._previous_promised_qty_running_sum_supported():
+            return "lateral"
+        if engine == "lateral" and bulk:
+            return "window"
+        return engine
+
+    def _get_previous_promised_qties(self, bulk=False):
         self.env.flush_all()
         self.env["stock.move.line"].flush_model(["move_id", "reserved_qty"])
         self.env["stock.location"].flush_model(["parent_path"])
+        engine = self._previous_promised_qty_engine(bulk=bulk)
+        if engine == "ledger":
+            return self._get_previous_promised_qties_ledger()
+        if engine == "window":
+            return self._get_previous_promised_qties_window()
+        return self._get_previous_promised_qties_lateral()
+
+    def _get_previous_promised_qties_window(self):
+        previous_promised_qties = {}
+        missing_moves = self.browse()
+        for warehouse, moves in self._group_by_warehouse():
+            moves = self.browse().union(*moves)
+            if not warehouse:
+                for move in moves:
+                    previous_promised_qties[move.id] = 0
+                continue
+            query, params = moves._previous_promised_qty_sql_window(warehouse)
+            self.env.cr.execute(query, params)
+            rows = dict(self.env.cr.fetchall())
+            previous_promised_qties.update(rows)
+            # moves not open or outside of the warehouse are not ordered
+            missing_moves |= moves.filtered(lambda m: m.id not in rows)
+        if missing_moves:
+            previous_promised_qties.update(
+                missing_moves._get_previous_promised_qties_lateral()
+            )
+        return previous_promised_qties
+
+    def _get_previous_promised_qties_ledger(self):
+        ledger = self.env["stock.move.promise.ledger"].sudo()
+        previous_promised_qties = {}
+        missing_moves = self.browse()
+        for warehouse, moves in self._group_by_warehouse():
+            moves = self.browse().union(*moves)
+            if not warehouse:
+                for move in moves:
+                    previous_promised_qties[move.id] = 0
+                continue
+            rows = ledger._get_previous_promised_qties(warehouse, moves)
+            previous_promised_qties.update(rows)
+            missing_moves |= moves.filtered(lambda m: m.id not in rows)
+        if missing_moves:
+            previous_promised_qties.update(
+                missing_moves._get_previous_promised_qties_lateral()
+            )
+        return previous_promised_qties
+
+    def _verify_previous_promised_qties_ledger(self):
+        """Compare the ledger with the lateral query
+
+        Return the moves for which both disagree as a dict
+        {move id: (ledger qty, lateral qty)}.
+        """
+        self.env.flush_all()
+        ledger_qties = self._get_previous_promised_qties_ledger()
+        lateral_qties = self._get_previous_promised_qties_lateral()
+        differences = {}
+        for move in self:
+            ledger_qty = ledger_qties.get(move.id, 0.0)
+            lateral_qty = lateral_qties.get(move.id, 0.0)
+            rounding = move.product_id.uom_id.rounding
+            if float_compare(ledger_qty, lateral_qty, precision_rounding=rounding):
+                differences[move.id] = (ledger_qty, lateral_qty)
+        return differences
+
+    def _get_previous_promised_qties_lateral(self):
         previous_promised_qties = {}
         for warehouse, moves in self._group_by_warehouse():
             moves = self.browse().union(*moves)
@@ -376,9 +624,198 @@ class StockMove(models.Model):
     def _search_release_ready(self, operator, value):
         if operator != "=":
             raise UserError(_("Unsupported operator %s") % (operator,))
-        moves = self.search([("ordered_available_to_promise_uom_qty", ">", 0)])
-        moves = moves.filtered(lambda m: m.release_ready)
-        return [("id", "in", moves.ids)]
+        move_ids, __ = self._get_release_ready_ids()
+        return [("id", "in" if value else "not in", move_ids)]
+
+    def _release_ready_sql_moves_where(self):
+        """Conditions for a move needing a release to be ready
+
+        Counterpart of :meth:`_is_release_ready` and
+        :meth:`_should_compute_ordered_available_to_promise`, the quantity
+        being checked apart.
+        """
+        return """
+            m.state != 'draft'
+            AND picking_type.code = 'outgoing'
+            AND tmpl.type != 'consu'
+            AND loc.usage NOT IN ('supplier', 'customer', 'inventory', 'production')
+            AND loc.scrap_location IS NOT true
+            AND NOT (loc.usage = 'transit' AND loc.company_id IS NULL)
+        """
+
+    def _release_ready_sql_available(self, warehouse, product_ids):
+        """Query selecting (product id, quantity) available in the warehouse
+
+        Uses the same quants as :meth:`_get_ordered_available_to_promise_by_warehouse`
+        so extensions of ``_get_available_to_promise_domain`` apply to both.
+        """
+        quant_model = self.env["stock.quant"]
+        domain = expression.AND(
+            [
+                [("product_id", "in", list(product_ids))],
+                warehouse.view_location_id._get_available_to_promise_domain(),
+            ]
+        )
+        query = quant_model._where_calc(domain)
+        quant_model._apply_ir_rules(query, "read")
+        quants_query, quants_params = query.select(
+            '"stock_quant".product_id', '"stock_quant".quantity'
+        )
+        # inlined in queries using named parameters
+        query = """
+            SELECT product_id, SUM(quantity) AS quantity
+            FROM ({quants_query}) quants
+            GROUP BY product_id
+        """.format(
+            quants_query=quants_query
+        )
+        return self.env.cr.mogrify(query, quants_params).decode()
+
+    def _release_ready_sql(self, warehouse, previous_qties):
+        """Lookup query for the release ready moves of a warehouse
+
+        Select one row per picking having moves to release with:
+        (picking id, release policy, all moves ready, ids of the ready moves).
+        The ordered available to promise quantity of every move is evaluated
+        in the database from the quants of the warehouse and the previous
+        promised quantities of the moves, ``previous_qties`` being
+        {move id: previous promised qty} as computed by the configured engine.
+        """
+        product_ids = self.browse(list(previous_qties)).product_id.ids
+        query = """
+            WITH previous (id, previous_qty) AS (
+                SELECT *
+                FROM unnest(%(move_ids)s::integer[], %(previous_qties)s::float[])
+            ),
+            available AS (
+                {available_query}
+            ),
+            candidates AS (
+                SELECT
+                    m.id,
+                    m.picking_id,
+                    COALESCE(picking.release_policy, 'direct') AS release_policy,
+                    COALESCE(
+                        {moves_where}
+                        AND CASE
+                            WHEN picking.release_policy = 'one'
+                            THEN ROUND((
+                                (COALESCE(available.quantity, 0.0)
+                                 - previous.previous_qty - m.product_qty)
+                                / uom.rounding
+                            )::numeric) >= 0
+                            ELSE ROUND((
+                                (COALESCE(available.quantity, 0.0)
+                                 - previous.previous_qty)
+                                / uom.rounding
+                            )::numeric) > 0
+                        END,
+                        false
+                    ) AS ready
+                FROM stock_move m
+                INNER JOIN previous
+                ON previous.id = m.id
+                INNER JOIN stock_location loc
+                ON loc.id = m.location_id
+                INNER JOIN product_product product
+                ON product.id = m.product_id
+                INNER JOIN product_template tmpl
+                ON tmpl.id = product.product_tmpl_id
+                INNER JOIN uom_uom uom
+                ON uom.id = tmpl.uom_id
+                LEFT JOIN stock_picking picking
+                ON picking.id = m.picking_id
+                LEFT JOIN stock_picking_type picking_type
+                ON picking_type.id = m.picking_type_id
+                LEFT JOIN available
+                ON available.product_id = m.product_id
+                WHERE m.need_release IS true
+                AND m.warehouse_id = %(warehouse_id)s
+            ),
+            not_candidates AS (
+                -- moves needing a release but not evaluated (draft, ...)
+                SELECT m.picking_id
+                FROM stock_move m
+                WHERE m.need_release IS true
+                AND m.state NOT IN ('done', 'cancel')
+                AND m.warehouse_id = %(warehouse_id)s
+                AND m.picking_id IN (SELECT picking_id FROM candidates)
+                AND m.id NOT IN (SELECT id FROM candidates)
+            )
+            SELECT
+                c.picking_id,
+                c.release_policy,
+                bool_and(c.ready) AND c.picking_id NOT IN (
+                    SELECT picking_id FROM not_candidates
+                ),
+                array_agg(c.id) FILTER (WHERE c.ready)
+            FROM candidates c
+            GROUP BY c.picking_id, c.release_policy
+        """.format(
+            available_query=self._release_ready_sql_available(warehouse, product_ids),
+            moves_where=self._release_ready_sql_moves_where(),
+        )
+        params = {
+            "move_ids": list(previous_qties),
+            "previous_qties": list(previous_qties.values()),
+            "warehouse_id": warehouse.id,
+        }
+        return query, params
+
+    @api.model
+    def _get_release_ready_ids(self):
+        """Return the ids of the release ready moves and pickings
+
+        Evaluated in the database for all the moves needing a release, with
+        one query per warehouse. The previous promised quantities of the
+        moves are computed with the running sums, or the ledger when it is
+        the engine configured on the company.
+        """
+        self.env.flush_all()
+        self.env.cr.execute(
+            """
+            SELECT warehouse_id, array_agg(id)
+            FROM stock_move
+            WHERE need_release IS true
+            AND state NOT IN ('draft', 'done', 'cancel')
+            AND warehouse_id IS NOT NULL
+            GROUP BY warehouse_id
+            """
+        )
+        moves_by_warehouse = self.env.cr.fetchall()
+        pickings = {}
+        move_ids_without_picking = []
+        for warehouse_id, move_ids in moves_by_warehouse:
+            warehouse = self.env["stock.warehouse"].browse(warehouse_id)
+            previous_qties = self.browse(move_ids)._get_previous_promised_qties(
+                bulk=True
+            )
+            query, params = self._release_ready_sql(
+                warehouse,
+                {move_id: previous_qties.get(move_id, 0.0) for move_id in move_ids},
+            )
+            self.env.cr.execute(query, params)
+            for picking_id, policy, all_ready, ready_ids in self.env.cr.fetchall():
+                if not picking_id:
+                    move_ids_without_picking += ready_ids or []
+                    continue
+                values = pickings.setdefault(
+                    picking_id,
+                    {"policy": policy, "all_ready": True, "ready_ids": []},
+                )
+                values["all_ready"] = values["all_ready"] and bool(all_ready)
+                values["ready_ids"] += ready_ids or []
+        move_ids = list(move_ids_without_picking)
+        picking_ids = []
+        for picking_id, values in pickings.items():
+            if values["policy"] == "one":
+                if not values["all_ready"]:
+                    continue
+            elif not values["ready_ids"]:
+                continue
+            picking_ids.append(picking_id)
+            move_ids += values["ready_ids"]
+        return move_ids, picking_ids
 
     def _get_ordered_available_to_promise_by_warehouse(self, warehouse):
         res = {}
@@ -625,7 +1062,10 @@ class StockMove(models.Model):
 
     def _after_release_assign_moves(self):
         move_ids = []
-        for origin_moves in self._get_chained_moves_iterator("move_orig_ids"):
+        graph = self._get_chained_moves_graph("move_orig_ids")
+        for origin_moves in self._get_chained_moves_iterator(
+            "move_orig_ids", graph=graph
+        ):
             move_ids += origin_moves.filtered(
                 lambda m: m.state not in ("cancel", "done")
             ).ids
@@ -660,18 +1100,76 @@ class StockMove(models.Model):
             self.picking_id.write({"priority": max(priorities)})
         return res
 
-    def _get_chained_moves_iterator(self, chain_field):
+    def _get_chained_moves_graph(self, chain_field):
+        """Load the whole chains of the moves in one query
+
+        Return a dict {move id: ids of the moves linked by ``chain_field``}
+        for all the moves of the chains, to give to
+        :meth:`_get_chained_moves_iterator`. The chains must not be modified
+        while the graph is in use.
+        """
+        if chain_field == "move_orig_ids":
+            from_column, to_column = "move_dest_id", "move_orig_id"
+        elif chain_field == "move_dest_ids":
+            from_column, to_column = "move_orig_id", "move_dest_id"
+        else:
+            raise ValueError(f"Unsupported chain field {chain_field}")
+        graph = {move_id: set() for move_id in self.ids}
+        if not self.ids:
+            return graph
+        self.flush_model(["move_orig_ids", "move_dest_ids"])
+        # UNION (not UNION ALL) stops on cycles
+        query = """
+            WITH RECURSIVE chain (from_id, to_id) AS (
+                SELECT rel.{from_column}, rel.{to_column}
+                FROM stock_move_move_rel rel
+                WHERE rel.{from_column} IN %s
+
+                UNION
+
+                SELECT rel.{from_column}, rel.{to_column}
+                FROM stock_move_move_rel rel
+                INNER JOIN chain
+                ON chain.to_id = rel.{from_column}
+            )
+            SELECT from_id, to_id FROM chain
+        """.format(
+            from_column=from_column, to_column=to_column
+        )
+        self.env.cr.execute(query, (tuple(self.ids),))
+        for from_id, to_id in self.env.cr.fetchall():
+            graph.setdefault(from_id, set()).add(to_id)
+            graph.setdefault(to_id, set())
+        return graph
+
+    def _get_chained_moves_iterator(self, chain_field, graph=None):
         """Return an iterator on the moves of the chain.
 
         The iterator returns the moves in the order of the chain.
         The loop into the iterator is the current moves.
+
+        When a graph from :meth:`_get_chained_moves_graph` is given, the
+        chain is read from it instead of the database, and all the moves of
+        the graph are prefetched together.
         """
         moves = self
         visited_moves = self.browse()
+        if graph is not None:
+            prefetch_ids = list(graph)
+            moves = moves.with_prefetch(prefetch_ids)
         while moves:
             yield moves
             visited_moves += moves
-            moves = moves.mapped(chain_field) - visited_moves
+            if graph is None:
+                moves = moves.mapped(chain_field) - visited_moves
+                continue
+            next_ids = set()
+            for move_id in moves.ids:
+                next_ids.update(graph.get(move_id, ()))
+            moves = (
+                self.browse(sorted(next_ids)).with_prefetch(prefetch_ids)
+                - visited_moves
+            )
 
     def unrelease(self, safe_unrelease=False):
         """Unrelease unreleasable moves
@@ -766,7 +1264,56 @@ class StockMove(models.Model):
         values["release_policy"] = values["move_type"]
         return values
 
+    def _promise_ledger_fields(self):
+        """Fields of the moves impacting the promised quantities"""
+        return {
+            "product_id",
+            "product_uom_qty",
+            "product_uom",
+            "state",
+            "need_release",
+            "priority",
+            "date_priority",
+            "date",
+            "location_id",
+            "picking_type_id",
+            "picking_id",
+        }
+
+    def _promise_ledger_partitions(self):
+        return {
+            (move.location_id.warehouse_id.id, move.product_id.id)
+            for move in self
+            if move.location_id.warehouse_id and move.picking_type_id.code == "outgoing"
+        }
+
+    def _promise_ledger_record_changes(self, partitions=None):
+        if partitions is None:
+            partitions = self._promise_ledger_partitions()
+        self.env["stock.move.promise.ledger.change"].sudo()._record(partitions)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        moves = super().create(vals_list)
+        if self.env["res.company"]._promise_ledger_active():
+            moves._promise_ledger_record_changes()
+        return moves
+
+    def unlink(self):
+        partitions = set()
+        if self.env["res.company"]._promise_ledger_active():
+            partitions = self._promise_ledger_partitions()
+        res = super().unlink()
+        self._promise_ledger_record_changes(partitions)
+        return res
+
     def write(self, vals):
+        ledger_partitions = None
+        if (
+            not self._promise_ledger_fields().isdisjoint(vals)
+            and self.env["res.company"]._promise_ledger_active()
+        ):
+            ledger_partitions = self._promise_ledger_partitions()
         released_moves = self.browse()
         if self.env.context.get("in_merge_mode") and "product_uom_qty" in vals:
             # when a move is merged, we need to unrelease it if the quantity
@@ -780,6 +1327,10 @@ class StockMove(models.Model):
             # merge releaseable moves with partially done quantity.
             released_moves.unrelease(safe_unrelease=False)
         ret = super().write(vals)
+        if ledger_partitions is not None:
+            self._promise_ledger_record_changes(
+                ledger_partitions | self._promise_ledger_partitions()
+            )
         if released_moves:
             released_moves.release_available_to_promise()
         return ret
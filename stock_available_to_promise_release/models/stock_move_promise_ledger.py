@@ -0,0 +1,251 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html).
+
+from odoo import fields, models
+
+
+class StockMovePromiseLedger(models.Model):
+    """Persisted promised quantities of the outgoing moves
+
+    Holds one line per open outgoing move with the quantity promised to the
+    moves ordered before it in the same warehouse. The lines of a
+    (warehouse, product) partition are rebuilt at once, with a running sum,
+    when a move of the partition has changed since the last build (see
+    ``stock.move.promise.ledger.change``) or when the reservation horizon
+    has moved. Reading the promised quantity of a move is then an indexed
+    lookup.
+    """
+
+    _name = "stock.move.promise.ledger"
+    _description = "Stock Move Promised Quantity Ledger"
+    _log_access = False
+
+    move_id = fields.Many2one(
+        "stock.move", required=True, index=True, ondelete="cascade", readonly=True
+    )
+    warehouse_id = fields.Many2one(
+        "stock.warehouse", required=True, ondelete="cascade", readonly=True
+    )
+    product_id = fields.Many2one(
+        "product.product", required=True, ondelete="cascade", readonly=True
+    )
+    previous_promised_qty = fields.Float(
+        digits="Product Unit of Measure", readonly=True
+    )
+    horizon_date = fields.Datetime(readonly=True)
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS stock_move_promise_ledger_partition_index
+            ON stock_move_promise_ledger (warehouse_id, product_id)
+            """
+        )
+
+    def _get_previous_promised_qties(self, warehouse, moves):
+        """Return the promised quantities of the moves found in the ledger
+
+        The partitions of the moves' products are rebuilt first if they are
+        outdated. Moves missing from the result (not open, or located outside
+        of the warehouse) must be computed by another mean.
+        """
+        product_ids = self._refresh_partitions(warehouse, moves.product_id.ids)
+        if not product_ids:
+            return {}
+        self.env.cr.execute(
+            """
+            SELECT move_id, previous_promised_qty
+            FROM stock_move_promise_ledger
+            WHERE warehouse_id = %s
+            AND product_id IN %s
+            AND move_id IN %s
+            """,
+            (warehouse.id, tuple(product_ids), tuple(moves.ids)),
+        )
+        return dict(self.env.cr.fetchall())
+
+    def _refresh_partitions(self, warehouse, product_ids):
+        """Rebuild the outdated partitions of the products
+
+        Return the ids of the products having an up-to-date partition. A
+        partition being rebuilt by a concurrent transaction is skipped rather
+        than waited for.
+        """
+        cr = self.env.cr
+        horizon_date = self.env["stock.move"]._promise_reservation_horizon_date()
+        cr.execute(
+            """
+            SELECT p.product_id
+            FROM unnest(%(product_ids)s) AS p(product_id)
+            WHERE EXISTS (
+                SELECT 1
+                FROM stock_move_promise_ledger ledger
+                WHERE ledger.warehouse_id = %(warehouse_id)s
+                AND ledger.product_id = p.product_id
+                AND ledger.horizon_date IS NOT DISTINCT FROM %(horizon_date)s
+            )
+            AND NOT EXISTS (
+                SELECT 1
+                FROM stock_move_promise_ledger_change change
+                WHERE change.warehouse_id = %(warehouse_id)s
+                AND change.product_id = p.product_id
+            )
+            """,
+            {
+                "product_ids": list(product_ids),
+                "warehouse_id": warehouse.id,
+                "horizon_date": horizon_date,
+            },
+        )
+        fresh_product_ids = {row[0] for row in cr.fetchall()}
+        stale_product_ids = list(set(product_ids) - fresh_product_ids)
+        if not stale_product_ids:
+            return fresh_product_ids
+        cr.execute(
+            """
+            SELECT p.product_id
+            FROM unnest(%s) AS p(product_id)
+            WHERE pg_try_advisory_xact_lock(
+                hashtext('stock_move_promise_ledger,' || %s), p.product_id
+            )
+            """,
+            (stale_product_ids, warehouse.id),
+        )
+        locked_product_ids = [row[0] for row in cr.fetchall()]
+        if locked_product_ids:
+            self._rebuild_partitions(warehouse, locked_product_ids, horizon_date)
+        return fresh_product_ids | set(locked_product_ids)
+
+    def _rebuild_partitions(self, warehouse, product_ids, horizon_date):
+        cr = self.env.cr
+        params = (warehouse.id, tuple(product_ids))
+        # Only the changes visible in our snapshot are consumed, a change
+        # committed meanwhile stays and triggers the next rebuild.
+        cr.execute(
+            """
+            DELETE FROM stock_move_promise_ledger_change
+            WHERE warehouse_id = %s AND product_id IN %s
+            """,
+            params,
+        )
+        cr.execute(
+            """
+            DELETE FROM stock_move_promise_ledger
+            WHERE warehouse_id = %s AND product_id IN %s
+            """,
+            params,
+        )
+        move_model = self.env["stock.move"]
+        query, query_params = move_model._previous_promised_qty_sql_ordered(
+            warehouse, product_ids
+        )
+        query_params.update(
+            {"ledger_warehouse_id": warehouse.id, "ledger_horizon_date": horizon_date}
+        )
+        cr.execute(
+            """
+            INSERT INTO stock_move_promise_ledger (
+                move_id, product_id, previous_promised_qty,
+                warehouse_id, horizon_date
+            )
+            SELECT ordered.*,
+                   %(ledger_warehouse_id)s,
+                   %(ledger_horizon_date)s::timestamp
+            FROM ({query}) ordered
+            """.format(
+                query=query
+            ),
+            query_params,
+        )
+        self.invalidate_model()
+
+    def _purge(self):
+        """Drop the whole ledger, it is rebuilt on demand"""
+        self.env.cr.execute("DELETE FROM stock_move_promise_ledger_change")
+        self.env.cr.execute("DELETE FROM stock_move_promise_ledger")
+        self.invalidate_model()
+
+
+class StockMovePromiseLedgerChange(models.Model):
+    """Changes on outgoing moves not yet applied to the ledger
+
+    Rows are only ever inserted by the transactions updating moves, so that
+    concurrent writes on moves of the same product do not contend on a
+    shared row. They are consumed when the partition is rebuilt, or purged
+    by a cron with the lines of their partition for the partitions which are
+    not read.
+    """
+
+    _name = "stock.move.promise.ledger.change"
+    _description = "Stock Move Promised Quantity Ledger Change"
+    _log_access = False
+
+    warehouse_id = fields.Many2one(
+        "stock.warehouse", required=True, ondelete="cascade", readonly=True
+    )
+    product_id = fields.Many2one(
+        "product.product", required=True, ondelete="cascade", readonly=True
+    )
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS stock_move_promise_ledger_change_partition_index
+            ON stock_move_promise_ledger_change (warehouse_id, product_id)
+            """
+        )
+
+    def _record(self, partitions):
+        """Flag the (warehouse id, product id) partitions as outdated"""
+        if not partitions:
+            return
+        warehouse_ids, product_ids = zip(*partitions)
+        self.env.cr.execute(
+            """
+            INSERT INTO stock_move_promise_ledger_change (warehouse_id, product_id)
+            SELECT * FROM unnest(%s::int[], %s::int[])
+            """,
+            (list(warehouse_ids), list(product_ids)),
+        )
+
+    def _cron_purge(self):
+        """Drop the changes and the lines of their outdated partitions
+
+        The partitions are rebuilt on demand when they have no lines. The
+        partitions being rebuilt by a concurrent transaction are skipped.
+        """
+        cr = self.env.cr
+        cr.execute(
+            """
+            SELECT DISTINCT warehouse_id, product_id
+            FROM stock_move_promise_ledger_change
+            """
+        )
+        partitions = cr.fetchall()
+        if not partitions:
+            return
+        warehouse_ids, product_ids = zip(*partitions)
+        cr.execute(
+            """
+            WITH partitions AS (
+                SELECT p.warehouse_id, p.product_id
+                FROM unnest(%s::int[], %s::int[]) AS p(warehouse_id, product_id)
+                WHERE pg_try_advisory_xact_lock(
+                    hashtext('stock_move_promise_ledger,' || p.warehouse_id),
+                    p.product_id
+                )
+            ),
+            purged_lines AS (
+                DELETE FROM stock_move_promise_ledger ledger
+                USING partitions
+                WHERE ledger.warehouse_id = partitions.warehouse_id
+                AND ledger.product_id = partitions.product_id
+            )
+            DELETE FROM stock_move_promise_ledger_change change
+            USING partitions
+            WHERE change.warehouse_id = partitions.warehouse_id
+            AND change.product_id = partitions.product_id
+            """,
+            (list(warehouse_ids), list(product_ids)),
+        )
+        self.env["stock.move.promise.ledger"].invalidate_model()
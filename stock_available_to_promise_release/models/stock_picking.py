@@ -24,6 +24,8 @@ class StockPicking(models.Model):
     date_priority = fields.Datetime(
         string="Priority Date",
         compute="_compute_date_priority",
+        store=True,
+        index=True,
         help="Date/time used to sort moves to deliver first. "
         "Used to calculate the ordered available to promise.",
     )
@@ -98,16 +100,8 @@ class StockPicking(models.Model):
     def _search_release_ready(self, operator, value):
         if operator != "=":
             raise exceptions.UserError(_("Unsupported operator %s") % (operator,))
-        # if we search moves with a promise qty > 0, we restrict
-        # the number of moves / pickings to filter afterwards
-        moves = self.env["stock.move"].search(
-            [("ordered_available_to_promise_uom_qty", ">", 0)]
-        )
-        # computed field depends on ordered_available_to_promise_qty that has no
-        # depends set, invalidate cache before reading
-        moves.picking_id.invalidate_recordset(["release_ready"])
-        pickings = moves.picking_id.filtered("release_ready")
-        return [("id", "in", pickings.ids)]
+        __, picking_ids = self.env["stock.move"]._get_release_ready_ids()
+        return [("id", "in" if value else "not in", picking_ids)]
 
     @api.depends("move_ids.date_priority")
     def _compute_date_priority(self):
@@ -119,6 +113,13 @@ class StockPicking(models.Model):
             ]
             picking.date_priority = min(dates) if dates else False
 
+    def write(self, vals):
+        res = super().write(vals)
+        # the priority of the moves is computed from the picking
+        if "priority" in vals and self.env["res.company"]._promise_ledger_active():
+            self.move_ids._promise_ledger_record_changes()
+        return res
+
     def release_available_to_promise(self):
         # When the stock.picking form view is opened through the "Deliveries"
         # button of a sale order, the latter sets values in the context such as
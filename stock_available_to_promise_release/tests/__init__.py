@@ -4,3 +4,6 @@ from . import test_unrelease
 from . import test_unrelease_2steps
 from . import test_unrelease_3steps
 from . import test_unrelease_merged_moves
+from . import test_promise_ledger
+from . import test_promise_window
+from . import test_promised_qty_benchmark
@@ -0,0 +1,76 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html).
+
+from datetime import datetime
+
+from . import test_reservation
+
+
+class TestPromiseLedger(test_reservation.TestAvailableToPromiseRelease):
+    """Run the reservation tests with the promised qty read from the ledger"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env.company.stock_promised_qty_engine = "ledger"
+
+    def _ledger_lines(self, moves):
+        return self.env["stock.move.promise.ledger"].search(
+            [("move_id", "in", moves.ids)]
+        )
+
+    def test_ledger_matches_lateral_query(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        pickings = self.env["stock.picking"].union(*self._create_pickings())
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        moves = pickings.move_ids
+        pickings[0].move_ids.release_available_to_promise()
+        pickings[3].priority = "1"
+        self.assertFalse(moves._verify_previous_promised_qties_ledger())
+        self.assertEqual(len(self._ledger_lines(moves)), len(moves))
+
+    def test_ledger_partition_rebuilt_on_change(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        picking, picking2, picking3, __, __ = self._create_pickings()
+        self.assertEqual(picking3.move_ids.previous_promised_qty, 8)
+        line = self._ledger_lines(picking3.move_ids)
+        self.assertEqual(line.previous_promised_qty, 8)
+        change_model = self.env["stock.move.promise.ledger.change"]
+        self.assertFalse(change_model.search([("product_id", "=", self.product1.id)]))
+        picking2.move_ids.date_priority = datetime(2019, 9, 5, 0, 0)
+        self.assertTrue(change_model.search([("product_id", "=", self.product1.id)]))
+        self.env["stock.move"].invalidate_model(fnames=["previous_promised_qty"])
+        self.assertEqual(picking3.move_ids.previous_promised_qty, 5)
+        self.assertEqual(picking2.move_ids.previous_promised_qty, 25)
+        self.assertFalse(change_model.search([("product_id", "=", self.product1.id)]))
+
+    def test_ledger_changes_purged(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        __, picking2, picking3, __, __ = self._create_pickings()
+        self.assertEqual(picking3.move_ids.previous_promised_qty, 8)
+        change_model = self.env["stock.move.promise.ledger.change"]
+        picking2.move_ids.date_priority = datetime(2019, 9, 5, 0, 0)
+        change_model._cron_purge()
+        self.assertFalse(change_model.search([("product_id", "=", self.product1.id)]))
+        self.assertFalse(self._ledger_lines(picking3.move_ids))
+        # the partition is rebuilt when it is read
+        self.env["stock.move"].invalidate_model(fnames=["previous_promised_qty"])
+        self.assertEqual(picking3.move_ids.previous_promised_qty, 5)
+        self.assertTrue(self._ledger_lines(picking3.move_ids))
+
+    def test_ledger_matches_lateral_query_several_picking_types(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        pickings = self._create_pickings_several_picking_types()
+        moves = pickings.move_ids
+        self.assertFalse(moves._verify_previous_promised_qties_ledger())
+        # same picking type: lower ids first, other picking types: higher ids
+        self.assertEqual(moves.mapped("previous_promised_qty"), [9, 4, 11, 3])
+
+    def test_ledger_active_on_company_create(self):
+        self.env.company.stock_promised_qty_engine = "lateral"
+        company_model = self.env["res.company"]
+        self.assertFalse(company_model._promise_ledger_active())
+        company_model.create(
+            {"name": "Ledger Company", "stock_promised_qty_engine": "ledger"}
+        )
+        self.assertTrue(company_model._promise_ledger_active())
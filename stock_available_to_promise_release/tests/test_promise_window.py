@@ -0,0 +1,55 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html).
+
+from unittest import mock
+
+from . import test_reservation
+
+
+class TestPromiseWindow(test_reservation.TestAvailableToPromiseRelease):
+    """Run the reservation tests with the running sum query"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env.company.stock_promised_qty_engine = "window"
+
+    def test_window_matches_lateral_query(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        pickings = self.env["stock.picking"].union(*self._create_pickings())
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        pickings[0].move_ids.release_available_to_promise()
+        pickings[3].priority = "1"
+        moves = pickings.move_ids
+        self.env.flush_all()
+        self.assertEqual(
+            moves._get_previous_promised_qties_window(),
+            moves._get_previous_promised_qties_lateral(),
+        )
+
+    def test_window_matches_lateral_query_several_picking_types(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        pickings = self._create_pickings_several_picking_types()
+        moves = pickings.move_ids
+        self.env.flush_all()
+        self.assertEqual(
+            moves._get_previous_promised_qties_window(),
+            moves._get_previous_promised_qties_lateral(),
+        )
+        self.assertEqual(moves.mapped("previous_promised_qty"), [9, 4, 11, 3])
+
+    def test_window_not_used_with_overridden_lateral_hooks(self):
+        move_model = self.env["stock.move"]
+        self.assertEqual(move_model._previous_promised_qty_engine(), "window")
+        with mock.patch.object(
+            type(move_model),
+            "_previous_promised_qty_sql_moves_no_release",
+            lambda self: "m.need_release IS false",
+        ):
+            self.assertEqual(move_model._previous_promised_qty_engine(), "lateral")
+
+    def test_window_used_for_all_moves_needing_release(self):
+        move_model = self.env["stock.move"]
+        self.env.company.stock_promised_qty_engine = "lateral"
+        self.assertEqual(move_model._previous_promised_qty_engine(), "lateral")
+        self.assertEqual(move_model._previous_promised_qty_engine(bulk=True), "window")
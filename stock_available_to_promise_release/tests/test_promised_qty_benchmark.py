@@ -0,0 +1,107 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html).
+
+import logging
+import time
+
+from odoo.tests import tagged
+
+from .common import PromiseReleaseCommonCase
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged("-standard", "promised_qty_benchmark")
+class TestPromisedQtyBenchmark(PromiseReleaseCommonCase):
+    """Compare the engines computing the previous promised quantities
+
+    Not part of the standard tests, run with
+    ``--test-tags promised_qty_benchmark``.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        cls.picking = cls._out_picking(
+            cls._create_picking_chain(cls.wh, [(cls.product1, 1)])
+        )
+        cls.template_move = cls.picking.move_ids
+        cls.out_type2 = cls.wh.out_type_id.copy({"name": "Delivery 2"})
+
+    def _duplicate_moves(self, count):
+        """Copy the delivery move in SQL, spread over 4 products
+
+        The moves are spread over 2 picking types and share their priority
+        date by 5, to cover the tie-break between picking types.
+        """
+        self.env.flush_all()
+        self.env.cr.execute(
+            """
+            INSERT INTO stock_move (
+                name, company_id, product_id, product_uom, product_uom_qty,
+                product_qty, location_id, location_dest_id, picking_type_id,
+                warehouse_id, procure_method, state, priority, need_release,
+                date, date_priority
+            )
+            SELECT
+                m.name, m.company_id, (%(product_ids)s)[1 + serie %% 4],
+                m.product_uom, 1 + serie %% 7, 1 + serie %% 7, m.location_id,
+                m.location_dest_id,
+                CASE WHEN serie %% 2 = 0
+                    THEN m.picking_type_id ELSE %(picking_type2_id)s
+                END,
+                m.warehouse_id,
+                m.procure_method, m.state, m.priority, serie %% 3 != 0,
+                m.date, m.date_priority + (serie / 5) * interval '1 second'
+            FROM stock_move m, generate_series(1, %(count)s) serie
+            WHERE m.id = %(move_id)s
+            RETURNING id
+            """,
+            {
+                "product_ids": [
+                    self.product1.id,
+                    self.product2.id,
+                    self.product3.id,
+                    self.product4.id,
+                ],
+                "picking_type2_id": self.out_type2.id,
+                "count": count,
+                "move_id": self.template_move.id,
+            },
+        )
+        return self.env["stock.move"].browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _benchmark(self, moves, method):
+        start = time.perf_counter()
+        result = getattr(moves, method)()
+        return result, time.perf_counter() - start
+
+    def _run_benchmark(self, count):
+        moves = self._duplicate_moves(count)
+        # compute the values for a page of moves spread over the backlog
+        moves = moves[:: max(count // 80, 1)]
+        lateral, lateral_time = self._benchmark(
+            moves, "_get_previous_promised_qties_lateral"
+        )
+        window, window_time = self._benchmark(
+            moves, "_get_previous_promised_qties_window"
+        )
+        _logger.info(
+            "Previous promised qty of %s moves out of %s: "
+            "lateral %.3fs, window %.3fs",
+            len(moves),
+            count,
+            lateral_time,
+            window_time,
+        )
+        self.assertEqual(lateral, window)
+
+    def test_benchmark_1k(self):
+        self._run_benchmark(1000)
+
+    def test_benchmark_10k(self):
+        self._run_benchmark(10000)
+
+    def test_benchmark_100k(self):
+        self._run_benchmark(100000)
@@ -80,6 +80,19 @@ class TestAvailableToPromiseRelease(PromiseReleaseCommonCase):
             self.assertEqual(pick.move_ids.reserved_availability, 0.0)
         return picking, picking2, picking3, picking4, picking5
 
+    def _create_pickings_several_picking_types(self):
+        """Pickings having the same priority date, in two picking types"""
+        out_type2 = self.wh.out_type_id.copy({"name": "Delivery 2"})
+        pickings = self.env["stock.picking"]
+        for qty in (5, 3, 4, 6):
+            pickings |= self._out_picking(
+                self._create_picking_chain(
+                    self.wh, [(self.product1, qty)], date=datetime(2019, 9, 2, 16, 0)
+                )
+            )
+        pickings[1::2].move_ids.picking_type_id = out_type2
+        return pickings
+
     def test_ordered_available_to_promise_value_base(self):
         self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
         picking, picking2, picking3, picking4, picking5 = self._create_pickings()
@@ -237,6 +250,46 @@ class TestAvailableToPromiseRelease(PromiseReleaseCommonCase):
         # because one of them is not available
         self.assertEqual(moves, expected_moves)
 
+    def test_release_ready_search_picking(self):
+        self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
+        picking = self._out_picking(
+            self._create_picking_chain(
+                self.wh,
+                [(self.product1, 5), (self.product2, 5)],
+                date=datetime(2019, 9, 2, 16, 0),
+                move_type="direct",
+            )
+        )
+        picking2 = self._out_picking(
+            self._create_picking_chain(
+                self.wh,
+                [(self.product1, 5), (self.product2, 5)],
+                date=datetime(2019, 9, 2, 16, 0),
+                move_type="one",
+            )
+        )
+        picking3 = self._out_picking(
+            self._create_picking_chain(
+                self.wh,
+                [(self.product2, 5)],
+                date=datetime(2019, 9, 2, 16, 0),
+                move_type="direct",
+            )
+        )
+        self._update_qty_in_location(self.loc_bin1, self.product1, 5.0)
+        self._update_qty_in_location(self.loc_bin1, self.product2, 15.0)
+        all_pickings = picking | picking2 | picking3
+        pickings = self.env["stock.picking"].search(
+            [("id", "in", all_pickings.ids), ("release_ready", "=", True)]
+        )
+        # picking2 with "one" is not ready as product1 is not available
+        self.assertEqual(pickings, picking | picking3)
+        self.assertEqual(pickings, all_pickings.filtered("release_ready"))
+        pickings = self.env["stock.picking"].search(
+            [("id", "in", all_pickings.ids), ("release_ready", "=", False)]
+        )
+        self.assertEqual(pickings, picking2)
+
     def test_ordered_available_to_promise_value_horizon1(self):
         self.wh.delivery_route_id.write({"available_to_promise_defer_pull": True})
         picking, picking2, picking3, picking4, picking5 = self._create_pickings()
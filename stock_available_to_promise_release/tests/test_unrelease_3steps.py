@@ -68,3 +68,24 @@ class TestAvailableToPromiseRelease3steps(PromiseReleaseCommonCase):
         # self.assertFalse(move_cancel.move_dest_ids)
         self.assertFalse(move_cancel.move_orig_ids)
         self.assertEqual(self.ship2.move_ids.move_orig_ids, self.pack2.move_ids)
+
+    def test_chained_moves_graph(self):
+        moves = self.ship1.move_ids | self.ship2.move_ids
+        graph = moves._get_chained_moves_graph("move_orig_ids")
+        for move in moves:
+            self.assertEqual(
+                list(move._get_chained_moves_iterator("move_orig_ids", graph=graph)),
+                list(move._get_chained_moves_iterator("move_orig_ids")),
+            )
+        self.assertEqual(
+            set(graph),
+            set((moves | self.pack1.move_ids | self.pack2.move_ids).ids)
+            | set(self.pick1.move_ids.ids),
+        )
+
+    def test_unrelease_allowed_batched(self):
+        moves = self.ship1.move_ids | self.ship2.move_ids
+        self.assertEqual(moves.mapped("unrelease_allowed"), [True, True])
+        self.pick1.printed = True
+        moves.invalidate_recordset(["unrelease_allowed"])
+        self.assertEqual(moves.mapped("unrelease_allowed"), [False, False])
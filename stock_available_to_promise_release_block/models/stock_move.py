@@ -30,6 +30,10 @@ class StockMove(models.Model):
             return super()._is_release_ready()
         return False
 
+    def _release_ready_sql_moves_where(self):
+        sql = super()._release_ready_sql_moves_where()
+        return sql + " AND m.release_blocked IS NOT true"
+
     def _blocked_on_backorder(self):
         """Hook that aims to be overridden."""
         return True
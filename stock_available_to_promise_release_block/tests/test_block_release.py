@@ -118,3 +118,18 @@ class TestBlockRelease(BlockReleaseCommon):
         # Backorder is not release ready and is automatically blocked
         self.assertFalse(backorder.release_ready)
         self.assertTrue(backorder.release_blocked)
+
+    def test_release_blocked_search(self):
+        picking = self._out_picking(
+            self._create_picking_chain(
+                self.wh,
+                [(self.product1, 3), (self.product2, 5)],
+            )
+        )
+        self._update_qty_in_location(self.loc_bin1, self.product1, 3.0)
+        self._update_qty_in_location(self.loc_bin1, self.product2, 5.0)
+        picking.move_ids[0].action_block_release()
+        moves = self.env["stock.move"].search(
+            [("id", "in", picking.move_ids.ids), ("release_ready", "=", True)]
+        )
+        self.assertEqual(moves, picking.move_ids[1])
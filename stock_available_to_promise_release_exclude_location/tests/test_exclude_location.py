@@ -41,3 +41,22 @@ class AlcPromiseReleaseImmediatelyExcludeTest(PromiseReleaseCommonCase):
         self.shipping.release_available_to_promise()
         new_picking = self._prev_picking(self.shipping) - self.picking
         self.assertFalse(new_picking)
+
+    def test_release_ready_search(self):
+        """The search excludes the same locations as the computed field"""
+        shipping = self._out_picking(
+            self._create_picking_chain(
+                self.wh, [(self.product1, 5)], date=datetime(2019, 9, 3, 16, 0)
+            )
+        )
+        self.assertFalse(shipping.release_ready)
+        self.assertFalse(
+            self.env["stock.picking"].search(
+                [("id", "=", shipping.id), ("release_ready", "=", True)]
+            )
+        )
+        self.assertFalse(
+            self.env["stock.move"].search(
+                [("id", "in", shipping.move_ids.ids), ("release_ready", "=", True)]
+            )
+        )
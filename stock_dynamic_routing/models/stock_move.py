@@ -7,6 +7,7 @@ from collections import OrderedDict, defaultdict, namedtuple
 from psycopg2 import sql
 
 from odoo import models
+from odoo.tools import float_compare
 
 
 class StockMove(models.Model):
@@ -70,8 +71,10 @@ class StockMove(models.Model):
     def _split_and_apply_routing(self):
         """Apply routing rules
 
-        * calls super()._action_assign() (in a savepoint) on moves not yet
-          available to compute the routing rules
+        * compute the routing rules from a preview of the reservation of the
+          moves, or for the moves which cannot be previewed (see
+          ``_routing_can_preview_reservation``), call super()._action_assign()
+          (in a savepoint) on them
         * split the moves if their move lines have different source or
           destination locations and need routing
         * apply the routing rules (pull and push)
@@ -80,19 +83,96 @@ class StockMove(models.Model):
         moves, the method has to return the moves in ``self`` so they are
         assigned.
         """
-        moves_routing = self._prepare_routing_pull()
+        preview_moves = self.filtered(lambda m: m._routing_can_preview_reservation())
+        # moves reserved in the savepoint come first: when they need no
+        # routing, their reservations are kept and the preview considers them.
+        # When they need routing, the savepoint is rolled back and they are
+        # reserved again once the routing is applied: the preview does not
+        # see these reservations, the previewed moves are routed from the
+        # goods available before them.
+        moves_routing = (self - preview_moves)._prepare_routing_pull()
+        preview_routing = preview_moves._routing_compute_rules_preview()
+        if self._routing_has_rules(preview_routing):
+            moves_routing.update(preview_routing)
+        # When we have no routing rules, _prepare_routing_pull already
+        # called _action_assign(), not returning these moves will prevent
+        # the caller of the method to call _action_assign() again on them
+        moves_to_assign = preview_moves.filtered(lambda m: m not in moves_routing)
         if not moves_routing:
-            # When we have no routing rules, _prepare_routing_pull already
-            # called _action_assign(), returning an empty recordset will
-            # prevent the caller of the method to call _action_assign() again
-            # on the same moves
-            return self.browse()
+            return moves_to_assign
         # apply the routing
         moves_with_routing_details = self._routing_splits(moves_routing)
         moves = self.browse(move.id for move in moves_with_routing_details)
         moves._apply_routing_rule_pull(moves_with_routing_details)
         moves._apply_routing_rule_push(moves_with_routing_details)
-        return moves
+        return moves | moves_to_assign
+
+    def _routing_has_rules(self, moves_routing):
+        return any(
+            details.rule for routing in moves_routing.values() for details in routing
+        )
+
+    def _routing_can_preview_reservation(self):
+        """Return whether the routing can be computed without reserving
+
+        The reservation of the move is then previewed by
+        ``_routing_preview_reservations``, which handles the plain reservation
+        of goods in stock, by product and not by package. Other moves are
+        reserved in a savepoint to compute their routing.
+        """
+        self.ensure_one()
+        return (
+            self.state == "confirmed"
+            and not self.move_line_ids
+            and not self.move_orig_ids
+            and not self.package_level_id
+            and self.procure_method == "make_to_stock"
+            and self.product_id.type == "product"
+            and not self.restrict_partner_id
+            and not self.location_id.should_bypass_reservation()
+        )
+
+    def _routing_preview_reservations(self):
+        """Return the reservations the moves would get, without reserving
+
+        The quants are taken in the order of the removal strategy, each move
+        taking the quantities left available by the previous moves.
+
+        Return a dictionary {move: ([(source location, destination location,
+        quantity)], unreserved quantity)}, in the product's unit of measure.
+        """
+        quant_model = self.env["stock.quant"]
+        quants_by_key = {}
+        taken_quantities = defaultdict(float)
+        reservations = {}
+        for move in self:
+            product = move.product_id
+            rounding = product.uom_id.rounding
+            key = (product, move.location_id)
+            if key not in quants_by_key:
+                quants_by_key[key] = quant_model._gather(product, move.location_id)
+            need = move.product_qty
+            lines = []
+            for quant in quants_by_key[key]:
+                if float_compare(need, 0, precision_rounding=rounding) <= 0:
+                    break
+                available = (
+                    quant.quantity - quant.reserved_quantity - taken_quantities[quant]
+                )
+                if float_compare(available, 0, precision_rounding=rounding) <= 0:
+                    continue
+                quantity = min(need, available)
+                taken_quantities[quant] += quantity
+                need -= quantity
+                destination = move.location_dest_id._get_putaway_strategy(
+                    product,
+                    quantity=quantity,
+                    package=quant.package_id,
+                    packaging=move.product_packaging_id,
+                )
+                lines.append((quant.location_id, destination, quantity))
+            reservations[move] = (lines, max(need, 0.0))
+        return reservations
 
     def _prepare_routing_pull(self):
         """Prepare pull routing rules for moves
@@ -110,7 +190,7 @@ class StockMove(models.Model):
         to split the moves.
         """
         if not self:
-            return self
+            return {}
 
         savepoint_name = uuid.uuid1().hex
         self.env.flush_all()
@@ -121,9 +201,7 @@ class StockMove(models.Model):
         super()._action_assign()
 
         moves_routing = self._routing_compute_rules()
-        if not any(
-            details.rule for routing in moves_routing.values() for details in routing
-        ):
+        if not self._routing_has_rules(moves_routing):
             # no routing to apply, so the reservations done by _action_assign
             # are valid and we can resolve to a normal flow
             self.env.flush_all()
@@ -144,42 +222,23 @@ class StockMove(models.Model):
     def _routing_compute_rules(self):
         """Compute routing pull rules
 
-        Called in a savepoint (_prepare_routing_pull).
+        Called in a savepoint (_prepare_routing_pull), on the reserved moves.
         Return a dictionary {move: {rule: reserved quantity}}. The rule for a quantity
         can be an empty recordset, which means no routing rule.
         """
-        move_routing_rules = self.env["stock.routing"]._routing_rule_for_move_ids(self)
-        moves_routing = {}
-        no_loc = self.env["stock.location"].browse()
+        reservations = {}
         for move in self:
             if move.state not in ("assigned", "partially_available"):
                 continue
-
-            # Group move lines per their rule, some may need an additional
-            # operations while others not. Store the number of products to
-            # take from each location, so we'll be able to split the move
-            # if needed.
-            routing_rules = move_routing_rules[move]
-            moves_routing[move] = {}
             # use product_qty and not product_uom_qty, because we'll use
             # this for the _split() and this method expect product_qty
             # units
-            for rule, move_lines in routing_rules.items():
-                if rule.method == "push":
-                    dests = defaultdict(lambda: 0.0)
-                    for line in move_lines:
-                        dests[line.location_dest_id] += line.reserved_qty
-                    for destination, qty in dests.items():
-                        moves_routing[move][
-                            self.RoutingDetails(rule, destination)
-                        ] = qty
-                else:
-                    moves_routing[move][self.RoutingDetails(rule, no_loc)] = sum(
-                        move_lines.mapped("reserved_qty")
-                    )
+            lines = [
+                (line.location_id, line.location_dest_id, line.reserved_qty)
+                for line in move.move_line_ids
+            ]
+            missing_reserved_quantity = 0.0
             if move.state == "partially_available":
-                # consider unreserved quantity as without routing, so it will
-                # be split if another part of the quantity need a routing
                 missing_reserved_uom_quantity = (
                     move.product_uom_qty - move.reserved_availability
                 )
@@ -189,6 +248,58 @@ class StockMove(models.Model):
                     # this matches what is done in StockMove._action_assign()
                     rounding_method="HALF-UP",
                 )
+            reservations[move] = (lines, missing_reserved_quantity)
+        return self._routing_compute_rules_for_reservations(reservations)
+
+    def _routing_compute_rules_preview(self):
+        """Compute routing pull rules from a preview of the reservation
+
+        Same as ``_routing_compute_rules``, without reserving the moves.
+        """
+        reservations = {
+            move: reservation
+            for move, reservation in self._routing_preview_reservations().items()
+            # the move would not be reserved at all
+            if reservation[0]
+        }
+        return self._routing_compute_rules_for_reservations(reservations)
+
+    def _routing_compute_rules_for_reservations(self, reservations):
+        """Compute routing pull rules from the reservations of moves
+
+        :param reservations: dict {move: ([(source location, destination
+                             location, quantity)], unreserved quantity)}
+        :return: dict {move: {rule: reserved quantity}}
+        """
+        requests = [
+            (move, location, destination)
+            for move, (lines, __) in reservations.items()
+            for location, destination, __ in lines
+        ]
+        rules = iter(self.env["stock.routing"]._resolve_routing_rules(requests))
+        moves_routing = {}
+        no_loc = self.env["stock.location"].browse()
+        for move, (lines, missing_reserved_quantity) in reservations.items():
+            # Group move lines per their rule, some may need an additional
+            # operations while others not. Store the number of products to
+            # take from each location, so we'll be able to split the move
+            # if needed.
+            moves_routing[move] = {}
+            for __, destination, quantity in lines:
+                rule = next(rules)
+                if rule.method == "push":
+                    routing_details = self.RoutingDetails(rule, destination)
+                else:
+                    routing_details = self.RoutingDetails(rule, no_loc)
+                moves_routing[move].setdefault(routing_details, 0.0)
+                moves_routing[move][routing_details] += quantity
+            rounding = move.product_id.uom_id.rounding
+            if (
+                float_compare(missing_reserved_quantity, 0, precision_rounding=rounding)
+                > 0
+            ):
+                # consider unreserved quantity as without routing, so it will
+                # be split if another part of the quantity need a routing
                 routing_details = self._no_routing_details()
                 moves_routing[move].setdefault(routing_details, 0)
                 moves_routing[move][routing_details] += missing_reserved_quantity
@@ -3,7 +3,6 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
 
 from collections import defaultdict
-from functools import lru_cache
 
 from odoo import _, api, fields, models
 from odoo.osv import expression
@@ -169,40 +168,123 @@ class StockRouting(models.Model):
         )
         return expression.AND([[("routing_id.active", "=", True)], domain])
 
+    def _get_routing_rules_index(self, location_trees_by_picking_type):
+        """Return the candidate rules of the operation types
+
+        The rules are searched with the domain of
+        :meth:`_get_find_rule_for_location_domain` for each operation type.
+
+        :param location_trees_by_picking_type: dict {picking type: (pull
+                 location trees, push location trees)}
+        :return: dict {(picking type id, method, location id): rules}, the rules
+                 being sorted in the order they are tried
+        """
+        rule_model = self.env["stock.routing.rule"]
+        index = defaultdict(rule_model.browse)
+        for picking_type, trees in location_trees_by_picking_type.items():
+            pull_location_tree, push_location_tree = trees
+            domain = self._get_find_rule_for_location_domain(
+                pull_location_tree, push_location_tree, picking_type
+            )
+            for rule in rule_model.search(domain):
+                key = (picking_type.id, rule.method, rule.routing_location_id.id)
+                index[key] |= rule
+        return index
+
     # TODO would be nice to add a constraint that would prevent to
     # have a pull + a push routing that would apply on the same move
-    def _find_rule_for_location(self, move, src_location, dest_location):
-        """Return the routing rule for a source or destination location
+    def _resolve_routing_rules(self, requests):
+        """Return the routing rules for source and destination locations
 
-        It searches first a routing pull rule based on the source location,
-        and if nothing is found, it searches for a routing push rule based
-        on the destination location.
+        For each request, it searches first a routing pull rule based on the
+        source location, and if nothing is found, it searches for a routing
+        push rule based on the destination location.
 
         The source/destination locations are not an exact match: it looks
         for the location or a parent.
-        """
-        pull_location_tree = src_location._location_parent_tree()
-        push_location_tree = dest_location._location_parent_tree()
-        picking_type = move.picking_type_id or move.picking_id.picking_type_id
-        candidate_rules_domain = self._get_find_rule_for_location_domain(
-            pull_location_tree, push_location_tree, picking_type
-        )
-        candidate_rules = self.env["stock.routing.rule"].search(candidate_rules_domain)
-        candidate_rules.sorted(lambda r: (r.routing_id.sequence, r.sequence))
-        rule = self._get_location_routing_rule(
-            move, pull_location_tree, candidate_rules
-        )
-        if rule:
-            return rule
 
-        rule = self._get_location_routing_rule(
-            move, push_location_tree, candidate_rules
-        )
-        if rule:
-            return rule
+        All the requests are resolved at once: the rules are loaded once and
+        indexed by operation type, method and location, then the domain of a
+        rule is evaluated with one search for all the moves it is tried on.
 
+        :param requests: list of tuples (move, source location, destination
+                         location)
+        :return: list of routing rules (empty when no rule applies), in the
+                 order of the requests
+        """
         empty_rule = self.env["stock.routing.rule"].browse()
-        return empty_rule
+        empty_location = self.env["stock.location"].browse()
+        picking_types = [
+            move.picking_type_id or move.picking_id.picking_type_id
+            for move, __, __ in requests
+        ]
+        location_trees = {}
+
+        def location_tree(location):
+            if location not in location_trees:
+                location_trees[location] = location._location_parent_tree()
+            return location_trees[location]
+
+        trees_by_picking_type = defaultdict(lambda: [empty_location] * 2)
+        for (__, src_location, dest_location), picking_type in zip(
+            requests, picking_types
+        ):
+            trees = trees_by_picking_type[picking_type]
+            trees[0] |= location_tree(src_location)
+            trees[1] |= location_tree(dest_location)
+        index = self._get_routing_rules_index(trees_by_picking_type)
+
+        # for each request, the rules in the order they are tried
+        candidates = []
+        for (__, src_location, dest_location), picking_type in zip(
+            requests, picking_types
+        ):
+            request_candidates = []
+            for method, location in (("pull", src_location), ("push", dest_location)):
+                # the first location is the current move line's source or dest
+                # location, then we climb up the tree of locations
+                for location_id in location_tree(location).ids:
+                    key = (picking_type.id, method, location_id)
+                    request_candidates.extend(index.get(key, empty_rule))
+            candidates.append(request_candidates)
+
+        # try the first candidate rule of every request, then the next one
+        # for the requests without valid rule, and so on
+        results = [empty_rule] * len(requests)
+        positions = [0] * len(requests)
+        checked_move_ids = defaultdict(set)
+        valid_move_ids = defaultdict(set)
+        pending = [i for i, rules in enumerate(candidates) if rules]
+        while pending:
+            move_ids_to_check = defaultdict(set)
+            for i in pending:
+                rule = candidates[i][positions[i]]
+                move = requests[i][0]
+                if move.id not in checked_move_ids[rule]:
+                    move_ids_to_check[rule].add(move.id)
+            for rule, move_ids in move_ids_to_check.items():
+                moves = self.env["stock.move"].browse(move_ids)
+                valid_move_ids[rule].update(rule._get_valid_moves(moves).ids)
+                checked_move_ids[rule].update(move_ids)
+            next_pending = []
+            for i in pending:
+                rule = candidates[i][positions[i]]
+                if requests[i][0].id in valid_move_ids[rule]:
+                    results[i] = rule
+                    continue
+                positions[i] += 1
+                if positions[i] < len(candidates[i]):
+                    next_pending.append(i)
+            pending = next_pending
+        return results
+
+    def _find_rule_for_location(self, move, src_location, dest_location):
+        """Return the routing rule for a source or destination location
+
+        See ``_resolve_routing_rules``, which should be used to find the rules
+        of several moves.
+        """
+        return self._resolve_routing_rules([(move, src_location, dest_location)])[0]
 
     def _routing_rule_for_move_ids(self, moves):
         """Return a routing rule for move lines
@@ -213,20 +295,18 @@ class StockRouting(models.Model):
         :param move: recordset of the move
         :return: dict {move: {rule: move_ids}}
         """
-        # ensure the cache is clean
-        self.__cached_is_rule_valid_for_move.cache_clear()
-
         result = {
             move: defaultdict(self.env["stock.move.line"].browse) for move in moves
         }
-        for move_line in moves.mapped("move_line_ids"):
-            rule = self._find_rule_for_location(
-                move_line.move_id, move_line.location_id, move_line.location_dest_id
-            )
+        move_lines = moves.mapped("move_line_ids")
+        rules = self._resolve_routing_rules(
+            [
+                (move_line.move_id, move_line.location_id, move_line.location_dest_id)
+                for move_line in move_lines
+            ]
+        )
+        for move_line, rule in zip(move_lines, rules):
             result[move_line.move_id][rule] |= move_line
-
-        # free memory used for the cache
-        self.__cached_is_rule_valid_for_move.cache_clear()
         return result
 
     def _routing_rule_for_moves(self, moves):
@@ -238,47 +318,7 @@ class StockRouting(models.Model):
         :param move: recordset of the move
         :return: dict {move: rule}}
         """
-        # ensure the cache is clean
-        self.__cached_is_rule_valid_for_move.cache_clear()
-
-        result = {}
-        for move in moves:
-            rule = self._find_rule_for_location(
-                move, move.location_id, move.location_dest_id
-            )
-            result[move] = rule
-
-        # free memory used for the cache
-        self.__cached_is_rule_valid_for_move.cache_clear()
-        return result
-
-    # Do not use ormcache, which would invalidate cache of other workers every
-    # time we clear it. We only need a local cache used for the duration of the
-    # execution of
-    @lru_cache()
-    def __cached_is_rule_valid_for_move(self, rule, move):
-        """To be used only by _routing_rule_for_move(_line)s
-
-        The method _routing_rule_for_move(_line)s reset the cache at beginning.
-        Cache the result so inside _routing_rule_for_move(_line)s, we compute it
-        only once for a move and a rule (if we have several move lines).
-
-        This method is part of the internal machinery of the algorithm to
-        find rules. It exists so we can have a local cache during the time of a
-        transaction, and is not meant to be overriden in any way.
-
-        If you wish to customize the validity of a rule, you should extend
-        ``StockRoutingRule._is_valid_for_moves()``
-        """
-        return rule._is_valid_for_moves(move)
-
-    def _get_location_routing_rule(self, move, location_tree, rules):
-        # the first location is the current move line's source or dest
-        # location, then we climb up the tree of locations
-        for loc in location_tree:
-            # find the first valid rule
-            for rule in rules.filtered(lambda r: r.routing_location_id == loc):
-                if not self.__cached_is_rule_valid_for_move(rule, move):
-                    continue
-                return rule
-        return self.env["stock.routing.rule"].browse()
+        rules = self._resolve_routing_rules(
+            [(move, move.location_id, move.location_dest_id) for move in moves]
+        )
+        return dict(zip(moves, rules))
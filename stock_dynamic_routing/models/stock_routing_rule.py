@@ -105,6 +105,18 @@ class StockRoutingRule(models.Model):
         domain = safe_eval(self.rule_domain)
         return self._eval_routing_domain(moves, domain)
 
+    def _get_valid_moves(self, moves):
+        """Return the moves the rule is valid for
+
+        The moves are checked at once, with ``_is_valid_for_moves``.
+        """
+        self.ensure_one()
+        valid = self._is_valid_for_moves(moves)
+        if isinstance(valid, models.BaseModel) and valid._name == "stock.move":
+            return valid & moves
+        # the rule itself, or a boolean, when the rule is valid for all the moves
+        return moves if valid else moves.browse()
+
     def _eval_routing_domain(self, moves, domain):
         if not domain:
             return self
@@ -1,5 +1,7 @@
 # Copyright 2019 Camptocamp (https://www.camptocamp.com)
 
+from unittest import mock
+
 from odoo.tests import common
 
 
@@ -639,6 +641,35 @@ class TestRoutingPull(TestRoutingPullCommon):
         self.assert_src_highbay(routing_move)
         self.assert_dest_handover(routing_move)
 
+    def test_routing_reservation_preview(self):
+        pick_picking, __ = self._create_pick_ship(self.wh, [(self.product1, 10)])
+        move_a = pick_picking.move_ids
+        self._update_product_qty_in_location(self.location_hb_1_2, move_a.product_id, 8)
+        move_model = type(move_a)
+        with mock.patch.object(
+            move_model,
+            "_prepare_routing_pull",
+            autospec=True,
+            side_effect=move_model._prepare_routing_pull,
+        ) as prepare_routing_pull:
+            pick_picking.action_assign()
+        # the routing is computed from the preview, no reservation is done
+        # in a savepoint
+        for call in prepare_routing_pull.call_args_list:
+            self.assertFalse(call.args[0])
+        routing_move = (move_a.move_dest_ids.move_orig_ids - move_a).move_orig_ids
+        self.assertRecordValues(
+            routing_move,
+            [
+                {
+                    "picking_type_id": self.pick_type_routing_op.id,
+                    "product_qty": 8,
+                    "state": "assigned",
+                }
+            ],
+        )
+        self.assert_src_highbay_1_2(routing_move.move_line_ids)
+
     def test_change_dest_move_source(self):
         # Change the picking type destination so the move goes to a location
         # which is a parent destination of the routing destination (move will
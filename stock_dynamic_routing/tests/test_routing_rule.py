@@ -1,5 +1,7 @@
 # Copyright 2019 Camptocamp (https://www.camptocamp.com)
 
+from unittest import mock
+
 from odoo.tests import common
 
 
@@ -190,3 +192,90 @@ class TestRoutingRule(common.TransactionCase):
 
     def test_find_push_picking_type(self):
         self._test_find_picking_type(self.suppliers_loc, self.location_shelf, "push")
+
+    def test_find_rule_domain_hook(self):
+        pick_type = self._create_picking_type(
+            "A", self.location_shelf, self.customer_loc
+        )
+        routing = self.env["stock.routing"].create(
+            {"location_id": self.location_shelf.id, "picking_type_id": pick_type.id}
+        )
+        rule = self.env["stock.routing.rule"].create(
+            {
+                "method": "pull",
+                "routing_id": routing.id,
+                "picking_type_id": pick_type.id,
+            }
+        )
+        move = self._create_stock_move(self.product, 10, pick_type)
+        routing_model = self.env["stock.routing"]
+        domain_method = type(routing_model)._get_find_rule_for_location_domain
+        with mock.patch.object(
+            type(routing_model),
+            "_get_find_rule_for_location_domain",
+            autospec=True,
+            side_effect=domain_method,
+        ) as get_domain:
+            found_rule = routing_model._find_rule_for_location(
+                move, self.location_shelf, self.customer_loc
+            )
+        self.assertEqual(found_rule, rule)
+        get_domain.assert_called_once()
+        # the candidate rules are the ones of the domain
+        with mock.patch.object(
+            type(routing_model),
+            "_get_find_rule_for_location_domain",
+            return_value=[("id", "!=", rule.id)],
+        ):
+            found_rule = routing_model._find_rule_for_location(
+                move, self.location_shelf, self.customer_loc
+            )
+        self.assertFalse(found_rule)
+
+    def test_routing_rule_for_moves_batch(self):
+        pick_type = self._create_picking_type(
+            "A", self.location_shelf, self.customer_loc
+        )
+        product2 = self.env["product.product"].create(
+            {"name": "Product 2", "type": "product"}
+        )
+        routing = self.env["stock.routing"].create(
+            {"location_id": self.location_shelf.id, "picking_type_id": pick_type.id}
+        )
+        rule_model = self.env["stock.routing.rule"]
+        rule_product2 = rule_model.create(
+            {
+                "method": "pull",
+                "routing_id": routing.id,
+                "picking_type_id": pick_type.id,
+                "sequence": 1,
+                "rule_domain": [("product_id", "=", product2.id)],
+            }
+        )
+        rule = rule_model.create(
+            {
+                "method": "pull",
+                "routing_id": routing.id,
+                "picking_type_id": pick_type.id,
+                "sequence": 10,
+            }
+        )
+        moves = (
+            self._create_stock_move(self.product, 10, pick_type)
+            | self._create_stock_move(product2, 10, pick_type)
+            | self._create_stock_move(self.product, 5, pick_type)
+            | self._create_stock_move(product2, 5, pick_type)
+        )
+        with mock.patch.object(
+            type(rule_model),
+            "_get_valid_moves",
+            autospec=True,
+            side_effect=type(rule_model)._get_valid_moves,
+        ) as get_valid_moves:
+            result = self.env["stock.routing"]._routing_rule_for_moves(moves)
+        self.assertEqual(
+            [result[move] for move in moves],
+            [rule, rule_product2, rule, rule_product2],
+        )
+        # the rules are checked once for all the moves
+        self.assertEqual(get_valid_moves.call_count, 2)
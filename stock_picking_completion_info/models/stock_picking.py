@@ -2,6 +2,9 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
 from odoo import api, fields, models
 
+# the fields of the moves linking the pickings to the moves they depend on
+COMPLETION_INFO_GRAPH_FIELDS = {"picking_id", "move_dest_ids", "move_orig_ids"}
+
 
 class PickingType(models.Model):
 
@@ -36,10 +39,13 @@ class StockPicking(models.Model):
     )
 
     @api.depends(
+        "state",
         "picking_type_id.display_completion_info",
-        "move_ids.common_dest_move_ids.state",
+        "move_ids.state",
+        "move_ids.move_dest_ids",
     )
     def _compute_completion_info(self):
+        counts = self._get_completion_info_counts()
         for picking in self:
             if (
                 picking.state == "draft"
@@ -49,38 +55,98 @@ class StockPicking(models.Model):
                 continue
             # Depending moves are all the origin moves linked to the
             # destination pickings' moves
-            depending_moves = picking.move_ids.mapped("common_dest_move_ids")
+            depending_count, undone_count, own_count, other_undone_count = counts.get(
+                picking.id, (0, 0, 0, 0)
+            )
             # If all the depending moves are done or canceled then next picking
             # is ready to be processed
-            if picking.state == "done" and all(
-                m.state in ("done", "cancel") for m in depending_moves
-            ):
+            if picking.state == "done" and not undone_count:
                 picking.completion_info = "next_picking_ready"
                 continue
             # If all the depending moves are the moves on the actual picking
             # then it's a full order and next picking is ready to be processed
-            if depending_moves == picking.move_ids:
+            if own_count == depending_count == len(picking.move_ids):
                 picking.completion_info = "full_order_picking"
                 continue
             # If there aren't any depending move from another picking that is
             # not done, then actual picking is the last to process
-            other_depending_moves = (depending_moves - picking.move_ids).filtered(
-                lambda m: m.state not in ("done", "cancel")
-            )
-            if not other_depending_moves:
+            if not other_undone_count:
                 picking.completion_info = "last_picking"
                 continue
             picking.completion_info = "no"
 
+    def _get_completion_info_counts(self):
+        """Count the depending moves of the pickings in one query
+
+        The depending moves of a picking are the origin moves of the moves of
+        its destination pickings (see ``common_dest_move_ids``).
+
+        Return {picking id: (number of depending moves, number of depending
+        moves not done, number of depending moves in the picking, number of
+        depending moves not done in other pickings)}
+        """
+        picking_ids = [id_ for id_ in self.ids if id_]
+        if not picking_ids:
+            return {}
+        self.env["stock.move"].flush_model(
+            ["picking_id", "state", "move_dest_ids", "move_orig_ids"]
+        )
+        self.env.cr.execute(
+            """
+            WITH dest_pickings AS (
+                SELECT DISTINCT move.picking_id, dest.picking_id AS dest_picking_id
+                FROM stock_move move
+                JOIN stock_move_move_rel rel ON rel.move_orig_id = move.id
+                JOIN stock_move dest ON dest.id = rel.move_dest_id
+                WHERE move.picking_id = ANY(%s)
+                AND dest.picking_id IS NOT NULL
+            ),
+            depending_moves AS (
+                SELECT DISTINCT dest_pickings.picking_id, rel.move_orig_id AS move_id
+                FROM dest_pickings
+                JOIN stock_move dest
+                ON dest.picking_id = dest_pickings.dest_picking_id
+                JOIN stock_move_move_rel rel ON rel.move_dest_id = dest.id
+            )
+            SELECT
+                depending_moves.picking_id,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE move.state NOT IN ('done', 'cancel')),
+                COUNT(*) FILTER (WHERE move.picking_id = depending_moves.picking_id),
+                COUNT(*) FILTER (
+                    WHERE move.picking_id IS DISTINCT FROM depending_moves.picking_id
+                    AND move.state NOT IN ('done', 'cancel')
+                )
+            FROM depending_moves
+            JOIN stock_move move ON move.id = depending_moves.move_id
+            GROUP BY depending_moves.picking_id
+            """,
+            (picking_ids,),
+        )
+        return {row[0]: row[1:] for row in self.env.cr.fetchall()}
+
 
 class StockMove(models.Model):
 
     _inherit = "stock.move"
 
     def write(self, vals):
+        graph_changed = not COMPLETION_INFO_GRAPH_FIELDS.isdisjoint(vals)
+        if graph_changed:
+            self._invalidate_completion_info()
         super().write(vals)
-        if "state" in vals:
-            # invalidate cache, the api.depends do not allow to find all
-            # the conditions to invalidate the field
-            self.env["stock.picking"].invalidate_model(fnames=["completion_info"])
+        if graph_changed or "state" in vals:
+            # the api.depends do not allow to find the pickings depending on
+            # these moves through their destination pickings
+            self._invalidate_completion_info()
         return True
+
+    def _invalidate_completion_info(self):
+        """Invalidate the completion info of the pickings depending on the moves
+
+        They are the pickings of the moves and the pickings having moves going
+        to the same destination pickings.
+        """
+        dest_pickings = self.move_dest_ids.picking_id
+        pickings = self.picking_id | dest_pickings.move_ids.move_orig_ids.picking_id
+        pickings.invalidate_recordset(["completion_info"])
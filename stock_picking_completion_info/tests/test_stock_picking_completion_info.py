@@ -277,3 +277,42 @@ class TestStockPickingCompletionInfo(TransactionCase):
         self.assertEqual(pick_backorder.state, "done")
         self.assertEqual(pick_order.completion_info, "next_picking_ready")
         self.assertEqual(pick_backorder.completion_info, "next_picking_ready")
+
+    def test_completion_info_invalidation(self):
+        """Only the pickings depending on the changed moves are invalidated."""
+        self._init_inventory()
+        field = self.env["stock.picking"]._fields["completion_info"]
+        ship_order, pack_order, pick_order = self._create_pickings()
+        other_ship_order, other_pack_order, other_pick_order = self._create_pickings()
+        pack_move = self._create_move(
+            pack_order,
+            self.product_1,
+            move_dest=self._create_move(ship_order, self.product_1),
+        )
+        pick_move = self._create_move(
+            pick_order,
+            self.product_1,
+            state="confirmed",
+            procure_method="make_to_stock",
+            move_dest=pack_move,
+        )
+        other_pack_move = self._create_move(
+            other_pack_order,
+            self.product_2,
+            move_dest=self._create_move(other_ship_order, self.product_2),
+        )
+        other_pick_move = self._create_move(
+            other_pick_order,
+            self.product_2,
+            state="confirmed",
+            procure_method="make_to_stock",
+            move_dest=other_pack_move,
+        )
+        self.assertEqual(pick_order.completion_info, "full_order_picking")
+        self.assertEqual(other_pick_order.completion_info, "full_order_picking")
+        other_pick_move.state = "assigned"
+        self.assertTrue(self.env.cache.contains(pick_order, field))
+        self.assertFalse(self.env.cache.contains(other_pick_order, field))
+        pick_move.state = "assigned"
+        self.assertFalse(self.env.cache.contains(pick_order, field))
+        self.assertEqual(pick_order.completion_info, "full_order_picking")
@@ -19,6 +19,7 @@
     "data": [
         "views/res_partner.xml",
         "views/stock_release_channel_views.xml",
+        "views/stock_release_pipeline_views.xml",
         "views/stock_picking_views.xml",
         "views/res_config_settings.xml",
         "data/queue_job_data.xml",
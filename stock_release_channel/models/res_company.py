@@ -12,7 +12,18 @@ class ResCompany(models.Model):
         help="In release channels dashboard, add link to last done picking "
         "and show transfer date",
     )
+    release_channel_dashboard_snapshot = fields.Boolean(
+        string="Channels dashboard - Use snapshots",
+        help="The release channels dashboard displays the values computed "
+        "periodically by a scheduled action instead of computing them when "
+        "it is opened.",
+    )
     recompute_channel_on_pickings_at_release = fields.Boolean(
         help="When releasing a transfer, recompute channel",
         default=True,
     )
+    release_pipeline_chunk_size = fields.Integer(
+        help="When more transfers than this number are released at once, "
+        "they are split in chunks of this size released by parallel jobs, "
+        "each one in its own transaction. 0 releases them at once.",
+    )
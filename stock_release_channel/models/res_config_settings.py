@@ -11,7 +11,15 @@ class ResConfigSettings(models.TransientModel):
         related="company_id.release_channel_show_last_picking_done",
         readonly=False,
     )
+    release_channel_dashboard_snapshot = fields.Boolean(
+        related="company_id.release_channel_dashboard_snapshot",
+        readonly=False,
+    )
     recompute_channel_on_pickings_at_release = fields.Boolean(
         related="company_id.recompute_channel_on_pickings_at_release",
         readonly=False,
     )
+    release_pipeline_chunk_size = fields.Integer(
+        related="company_id.release_pipeline_chunk_size",
+        readonly=False,
+    )
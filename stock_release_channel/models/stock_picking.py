@@ -1,11 +1,18 @@
 # Copyright 2020 Camptocamp
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
 
+from collections import Counter
+
 from odoo import _, exceptions, fields, models
 from odoo.osv import expression
+from odoo.tools import split_every
 
 from odoo.addons.queue_job.job import identity_exact
 
+# transfers assigned by each job of the nightly assignment, an error on a
+# transfer only rolls back its chunk
+ASSIGN_RELEASE_CHANNEL_CHUNK_SIZE = 200
+
 
 class StockPicking(models.Model):
     _inherit = "stock.picking"
@@ -52,14 +59,10 @@ class StockPicking(models.Model):
             ).assign_release_channel()
 
     def assign_release_channel(self):
-        messages = ""
-        for pick in self:
-            result = self.env["stock.release.channel"].assign_release_channel(pick)
-            if result:
-                messages += result + "\n"
-        return messages
+        messages = self.env["stock.release.channel"].assign_release_channel_bulk(self)
+        return "".join(message + "\n" for message in messages)
 
-    def release_available_to_promise(self):
+    def _check_release_forbidden(self):
         for record in self:
             channel = record.release_channel_id
             if channel.release_forbidden:
@@ -70,8 +73,47 @@ class StockPicking(models.Model):
                     )
                     % channel.name
                 )
+
+    def release_available_to_promise(self):
+        self._check_release_forbidden()
         return super().release_available_to_promise()
 
+    def release_available_to_promise_pipeline(self):
+        """Release the transfers, in background jobs when there are many
+
+        When the transfers exceed the release pipeline chunk size of the
+        company, they are released in chunks by a ``stock.release.pipeline``,
+        which is returned. Otherwise they are released right away and an
+        empty pipeline is returned.
+        """
+        self._check_release_forbidden()
+        pipeline = self.env["stock.release.pipeline"]
+        chunk_size = self.env.company.release_pipeline_chunk_size
+        if chunk_size and len(self) > chunk_size:
+            return pipeline._create_for_pickings(self, chunk_size)
+        self.release_available_to_promise()
+        return pipeline
+
+    def _release_pipeline_chunk_key(self):
+        """Key grouping the transfers released by the same pipeline job
+
+        Transfers of the same warehouse and product category likely reserve
+        the same quants, releasing them together avoids jobs waiting on each
+        other's locks. The category of a transfer is the one of most of its
+        moves, the lowest id being taken on a tie so the key does not depend
+        on the order of the moves.
+        """
+        self.ensure_one()
+        move_counts = Counter(
+            move.product_id.categ_id.id
+            for move in self.move_ids
+            if move.product_id.categ_id
+        )
+        category_id = 0
+        if move_counts:
+            category_id = min(move_counts, key=lambda c: (-move_counts[c], c))
+        return (self.picking_type_id.warehouse_id.id or 0, category_id)
+
     def _create_backorder(self):
         backorders = super()._create_backorder()
         backorders._delay_assign_release_channel()
@@ -81,7 +123,13 @@ class StockPicking(models.Model):
         need_release = self.env["stock.picking"].search(
             [("need_release", "=", True)],
         )
-        need_release._delay_assign_release_channel()
+        for picking_ids in split_every(
+            ASSIGN_RELEASE_CHANNEL_CHUNK_SIZE, need_release.ids, list
+        ):
+            need_release.browse(picking_ids).with_delay(
+                description=_("Assign release channel on %s transfers")
+                % len(picking_ids),
+            ).assign_release_channel()
 
     def _find_release_channel_possible_candidate(self):
         """Find release channels possible candidate for the picking.
@@ -101,11 +149,21 @@ class StockPicking(models.Model):
         :return: release channels
         """
         self.ensure_one()
-        return (
+        domain = self._get_release_channel_possible_candidate_domain()
+        # when many transfers are assigned at once, the transfers sharing the
+        # same candidate domain share the same search
+        cache = self.env.context.get("release_channel_candidates_cache")
+        key = repr(domain)
+        if cache is not None and key in cache:
+            return cache[key]
+        channels = (
             self.env["stock.release.channel"]
-            .search(self._get_release_channel_possible_candidate_domain())
+            .search(domain)
             .sorted(key=lambda r: (not bool(r.partner_ids), r.sequence))
         )
+        if cache is not None:
+            cache[key] = channels
+        return channels
 
     def _get_release_channel_possible_candidate_domain_channel(self):
         return [
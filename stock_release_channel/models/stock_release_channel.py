@@ -189,6 +189,11 @@ class StockReleaseChannel(models.Model):
     )
     last_done_picking_name = fields.Char(compute="_compute_last_done_picking")
     last_done_picking_date_done = fields.Datetime(compute="_compute_last_done_picking")
+    dashboard_snapshot_date = fields.Datetime(
+        compute="_compute_dashboard_snapshot_date",
+        help="Date of the values displayed in the dashboard, when they are "
+        "read from a snapshot.",
+    )
     state = fields.Selection(
         selection=[("open", "Open"), ("locked", "Locked"), ("asleep", "Asleep")],
         help="The state allows you to control the availability of the release channel.\n"
@@ -273,6 +278,88 @@ class StockReleaseChannel(models.Model):
                 self.env.company.release_channel_show_last_picking_done
             )
 
+    @api.model
+    def _get_snapshot_computes(self):
+        """Compute methods of the fields stored in the dashboard snapshots"""
+        return (
+            "_compute_picking_count",
+            "_compute_picking_chain",
+            "_compute_last_done_picking",
+        )
+
+    def _use_dashboard_snapshot(self):
+        return bool(
+            self.env.context.get("release_channel_read_snapshot")
+            and self.env.company.release_channel_dashboard_snapshot
+        )
+
+    @api.model
+    def web_search_read(
+        self,
+        domain=None,
+        fields=None,
+        offset=0,
+        limit=None,
+        order=None,
+        count_limit=None,
+    ):
+        # only the dashboard reads the snapshots: the buttons of the dashboard
+        # get the context of its action, they must use the current values
+        if self.env.context.get("release_channel_dashboard_snapshot"):
+            self = self.with_context(release_channel_read_snapshot=True)
+        return super().web_search_read(
+            domain=domain,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            order=order,
+            count_limit=count_limit,
+        )
+
+    def _get_dashboard_snapshots(self):
+        if not self._use_dashboard_snapshot() or not self.ids:
+            return {}
+        snapshots = (
+            self.env["stock.release.channel.snapshot"]
+            .sudo()
+            .search([("channel_id", "in", self.ids)])
+        )
+        return {snapshot.channel_id.id: snapshot for snapshot in snapshots}
+
+    def _apply_dashboard_snapshot(self, compute):
+        """Assign the fields of ``compute`` from the dashboard snapshots
+
+        Return the channels without snapshot, for which the fields must be
+        computed.
+        """
+        snapshots = self._get_dashboard_snapshots()
+        if not snapshots:
+            return self
+        snapshot_model = self.env["stock.release.channel.snapshot"]
+        field_names = [
+            name for name, field in self._fields.items() if field.compute == compute
+        ]
+        to_compute = self.browse()
+        for channel in self:
+            snapshot = snapshots.get(channel.id)
+            if not snapshot:
+                to_compute |= channel
+                continue
+            channel.update(
+                snapshot_model._deserialize(channel, snapshot.values, field_names)
+            )
+        return to_compute
+
+    @api.depends_context("release_channel_read_snapshot")
+    def _compute_dashboard_snapshot_date(self):
+        snapshots = self._get_dashboard_snapshots()
+        for channel in self:
+            snapshot = snapshots.get(channel.id)
+            channel.dashboard_snapshot_date = snapshot and snapshot.refresh_date
+
+    def action_refresh_dashboard_snapshot(self):
+        self.env["stock.release.channel.snapshot"].sudo()._refresh(self)
+
     @api.model
     def _get_is_release_allowed_domain(self):
         return [("state", "=", "open"), ("release_forbidden", "=", False)]
@@ -389,9 +476,98 @@ class StockReleaseChannel(models.Model):
                 default_values[field] = 0
         return default_values
 
-    # TODO maybe we have to do raw SQL to include the picking + moves counts in
-    # a single query
-    def _compute_picking_count(self):
+    @api.model
+    def _get_compute_aggregate_sql(self, model, fetch):
+        """Return the SQL aggregate matching a read_group ``fetch`` key
+
+        Return None when the key can not be aggregated in SQL, for instance
+        when it is not a stored field.
+        """
+        Model = self.env[model]
+        if fetch.endswith("_count"):
+            return f'COUNT("{Model._table}".id)'
+        field = Model._fields.get(fetch)
+        if not field or not field.store or not field.column_type:
+            return None
+        if field.group_operator not in ("sum", "max", "min", "avg", "count"):
+            return None
+        return f'{field.group_operator.upper()}("{Model._table}"."{fetch}")'
+
+    def _get_aggregate_values_sql(self):
+        """Compute the counters of all the channels in a single query
+
+        Every domain of ``_field_picking_domains`` becomes a FILTER clause of
+        an aggregate grouped by channel, and the moves are aggregated per
+        transfer in a lateral join. Return None when a domain or a computed
+        field can not be expressed this way (e.g. a domain needing a join),
+        the caller must then fall back on ``_get_aggregate_values_read_group``.
+        """
+        Picking = self.env["stock.picking"]
+        Move = self.env["stock.move"]
+        base_query = Picking._where_calc([("release_channel_id", "in", self.ids)])
+        Picking._apply_ir_rules(base_query, "read")
+        from_clause, base_where, base_params = base_query.get_sql()
+        if from_clause != Picking._where_calc([]).get_sql()[0]:
+            return None
+        move_query = Move._where_calc([("state", "!=", "cancel")])
+        Move._apply_ir_rules(move_query, "read")
+        move_from, move_where, move_params = move_query.get_sql()
+        if move_from != Move._where_calc([]).get_sql()[0]:
+            return None
+
+        move_columns = []
+        for index, (_prefix, fetch) in enumerate(self._get_move_compute_fields()):
+            aggregate = self._get_compute_aggregate_sql("stock.move", fetch)
+            if not aggregate:
+                return None
+            move_columns.append(f"{aggregate} AS agg_{index}")
+
+        select_columns = []
+        select_params = []
+        for domain_name, domain in self._field_picking_domains().items():
+            domain_query = Picking._where_calc(domain)
+            domain_from, domain_where, domain_params = domain_query.get_sql()
+            if domain_from != from_clause:
+                return None
+            domain_where = domain_where or "TRUE"
+            for prefix, fetch in self._get_picking_compute_fields():
+                aggregate = self._get_compute_aggregate_sql("stock.picking", fetch)
+                if not aggregate:
+                    return None
+                field = self._get_compute_field_name(prefix, "picking", domain_name)
+                select_columns.append(
+                    f"COALESCE({aggregate} FILTER (WHERE {domain_where}), 0)"
+                    f' AS "{field}"'
+                )
+                select_params += domain_params
+            for index, (prefix, _fetch) in enumerate(self._get_move_compute_fields()):
+                field = self._get_compute_field_name(prefix, "move", domain_name)
+                select_columns.append(
+                    f"COALESCE(SUM(moves.agg_{index}) FILTER (WHERE {domain_where}), 0)"
+                    f' AS "{field}"'
+                )
+                select_params += domain_params
+
+        query = f"""
+            SELECT "stock_picking".release_channel_id, {", ".join(select_columns)}
+            FROM {from_clause}
+            LEFT JOIN LATERAL (
+                SELECT {", ".join(move_columns)}
+                FROM {move_from}
+                WHERE {move_where}
+                AND "stock_move".picking_id = "stock_picking".id
+            ) moves ON TRUE
+            WHERE {base_where}
+            GROUP BY "stock_picking".release_channel_id
+        """
+        self.env.flush_all()
+        self.env.cr.execute(query, select_params + move_params + base_params)
+        return {
+            row.pop("release_channel_id"): row for row in self.env.cr.dictfetchall()
+        }
+
+    def _get_aggregate_values_read_group(self):
+        """Compute the counters with one read_group per domain"""
         domains = self._field_picking_domains()
         picking_channels = defaultdict(
             lambda: {"channel_id": False, "matched_domains": []}
@@ -436,9 +612,18 @@ class StockReleaseChannel(models.Model):
                     field = self._get_compute_field_name(prefix, "move", matched_domain)
                     channel_id = picking_channels[picking_id]["channel_id"]
                     channels_aggregate_values[channel_id][field] += row[fetch]
+        return channels_aggregate_values
 
+    @api.depends_context("release_channel_read_snapshot")
+    def _compute_picking_count(self):
+        channels = self._apply_dashboard_snapshot("_compute_picking_count")
+        channels_aggregate_values = {}
+        if channels.ids:
+            channels_aggregate_values = channels._get_aggregate_values_sql()
+            if channels_aggregate_values is None:
+                channels_aggregate_values = channels._get_aggregate_values_read_group()
         default_aggregate_values = self._get_default_aggregate_values()
-        for record in self:
+        for record in channels:
             values = deepcopy(default_aggregate_values)
             values.update(channels_aggregate_values.get(record.id, {}))
             for prefix, _fetch in self._get_picking_compute_fields():
@@ -447,7 +632,9 @@ class StockReleaseChannel(models.Model):
                     + values[f"{prefix}_picking_released"]
                     + values[f"{prefix}_picking_done"]
                 )
-            record.write(values)
+            # Only assign the computed values, write() would trigger the
+            # inverse/modified machinery for each channel
+            record.update(values)
 
     def _query_get_chain(self, pickings):
         """Get all stock.picking before an outgoing one
@@ -484,12 +671,13 @@ class StockReleaseChannel(models.Model):
         """
         return (query, (tuple(pickings.ids),))
 
+    @api.depends_context("release_channel_read_snapshot")
     def _compute_picking_chain(self):
         self.env["stock.move"].flush_model(
             ["move_dest_ids", "move_orig_ids", "picking_id"]
         )
         self.env["stock.picking"].flush_model(["state"])
-        for channel in self:
+        for channel in self._apply_dashboard_snapshot("_compute_picking_chain"):
             domain = self._field_picking_domains()["released"]
             domain += [("release_channel_id", "=", channel.id)]
             released = self.env["stock.picking"].search(domain)
@@ -515,8 +703,9 @@ class StockReleaseChannel(models.Model):
                 + channel.count_picking_chain_in_progress
             )
 
+    @api.depends_context("release_channel_read_snapshot")
     def _compute_last_done_picking(self):
-        for channel in self:
+        for channel in self._apply_dashboard_snapshot("_compute_last_done_picking"):
             # TODO we have one query per channel, could be better
             domain = self._field_picking_domains()["done"]
             domain += [("release_channel_id", "=", channel.id)]
@@ -557,40 +746,77 @@ class StockReleaseChannel(models.Model):
     @api.model
     def assign_release_channel(self, picking):
         picking.ensure_one()
-        if picking.picking_type_id.code != "outgoing" or picking.state in (
-            "cancel",
-            "done",
+        messages = self.assign_release_channel_bulk(picking)
+        return messages[0] if messages else ""
+
+    @api.model
+    def assign_release_channel_bulk(self, pickings):
+        """Assign a release channel on the transfers
+
+        The transfers try their possible channels in sequence, the first
+        channel accepting a transfer is assigned to it. Rather than trying the
+        channels for each transfer, the transfers are tried by sets: at each
+        round, the transfers are grouped by the next channel they have to try
+        and each channel filters its set with its domain and a single
+        evaluation of its code. The candidate channels are
+        searched once per distinct candidate domain and the channels are
+        written once per channel and round, so the code of a channel sees the
+        transfers assigned by the channels tried before it.
+
+        Return the list of warning messages for the transfers which could not
+        be assigned.
+        """
+        pickings = pickings.filtered(
+            lambda p: p.picking_type_id.code == "outgoing"
+            and p.state not in ("cancel", "done")
+        )
+        candidates_cache = {}
+        picking_candidates = {}
+        for picking in pickings.with_context(
+            release_channel_candidates_cache=candidates_cache
         ):
-            return
-        message = ""
-        for channel in picking._find_release_channel_possible_candidate():
-            current = picking
-            domain = channel._prepare_domain()
-            code = channel.sudo().code
-            if domain:
-                current = picking.filtered_domain(domain)
-            if not current:
-                continue
-            if code:
-                current = channel._eval_code(current)
-            if not current:
-                continue
-            current = channel._assign_release_channel_additional_filter(current)
-            if not current:
-                continue
-            if current.release_channel_id != channel:
-                current.release_channel_id = channel
-            break
+            picking_candidates[picking.id] = list(
+                picking._find_release_channel_possible_candidate()
+            )
+        pending = pickings
+        channel_domains = {}
+        while pending:
+            pickings_by_channel = defaultdict(list)
+            for picking in pending:
+                candidates = picking_candidates[picking.id]
+                if candidates:
+                    pickings_by_channel[candidates.pop(0)].append(picking.id)
+            pending = pickings.browse()
+            for channel, picking_ids in pickings_by_channel.items():
+                current = pickings.browse(picking_ids)
+                if channel not in channel_domains:
+                    channel_domains[channel] = channel._prepare_domain()
+                domain = channel_domains[channel]
+                if domain:
+                    current = current.filtered_domain(domain)
+                if current and channel.sudo().code:
+                    current = channel._eval_code(current)
+                if current:
+                    current = channel._assign_release_channel_additional_filter(current)
+                to_write = current.filtered(
+                    lambda p, channel=channel: p.release_channel_id != channel
+                )
+                if to_write:
+                    to_write.release_channel_id = channel
+                pending |= pickings.browse(picking_ids) - current
 
-        if not picking.release_channel_id:
+        messages = []
+        for picking in pickings:
+            if picking.release_channel_id:
+                continue
             # by this point, the picking should have been assigned
             message_template = (
                 "Transfer %(picking_name)s could not be assigned to a "
                 "channel, you should add a final catch-all rule"
             )
             _logger.warning(message_template, {"picking_name": picking.name})
-            message = _(message_template, picking_name=picking.name)
-        return message
+            messages.append(_(message_template, picking_name=picking.name))
+        return messages
 
     def _assign_release_channel_additional_filter(self, pickings):
         self.ensure_one()
@@ -755,11 +981,18 @@ class StockReleaseChannel(models.Model):
     def _get_next_pickings(self):
         return getattr(self, "_get_next_pickings_{}".format(self.batch_mode))()
 
-    def _get_pickings_to_release(self):
-        """Get the pickings to release."""
+    def _get_pickings_to_release(self, limit=None):
+        """Get the pickings to release, in the order they must be released."""
         domain = self._field_picking_domains()["release_ready"]
         domain += [("release_channel_id", "in", self.ids)]
-        return self.env["stock.picking"].search(domain)
+        return self.env["stock.picking"].search(
+            domain, order=self._get_pickings_to_release_order(), limit=limit
+        )
+
+    @api.model
+    def _get_pickings_to_release_order(self):
+        """Order of the pickings to release, same as ``_pickings_sort_key``"""
+        return "priority desc, date_priority, id"
 
     def _get_next_pickings_max(self):
         if not self.max_batch_mode:
@@ -777,12 +1010,7 @@ class StockReleaseChannel(models.Model):
                     " progress is already at the maximum."
                 )
             )
-        next_pickings = self._get_pickings_to_release()
-        # We have to use a python sort and not a order + limit on the search
-        # because "date_priority" is computed and not stored. If needed, we
-        # should evaluate making it a stored field in the module
-        # "stock_available_to_promise_release".
-        return next_pickings.sorted(self._pickings_sort_key)[:release_limit]
+        return self._get_pickings_to_release(limit=release_limit)
 
     def _check_is_release_allowed(self):
         for rec in self:
@@ -807,7 +1035,9 @@ class StockReleaseChannel(models.Model):
                     "type": "rainbow_man",
                 }
             }
-        next_pickings.release_available_to_promise()
+        pipeline = next_pickings.release_available_to_promise_pipeline()
+        if pipeline:
+            return pipeline.get_formview_action()
 
     def _check_is_action_lock_allowed(self):
         for rec in self:
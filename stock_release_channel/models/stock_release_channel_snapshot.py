@@ -0,0 +1,216 @@
+# Copyright 2026 Camptocamp
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from datetime import datetime, timedelta
+
+from odoo import api, fields, models
+from odoo.tools import groupby
+
+# changes committed by transactions started before a refresh are not seen by
+# it, but their write_date is earlier than the refresh date
+REFRESH_MARGIN = timedelta(minutes=1)
+
+
+class StockReleaseChannelSnapshot(models.Model):
+    """Values of the release channels dashboard
+
+    The counters of the dashboard are costly to compute. When the option is
+    enabled on the company, they are computed periodically by a cron and
+    stored here, then the dashboard reads them instead of computing them for
+    every user opening it.
+    """
+
+    _name = "stock.release.channel.snapshot"
+    _description = "Stock Release Channel Dashboard Snapshot"
+    _log_access = False
+
+    channel_id = fields.Many2one(
+        comodel_name="stock.release.channel",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+    )
+    refresh_date = fields.Datetime(required=True, readonly=True)
+    picking_count = fields.Integer(readonly=True)
+    values = fields.Json(readonly=True)
+
+    _sql_constraints = [
+        (
+            "channel_uniq",
+            "unique(channel_id)",
+            "A release channel can only have one snapshot.",
+        )
+    ]
+
+    def init(self):
+        # used to find the channels having transfers changed since the last
+        # refresh
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS stock_picking_release_channel_write_date_index
+            ON stock_picking (release_channel_id, write_date)
+            WHERE release_channel_id IS NOT NULL
+            """
+        )
+
+    @api.model
+    def _get_snapshot_field_names(self):
+        channel_model = self.env["stock.release.channel"]
+        return [
+            name
+            for name, field in channel_model._fields.items()
+            if field.compute in channel_model._get_snapshot_computes()
+        ]
+
+    @api.model
+    def _serialize(self, channel, field_names):
+        values = {}
+        for name in field_names:
+            field = channel._fields[name]
+            value = channel[name]
+            if field.type in ("many2one", "one2many", "many2many"):
+                value = value.ids
+            elif field.type == "datetime":
+                value = fields.Datetime.to_string(value)
+            elif field.type == "date":
+                value = fields.Date.to_string(value)
+            values[name] = value
+        return values
+
+    @api.model
+    def _deserialize(self, channel, values, field_names):
+        res = {}
+        for name in field_names:
+            field = channel._fields[name]
+            value = values.get(name)
+            if field.type == "many2one":
+                value = channel.env[field.comodel_name].browse(value)
+            elif field.type in ("one2many", "many2many"):
+                value = channel.env[field.comodel_name].browse(value or [])
+            elif field.type == "datetime":
+                value = fields.Datetime.to_datetime(value)
+            elif field.type == "date":
+                value = fields.Date.to_date(value)
+            res[name] = value
+        return res
+
+    @api.model
+    def _refresh(self, channels):
+        """Compute and store the dashboard values of the channels"""
+        refresh_date = self.env.cr.now()
+        channels = channels.with_context(release_channel_read_snapshot=False)
+        field_names = self._get_snapshot_field_names()
+        snapshots = self.search([("channel_id", "in", channels.ids)])
+        snapshot_by_channel = {s.channel_id.id: s for s in snapshots}
+        picking_counts = {
+            row["release_channel_id"][0]: row["release_channel_id_count"]
+            for row in self.env["stock.picking"].read_group(
+                [("release_channel_id", "in", channels.ids)],
+                ["release_channel_id"],
+                ["release_channel_id"],
+            )
+        }
+        create_vals = []
+        for channel in channels:
+            vals = {
+                "refresh_date": refresh_date,
+                "picking_count": picking_counts.get(channel.id, 0),
+                "values": self._serialize(channel, field_names),
+            }
+            snapshot = snapshot_by_channel.get(channel.id)
+            if snapshot:
+                snapshot.write(vals)
+            else:
+                vals["channel_id"] = channel.id
+                create_vals.append(vals)
+        self.create(create_vals)
+
+    @api.model
+    def _get_outdated_channels(self, channels):
+        """Return the channels for which the snapshot must be refreshed
+
+        They are the channels without snapshot, or having a snapshot taken
+        the day before, or having transfers changed, added or removed since
+        the snapshot, or getting late since then. As the transfers ready to
+        release depend on the stock and on the moves of their products, the
+        channels having moves to release of products whose quants or moves
+        changed since the snapshot are refreshed as well.
+        """
+        if not channels:
+            return channels
+        self.flush_model()
+        self.env["stock.picking"].flush_model()
+        self.env["stock.move"].flush_model()
+        self.env["stock.quant"].flush_model()
+        today = datetime.combine(fields.Date.today(), datetime.min.time())
+        self.env.cr.execute(
+            """
+            SELECT channel.id
+            FROM stock_release_channel channel
+            LEFT JOIN stock_release_channel_snapshot snapshot
+            ON snapshot.channel_id = channel.id
+            WHERE channel.id IN %(channel_ids)s
+            AND (
+                snapshot.id IS NULL
+                OR snapshot.refresh_date < %(today)s
+                OR EXISTS (
+                    SELECT 1 FROM stock_picking picking
+                    WHERE picking.release_channel_id = channel.id
+                    AND picking.write_date >= snapshot.refresh_date - %(margin)s
+                )
+                OR snapshot.picking_count != (
+                    SELECT COUNT(*) FROM stock_picking picking
+                    WHERE picking.release_channel_id = channel.id
+                )
+                OR EXISTS (
+                    SELECT 1 FROM stock_picking picking
+                    WHERE picking.release_channel_id = channel.id
+                    AND picking.state IN ('assigned', 'waiting', 'confirmed')
+                    AND picking.scheduled_date >= snapshot.refresh_date
+                    AND picking.scheduled_date < %(now)s
+                )
+                OR EXISTS (
+                    SELECT 1
+                    FROM stock_move move
+                    JOIN stock_picking picking ON picking.id = move.picking_id
+                    WHERE picking.release_channel_id = channel.id
+                    AND move.need_release IS true
+                    AND move.state NOT IN ('draft', 'done', 'cancel')
+                    AND (
+                        EXISTS (
+                            SELECT 1 FROM stock_quant quant
+                            WHERE quant.product_id = move.product_id
+                            AND quant.write_date
+                                >= snapshot.refresh_date - %(margin)s
+                        )
+                        OR EXISTS (
+                            SELECT 1 FROM stock_move other
+                            WHERE other.product_id = move.product_id
+                            AND other.write_date
+                                >= snapshot.refresh_date - %(margin)s
+                        )
+                    )
+                )
+            )
+            """,
+            {
+                "channel_ids": tuple(channels.ids),
+                "today": today,
+                "now": fields.Datetime.now(),
+                "margin": REFRESH_MARGIN,
+            },
+        )
+        return channels.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def _cron_refresh(self):
+        channels = (
+            self.env["stock.release.channel"]
+            .search([])
+            .filtered(lambda c: c.company_id.release_channel_dashboard_snapshot)
+        )
+        for company, company_channels in groupby(channels, lambda c: c.company_id):
+            company_channels = channels.browse(
+                [c.id for c in company_channels]
+            ).with_company(company)
+            self._refresh(self._get_outdated_channels(company_channels))
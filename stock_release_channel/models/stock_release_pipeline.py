@@ -0,0 +1,163 @@
+# Copyright 2026 Camptocamp
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from odoo import _, api, fields, models
+from odoo.tools import groupby, split_every
+
+
+class StockReleasePipeline(models.Model):
+    """Release of a large set of transfers split in chunks
+
+    Each chunk is released by its own job, in its own transaction, so that
+    a large release does not keep the quants locked until all the transfers
+    are released.
+    """
+
+    _name = "stock.release.pipeline"
+    _description = "Stock Release Pipeline"
+    _order = "id desc"
+
+    name = fields.Char(required=True, readonly=True)
+    company_id = fields.Many2one(
+        comodel_name="res.company",
+        required=True,
+        readonly=True,
+        default=lambda s: s.env.company.id,
+    )
+    chunk_ids = fields.One2many(
+        comodel_name="stock.release.pipeline.chunk",
+        inverse_name="pipeline_id",
+        readonly=True,
+    )
+    picking_count = fields.Integer(compute="_compute_progress")
+    released_picking_count = fields.Integer(compute="_compute_progress")
+    chunk_count = fields.Integer(compute="_compute_progress")
+    chunk_done_count = fields.Integer(compute="_compute_progress")
+    chunk_failed_count = fields.Integer(compute="_compute_progress")
+    progress = fields.Float(compute="_compute_progress")
+    state = fields.Selection(
+        [("in_progress", "In Progress"), ("done", "Done"), ("failed", "Failed")],
+        compute="_compute_progress",
+    )
+
+    def _compute_progress(self):
+        for pipeline in self:
+            chunks = pipeline.chunk_ids
+            pickings = chunks.picking_ids
+            pipeline.picking_count = len(pickings)
+            pipeline.released_picking_count = len(
+                pickings.filtered(
+                    lambda p, date=pipeline.create_date: p.last_release_date
+                    and p.last_release_date >= date
+                )
+            )
+            pipeline.chunk_count = len(chunks)
+            pipeline.chunk_done_count = len(
+                chunks.filtered(lambda c: c.state == "done")
+            )
+            pipeline.chunk_failed_count = len(
+                chunks.filtered(lambda c: c.state == "failed")
+            )
+            finished = pipeline.chunk_done_count + pipeline.chunk_failed_count
+            pipeline.progress = (
+                100.0 * finished / pipeline.chunk_count
+                if pipeline.chunk_count
+                else 100.0
+            )
+            if finished < pipeline.chunk_count:
+                pipeline.state = "in_progress"
+            elif pipeline.chunk_failed_count:
+                pipeline.state = "failed"
+            else:
+                pipeline.state = "done"
+
+    @api.model
+    def _create_for_pickings(self, pickings, chunk_size):
+        """Split the pickings in chunks and delay their release
+
+        The pickings are grouped by :meth:`_release_pipeline_chunk_key` so
+        that the transfers sharing the same goods are released by the same
+        job, then each group is split in chunks of at most ``chunk_size``
+        transfers.
+        """
+        pipeline = self.create(
+            {"name": _("Release of %(count)s transfers", count=len(pickings))}
+        )
+        chunk_vals = []
+        for __, group in groupby(pickings, lambda p: p._release_pipeline_chunk_key()):
+            for chunk_pickings in split_every(chunk_size, group, list):
+                chunk_vals.append(
+                    {
+                        "pipeline_id": pipeline.id,
+                        "picking_ids": [(6, 0, [p.id for p in chunk_pickings])],
+                    }
+                )
+        chunks = self.env["stock.release.pipeline.chunk"].create(chunk_vals)
+        chunks._delay_release()
+        return pipeline
+
+    def action_view_pickings(self):
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "stock_available_to_promise_release.stock_picking_release_action"
+        )
+        action["domain"] = [("id", "in", self.chunk_ids.picking_ids.ids)]
+        action["context"] = {}
+        return action
+
+
+class StockReleasePipelineChunk(models.Model):
+    _name = "stock.release.pipeline.chunk"
+    _description = "Stock Release Pipeline Chunk"
+
+    pipeline_id = fields.Many2one(
+        comodel_name="stock.release.pipeline",
+        required=True,
+        ondelete="cascade",
+        index=True,
+        readonly=True,
+    )
+    picking_ids = fields.Many2many(comodel_name="stock.picking", readonly=True)
+    job_uuid = fields.Char(readonly=True, copy=False)
+    state = fields.Selection(
+        [("pending", "Pending"), ("done", "Done"), ("failed", "Failed")],
+        compute="_compute_state",
+    )
+    error = fields.Text(compute="_compute_state")
+
+    def _compute_state(self):
+        jobs = (
+            self.env["queue.job"]
+            .sudo()
+            .search([("uuid", "in", [uuid for uuid in self.mapped("job_uuid")])])
+        )
+        jobs_by_uuid = {job.uuid: job for job in jobs}
+        for chunk in self:
+            job = jobs_by_uuid.get(chunk.job_uuid)
+            chunk.error = False
+            if not job or job.state not in ("done", "failed", "cancelled"):
+                chunk.state = "pending"
+            elif job.state == "done":
+                chunk.state = "done"
+            else:
+                chunk.state = "failed"
+                chunk.error = job.exc_message or job.exc_name
+
+    def _delay_release(self):
+        for chunk in self:
+            job = chunk.with_delay(
+                description=_(
+                    "%(pipeline)s: release of %(count)s transfers",
+                    pipeline=chunk.pipeline_id.name,
+                    count=len(chunk.picking_ids),
+                ),
+            ).release()
+            chunk.job_uuid = job.uuid
+
+    def release(self):
+        """Release the transfers of the chunk, run in a job"""
+        for chunk in self:
+            pickings = chunk.picking_ids.filtered(
+                lambda p: p.need_release and p.state not in ("done", "cancel")
+            )
+            pickings.release_available_to_promise()
@@ -3,7 +3,9 @@ from . import (
     test_channel_action,
     test_channel_computed_fields,
     test_channel_release_batch,
+    test_channel_snapshot,
     test_release_channel,
     test_release_channel_lifecycle,
     test_release_channel_partner,
+    test_release_pipeline,
 )
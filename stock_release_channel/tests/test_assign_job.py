@@ -1,6 +1,7 @@
 # Copyright 2022 ACSONE SA/NV (http://www.acsone.eu)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl.html)
 
+from unittest import mock
 
 from odoo.addons.queue_job.tests.common import trap_jobs
 
@@ -64,3 +65,40 @@ class TestReleaseChannel(ReleaseChannelCase):
             enqueued_job = trap.enqueued_jobs[0]
             trap.perform_enqueued_jobs()
             self.assertEqual(message, enqueued_job.result)
+
+    def test_assign_channel_on_all_need_release_single_job(self):
+        channel = self._create_channel(
+            name="Test Domain",
+            sequence=1,
+            rule_domain=[("priority", "=", "1")],
+        )
+        moves = self.env["stock.move"].browse()
+        for __ in range(3):
+            moves |= self._create_single_move(self.product1, 10)
+        moves[0].picking_id.priority = "1"
+        pickings = moves.picking_id
+        pickings.release_channel_id = False
+        with trap_jobs() as trap:
+            self.env["stock.picking"].assign_release_channel_on_all_need_release()
+            trap.assert_jobs_count(1)
+            trap.perform_enqueued_jobs()
+        self.assertEqual(moves[0].picking_id.release_channel_id, channel)
+        self.assertEqual(
+            (pickings - moves[0].picking_id).release_channel_id, self.default_channel
+        )
+
+    def test_assign_channel_on_all_need_release_chunks(self):
+        moves = self.env["stock.move"].browse()
+        for __ in range(3):
+            moves |= self._create_single_move(self.product1, 10)
+        pickings = moves.picking_id
+        pickings.release_channel_id = False
+        with trap_jobs() as trap, mock.patch(
+            "odoo.addons.stock_release_channel.models.stock_picking."
+            "ASSIGN_RELEASE_CHANNEL_CHUNK_SIZE",
+            2,
+        ):
+            self.env["stock.picking"].assign_release_channel_on_all_need_release()
+            trap.assert_jobs_count(2)
+            trap.perform_enqueued_jobs()
+        self.assertEqual(pickings.release_channel_id, self.default_channel)
@@ -90,3 +90,17 @@ class TestChannelComputedFields(ChannelReleaseCase):
         self.assertEqual(
             self.channel.last_done_picking_date_done, self.picking.date_done
         )
+
+    def test_computed_fields_counts_sql_read_group(self):
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        self._update_qty_in_location(self.loc_bin1, self.product2, 20.0)
+        self.picking.release_available_to_promise()
+        channels = self.channel | self.env["stock.release.channel"].search([])
+        sql_values = channels._get_aggregate_values_sql()
+        self.assertIsNotNone(sql_values)
+        read_group_values = channels._get_aggregate_values_read_group()
+        for channel in channels:
+            expected = read_group_values.get(channel.id, {})
+            values = sql_values.get(channel.id, {})
+            for field in set(expected) | set(values):
+                self.assertEqual(values.get(field, 0), expected.get(field, 0), field)
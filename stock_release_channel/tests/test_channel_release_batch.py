@@ -54,6 +54,25 @@ class TestChannelReleaseBatch(ChannelReleaseCase):
             [False, False, False, True, True, True],
         )
 
+    def test_release_auto_max_next_batch_order(self):
+        self.channel.max_batch_mode = 2
+        # the moves priority date is propagated to the stored picking field
+        last_picking = self.pickings[-1]
+        last_picking.move_ids.date_priority = "2000-01-01 00:00:00"
+        self.assertEqual(
+            last_picking.date_priority,
+            last_picking.move_ids[0].date_priority,
+        )
+        self.pickings[-2].priority = "1"
+        self.assertEqual(
+            self.channel._get_next_pickings_max(),
+            self.pickings[-2] | last_picking,
+        )
+        self.assertEqual(
+            self.channel._get_pickings_to_release(limit=2).ids,
+            [self.pickings[-2].id, last_picking.id],
+        )
+
     def test_release_auto_max_no_next_batch(self):
         action = self.channel.release_next_batch()
         action = self.channel.release_next_batch()
@@ -0,0 +1,85 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from .common import ChannelReleaseCase
+
+
+class TestChannelSnapshot(ChannelReleaseCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env.company.release_channel_dashboard_snapshot = True
+        cls.snapshot_model = cls.env["stock.release.channel.snapshot"]
+
+    def _dashboard_values(self, field_names):
+        channel_model = self.env["stock.release.channel"].with_context(
+            release_channel_dashboard_snapshot=True
+        )
+        result = channel_model.web_search_read(
+            [("id", "=", self.channel.id)], field_names
+        )
+        return result["records"][0]
+
+    def test_snapshot_read_by_dashboard(self):
+        field_names = ["dashboard_snapshot_date", "count_picking_release_ready"]
+        self.assertFalse(self._dashboard_values(field_names)["dashboard_snapshot_date"])
+        self.snapshot_model._cron_refresh()
+        values = self._dashboard_values(field_names + ["count_picking_all"])
+        self.assertTrue(values["dashboard_snapshot_date"])
+        self.assertEqual(values["count_picking_all"], 3)
+        self.assertEqual(values["count_picking_release_ready"], 0)
+
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        self._update_qty_in_location(self.loc_bin1, self.product2, 20.0)
+        self.assertEqual(self.channel.count_picking_release_ready, 3)
+        self.snapshot_model._cron_refresh()
+        values = self._dashboard_values(field_names)
+        self.assertEqual(values["count_picking_release_ready"], 3)
+
+    def test_snapshot_outdated_channels(self):
+        self.snapshot_model._refresh(self.channel)
+        snapshot = self.snapshot_model.search([("channel_id", "=", self.channel.id)])
+        # simulate a refresh done after the last change of the transfers
+        snapshot.refresh_date = "2999-01-01"
+        self.assertFalse(self.snapshot_model._get_outdated_channels(self.channel))
+        self.picking.release_channel_id = False
+        self.assertEqual(
+            self.snapshot_model._get_outdated_channels(self.channel), self.channel
+        )
+        self.snapshot_model._refresh(self.channel)
+        self.assertEqual(snapshot.values["count_picking_all"], 2)
+
+    def test_snapshot_outdated_by_stock(self):
+        self.snapshot_model._refresh(self.channel)
+        snapshot = self.snapshot_model.search([("channel_id", "=", self.channel.id)])
+        snapshot.refresh_date = "2999-01-01"
+        self.assertFalse(self.snapshot_model._get_outdated_channels(self.channel))
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        self.env.flush_all()
+        # simulate a change of the stock done after the snapshot
+        self.env.cr.execute(
+            "UPDATE stock_quant SET write_date = '2999-01-02' WHERE product_id = %s",
+            (self.product1.id,),
+        )
+        self.assertEqual(
+            self.snapshot_model._get_outdated_channels(self.channel), self.channel
+        )
+
+    def test_snapshot_not_used_by_actions(self):
+        self.snapshot_model._refresh(self.channel)
+        self.assertFalse(
+            self._dashboard_values(["picking_chain_ids"])["picking_chain_ids"]
+        )
+        channel = self.channel.with_context(release_channel_dashboard_snapshot=True)
+        self._update_qty_in_location(self.loc_bin1, self.product1, 20.0)
+        self._update_qty_in_location(self.loc_bin1, self.product2, 20.0)
+        pickings = self.picking + self.picking2 + self.picking3
+        pickings.release_available_to_promise()
+        related = pickings.move_ids.move_orig_ids.picking_id
+        self.assertTrue(related)
+        # the dashboard displays the snapshot, the action the current values
+        self.assertFalse(
+            self._dashboard_values(["picking_chain_ids"])["picking_chain_ids"]
+        )
+        action = channel.action_picking_all_related()
+        self.assertEqual(self.env["stock.picking"].search(action["domain"]), related)
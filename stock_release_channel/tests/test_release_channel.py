@@ -46,6 +46,34 @@ class TestReleaseChannel(ReleaseChannelCase):
         )
         self._test_assign_channels(channel)
 
+    def test_assign_channel_bulk(self):
+        channel = self._create_channel(
+            name="Test Domain and Code",
+            sequence=1,
+            rule_domain=[("priority", "=", "1")],
+            code="pickings = pickings.filtered(lambda p: p.origin != 'skip')",
+        )
+        moves = self.env["stock.move"].browse()
+        for __ in range(4):
+            moves |= self._create_single_move(self.product1, 10)
+        pickings = moves.picking_id
+        pickings[:3].priority = "1"
+        pickings[2].origin = "skip"
+        with mock.patch.object(
+            StockReleaseChannel, "_eval_code", autospec=True
+        ) as mock_eval:
+            mock_eval.side_effect = lambda chan, picks: picks.filtered(
+                lambda p: p.origin != "skip"
+            )
+            messages = self.env["stock.release.channel"].assign_release_channel_bulk(
+                pickings
+            )
+            # the code of the channel is evaluated once for all the transfers
+            self.assertEqual(mock_eval.call_count, 1)
+        self.assertFalse(messages)
+        self.assertEqual(pickings[:2].release_channel_id, channel)
+        self.assertEqual(pickings[2:].release_channel_id, self.default_channel)
+
     def test_assign_channel_invalid_company(self):
         # Create a channel for high priority moves but for another company
         self._create_channel(
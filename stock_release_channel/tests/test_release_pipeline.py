@@ -0,0 +1,75 @@
+# Copyright 2026 Camptocamp (https://www.camptocamp.com)
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from odoo.addons.queue_job.tests.common import trap_jobs
+
+from .common import ChannelReleaseCase
+
+
+class TestReleasePipeline(ChannelReleaseCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pickings = cls.picking + cls.picking2 + cls.picking3
+        for __ in range(3):
+            cls.pickings += cls._out_picking(
+                cls._create_picking_chain(
+                    cls.wh, [(cls.product1, 5), (cls.product2, 5)], move_type="direct"
+                )
+            )
+        cls.pickings.assign_release_channel()
+        cls._update_qty_in_location(cls.loc_bin1, cls.product1, 1000.0)
+        cls._update_qty_in_location(cls.loc_bin1, cls.product2, 1000.0)
+        cls.env.company.release_pipeline_chunk_size = 2
+
+    def test_release_small_batch_not_chunked(self):
+        with trap_jobs() as trap:
+            pipeline = self.pickings[:2].release_available_to_promise_pipeline()
+            trap.assert_jobs_count(0)
+        self.assertFalse(pipeline)
+        self.assertEqual(self.pickings[:2].mapped("need_release"), [False, False])
+
+    def test_release_direct_not_chunked(self):
+        # the pipeline is opt-in: a direct release stays synchronous
+        with trap_jobs() as trap:
+            res = self.pickings.release_available_to_promise()
+            trap.assert_jobs_count(0)
+        self.assertNotIsInstance(res, type(self.env["stock.release.pipeline"]))
+        self.assertFalse(any(self.pickings.mapped("need_release")))
+
+    def test_release_chunks(self):
+        self.channel.max_batch_mode = 10
+        with trap_jobs() as trap:
+            action = self.channel.release_next_batch()
+            pipeline = self.env["stock.release.pipeline"].browse(action["res_id"])
+            trap.assert_jobs_count(3)
+            # nothing is released until the jobs are run
+            self.assertTrue(all(self.pickings.mapped("need_release")))
+            self.assertEqual(pipeline.picking_count, 6)
+            self.assertEqual(pipeline.chunk_count, 3)
+            self.assertEqual(pipeline.state, "in_progress")
+            self.assertEqual(
+                pipeline.chunk_ids.mapped(lambda c: len(c.picking_ids)), [2, 2, 2]
+            )
+            trap.perform_enqueued_jobs()
+        self.assertFalse(any(self.pickings.mapped("need_release")))
+        pipeline.invalidate_recordset()
+        self.assertEqual(pipeline.released_picking_count, 6)
+
+    def test_chunk_key_main_category(self):
+        category = self.env["product.category"].create({"name": "Category A"})
+        other_category = category.copy({"name": "Category B"})
+        self.product1.categ_id = category
+        (self.product2 | self.product3).categ_id = other_category
+        # one move of each category: the lowest id is taken
+        key = self.pickings[-1]._release_pipeline_chunk_key()
+        self.assertEqual(key, (self.wh.id, category.id))
+        picking = self._out_picking(
+            self._create_picking_chain(
+                self.wh,
+                [(self.product1, 5), (self.product2, 5), (self.product3, 5)],
+                move_type="direct",
+            )
+        )
+        key = picking._release_pipeline_chunk_key()
+        self.assertEqual(key, (self.wh.id, other_category.id))
@@ -14,11 +14,7 @@ class StockReleaseChannel(models.Model):
     )
 
     def _get_next_pickings_group_commercial_partner(self):
-        # We have to use a python sort and not a order + limit on the search
-        # because "date_priority" is computed and not stored. If needed, we
-        # should evaluate making it a stored field in the module
-        # "stock_available_to_promise_release".
-        next_pickings = self._get_pickings_to_release().sorted(self._pickings_sort_key)
+        next_pickings = self._get_pickings_to_release()
         if not next_pickings:
             return self.env["stock.picking"].browse()
         first_picking = next_pickings[0]
@@ -10,6 +10,7 @@
     "website": "https://github.com/OCA/wms",
     "depends": ["geoengine_partner", "stock_release_channel"],
     "data": [
+        "security/stock_release_channel_partner_zone.xml",
         "views/res_partner.xml",
         "views/stock_release_channel.xml",
     ],
@@ -1,3 +1,4 @@
 from . import stock_release_channel
 from . import res_partner
 from . import stock_picking
+from . import stock_release_channel_partner_zone
@@ -3,6 +3,14 @@
 
 from odoo import api, fields, models
 
+# the geo point is computed from the coordinates
+GEO_FIELDS = {
+    "geo_point",
+    "in_geo_release_channel",
+    "partner_latitude",
+    "partner_longitude",
+}
+
 
 class ResPartner(models.Model):
 
@@ -22,12 +30,38 @@ class ResPartner(models.Model):
 
     @api.depends("geo_point", "in_geo_release_channel")
     def _compute_located_in_stock_release_channel_ids(self):
+        channel_model = self.env["stock.release.channel"]
+        zone_channel_ids = self.env[
+            "stock.release.channel.partner.zone"
+        ]._get_partner_channel_ids(self)
+        # the channels are searched once for all the partners, to apply the
+        # access rules and skip the archived channels
+        channel_ids = {id_ for ids in zone_channel_ids.values() for id_ in ids}
+        channels = channel_model.search([("id", "in", list(channel_ids))])
         for rec in self:
             if not rec.geo_point or not rec.in_geo_release_channel:
                 rec.located_in_stock_release_channel_ids = False
-                continue
-            rec.located_in_stock_release_channel_ids = (
-                rec.located_in_stock_release_channel_ids.search(
+            elif not rec.id:
+                # not saved yet (e.g. onchange), not in the zones table
+                rec.located_in_stock_release_channel_ids = channel_model.search(
                     [("delivery_zone", "geo_intersect", rec.geo_point)]
                 )
-            )
+            else:
+                rec.located_in_stock_release_channel_ids = channels.filtered(
+                    lambda channel: channel.id in zone_channel_ids.get(rec.id, ())
+                )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._refresh_release_channel_zones()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if not GEO_FIELDS.isdisjoint(vals):
+            self._refresh_release_channel_zones()
+        return res
+
+    def _refresh_release_channel_zones(self):
+        self.env["stock.release.channel.partner.zone"]._refresh(partners=self)
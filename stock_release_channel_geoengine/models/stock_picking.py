@@ -12,11 +12,10 @@ class StockPicking(models.Model):
         self.ensure_one()
         domain = super()._get_release_channel_possible_candidate_domain_partner()
         if self.partner_id.in_geo_release_channel:
-            domain += [
-                "|",
-                ("restrict_to_delivery_zone", "=", False),
-                ("delivery_zone", "geo_intersect", self.partner_id.geo_point),
-            ]
+            zone_domain = self.env[
+                "stock.release.channel.partner.zone"
+            ]._domain_partner_channels(self.partner_id)
+            domain += ["|", ("restrict_to_delivery_zone", "=", False)] + zone_domain
         else:
             domain += [("restrict_to_delivery_zone", "=", False)]
         return domain
@@ -3,7 +3,7 @@
 
 import logging
 
-from odoo import fields, models
+from odoo import api, fields, models
 
 from odoo.addons.base_geoengine.fields import GeoMultiPolygon
 
@@ -16,3 +16,20 @@ class StockReleaseChannel(models.Model):
 
     restrict_to_delivery_zone = fields.Boolean()
     delivery_zone = GeoMultiPolygon()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records.filtered("delivery_zone")._refresh_partner_zones()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "delivery_zone" in vals:
+            self._refresh_partner_zones()
+        return res
+
+    def _refresh_partner_zones(self):
+        if not self:
+            return
+        self.env["stock.release.channel.partner.zone"]._refresh(channels=self)
@@ -0,0 +1,120 @@
+# Copyright 2026 ACSONE SA/NV
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import api, fields, models
+
+
+class StockReleaseChannelPartnerZone(models.Model):
+    """Partners located in the delivery zones of the release channels
+
+    A line exists for each partner included in the channels based on
+    geo-localization whose geo point is within the delivery zone of a channel.
+    The lines of a partner are refreshed when its geo point changes and the
+    lines of a channel when its delivery zone changes, so the transfers are
+    assigned to the channels with a join on this table instead of a spatial
+    intersection per transfer.
+    """
+
+    _name = "stock.release.channel.partner.zone"
+    _description = "Stock Release Channel Partner Zone"
+    _log_access = False
+
+    partner_id = fields.Many2one(
+        comodel_name="res.partner",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+        index=True,
+    )
+    channel_id = fields.Many2one(
+        comodel_name="stock.release.channel",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+        index=True,
+    )
+
+    _sql_constraints = [
+        (
+            "partner_channel_uniq",
+            "unique(partner_id, channel_id)",
+            "A partner can only be once in the delivery zone of a channel.",
+        )
+    ]
+
+    def init(self):
+        # the intersections are computed from the zones side when a partner
+        # moves and from the partners side when a zone changes
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS stock_release_channel_delivery_zone_gist_index
+            ON stock_release_channel USING GIST (delivery_zone);
+            CREATE INDEX IF NOT EXISTS res_partner_geo_point_gist_index
+            ON res_partner USING GIST (geo_point);
+            """
+        )
+        # the models are initialized after the ones they depend on, fill the
+        # table with the partners and zones existing on install
+        self._refresh()
+
+    @api.model
+    def _refresh(self, partners=None, channels=None):
+        """Refresh the lines of the partners or of the channels
+
+        Without partners nor channels, all the lines are refreshed.
+        """
+        self.env["res.partner"].flush_model(["geo_point", "in_geo_release_channel"])
+        self.env["stock.release.channel"].flush_model(["delivery_zone"])
+        if partners is not None:
+            condition, params = "partner.id = ANY(%s)", [partners.ids]
+        elif channels is not None:
+            condition, params = "channel.id = ANY(%s)", [channels.ids]
+        else:
+            condition, params = "true", []
+        self.env.cr.execute(
+            """
+            DELETE FROM stock_release_channel_partner_zone zone
+            USING res_partner partner, stock_release_channel channel
+            WHERE partner.id = zone.partner_id
+            AND channel.id = zone.channel_id
+            AND {condition};
+            INSERT INTO stock_release_channel_partner_zone (partner_id, channel_id)
+            SELECT partner.id, channel.id
+            FROM stock_release_channel channel
+            JOIN res_partner partner
+            ON ST_Intersects(channel.delivery_zone, partner.geo_point)
+            WHERE partner.in_geo_release_channel
+            AND {condition}
+            ON CONFLICT DO NOTHING
+            """.format(
+                condition=condition
+            ),
+            params * 2,
+        )
+        self.invalidate_model()
+        self.env["res.partner"].invalidate_model(
+            ["located_in_stock_release_channel_ids"]
+        )
+
+    @api.model
+    def _get_partner_channel_ids(self, partners):
+        """Return {partner id: ids of the channels the partner is located in}"""
+        self.env.cr.execute(
+            """
+            SELECT partner_id, ARRAY_AGG(channel_id)
+            FROM stock_release_channel_partner_zone
+            WHERE partner_id = ANY(%s)
+            GROUP BY partner_id
+            """,
+            ([id_ for id_ in partners.ids if id_],),
+        )
+        return dict(self.env.cr.fetchall())
+
+    @api.model
+    def _domain_partner_channels(self, partner):
+        """Domain selecting the channels in which the partner is located"""
+        query = """
+            SELECT channel_id FROM stock_release_channel_partner_zone
+            WHERE partner_id = %s
+        """
+        return [("id", "inselect", (query, [partner.id]))]
@@ -1 +1,2 @@
 from . import test_stock_release_channel_geoengine
+from . import test_partner_zone_benchmark
@@ -0,0 +1,62 @@
+# Copyright 2026 ACSONE SA/NV
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import logging
+import time
+
+from shapely.geometry.polygon import Point
+
+from odoo.tests import tagged
+
+from .common import TestStockReleaseChannelGeoengineCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged("-standard", "partner_zone_benchmark")
+class TestPartnerZoneBenchmark(TestStockReleaseChannelGeoengineCommon):
+    """Measure the refresh of the partners zones and the assignment of
+    transfers on many geo-localized partners
+
+    Not part of the standard tests, run with
+    ``--test-tags partner_zone_benchmark``.
+    """
+
+    def _benchmark(self, count):
+        start = time.perf_counter()
+        partners = self.env["res.partner"].create(
+            [
+                {
+                    "name": "Benchmark partner %s" % index,
+                    "geo_point": Point(
+                        3.1555 + (index % 100) * 0.00002,
+                        50.7763 + (index // 100 % 100) * 0.00002,
+                    ),
+                }
+                for index in range(count)
+            ]
+        )
+        create_time = time.perf_counter() - start
+        start = time.perf_counter()
+        self.channel.delivery_zone = self.multipolygon
+        zone_time = time.perf_counter() - start
+        self.pickings.partner_id = partners[-1]
+        self.env.invalidate_all()
+        start = time.perf_counter()
+        query_count = self.cr.sql_log_count
+        self.pickings.assign_release_channel()
+        assign_time = time.perf_counter() - start
+        assign_queries = self.cr.sql_log_count - query_count
+        _logger.info(
+            "Partners zones of %s partners: create %.3fs, zone refresh %.3fs, "
+            "assignment of %s transfers %.3fs (%s queries)",
+            count,
+            create_time,
+            zone_time,
+            len(self.pickings),
+            assign_time,
+            assign_queries,
+        )
+
+    def test_benchmark_100000(self):
+        self._benchmark(100000)
@@ -94,3 +94,31 @@ class TestStockReleaseChannelGeoengine(TestStockReleaseChannelGeoengineCommon):
         )
         self.other_partner.in_geo_release_channel = False
         self.assertFalse(self.other_partner.located_in_stock_release_channel_ids)
+
+    def test_partner_zone_refresh(self):
+        """
+        test the partners zones are refreshed when the zone or the partner moves
+        """
+        zone_model = self.env["stock.release.channel.partner.zone"]
+        self.other_partner.geo_point = self.point1
+        self.assertEqual(
+            zone_model.search([("partner_id", "=", self.other_partner.id)]).channel_id,
+            self.channel,
+        )
+        # the zone is moved away from the partner
+        self.channel.delivery_zone = self.empty_multipolygon
+        self.assertFalse(
+            zone_model.search([("partner_id", "=", self.other_partner.id)])
+        )
+        self.assertFalse(self.other_partner.located_in_stock_release_channel_ids)
+        self.channel.delivery_zone = self.multipolygon
+        self.assertEqual(
+            self.other_partner.located_in_stock_release_channel_ids, self.channel
+        )
+        # transfers are assigned from the table
+        self.picking3.assign_release_channel()
+        self.assertEqual(self.picking3.release_channel_id, self.channel)
+        self.other_partner.in_geo_release_channel = False
+        self.assertFalse(
+            zone_model.search([("partner_id", "=", self.other_partner.id)])
+        )
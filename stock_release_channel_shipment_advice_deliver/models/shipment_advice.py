@@ -5,6 +5,7 @@ import logging
 
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
+from odoo.tools import float_compare, split_every
 
 _logger = logging.getLogger(__name__)
 
@@ -18,6 +19,21 @@ class ShipmentAdvice(models.Model):
         "auto-process",
         index=True,
     )
+    auto_process_picking_count = fields.Integer(
+        readonly=True,
+        help="Number of transfers to deliver by the automatic processing by "
+        "chunks. Written with the result of the processing, its progress is "
+        "only logged.",
+    )
+    auto_process_done_count = fields.Integer(
+        readonly=True,
+        help="Number of transfers delivered by the automatic processing by chunks",
+    )
+    auto_process_exceptions = fields.Text(
+        readonly=True,
+        help="Transfers which could not be delivered by the automatic processing "
+        "by chunks",
+    )
 
     @property
     def _is_auto_process(self) -> bool:
@@ -53,6 +69,9 @@ class ShipmentAdvice(models.Model):
         if not self.arrival_date:
             self.arrival_date = fields.Date.context_today(self)
         self.in_release_channel_auto_process = True
+        chunk_size = self.release_channel_id.shipment_advice_auto_process_chunk_size
+        if chunk_size > 0:
+            return self._auto_process_by_chunks(chunk_size)
         try:
             with self.env.cr.savepoint():
                 move_lines = self.planned_move_ids.move_line_ids
@@ -65,17 +84,120 @@ class ShipmentAdvice(models.Model):
                 self.action_done()
         except UserError as error:
             _logger.error(error)
-            self.write(
-                {
-                    "state": "error",
-                    "error_message": self._get_error_message(error, self),
-                }
+            self._auto_process_set_error(self._get_error_message(error, self))
+        return True
+
+    def _auto_process_set_error(self, error_message):
+        self.write({"state": "error", "error_message": error_message})
+        self.release_channel_id._shipment_advice_auto_process_notify_error(
+            self.error_message
+        )
+
+    def _auto_process_by_chunks(self, chunk_size):
+        """Load and deliver the transfers by chunks of ``chunk_size``
+
+        Each chunk is delivered in its own savepoint. When a chunk fails, its
+        transfers are delivered one by one so the failing ones are reported
+        in ``auto_process_exceptions`` without preventing the delivery of the
+        others, which are left out of the shipment advice. The advice is then
+        validated by ``action_done``.
+        """
+        try:
+            with self.env.cr.savepoint():
+                if self.state == "confirmed":
+                    self.action_in_progress()
+        except UserError as error:
+            _logger.error(error)
+            self._auto_process_set_error(self._get_error_message(error, self))
+            return True
+        pickings = self.planned_move_ids.move_line_ids.filtered(
+            lambda ml: ml.state not in ("done", "cancel")
+        ).picking_id
+        self.write(
+            {
+                "auto_process_picking_count": len(pickings),
+                "auto_process_done_count": 0,
+                "auto_process_exceptions": False,
+            }
+        )
+        exceptions = []
+        for picking_ids in split_every(chunk_size, pickings.ids):
+            chunk = pickings.browse(picking_ids)
+            try:
+                with self.env.cr.savepoint():
+                    self._auto_process_pickings(chunk)
+            except UserError:
+                for picking in chunk:
+                    try:
+                        with self.env.cr.savepoint():
+                            self._auto_process_pickings(picking)
+                    except UserError as error:
+                        _logger.error(error)
+                        exceptions.append(
+                            _(
+                                "- %(picking)s: %(error)s",
+                                picking=picking.display_name,
+                                error=str(error),
+                            )
+                        )
+            self.auto_process_done_count = len(
+                pickings.filtered(lambda picking: picking.state == "done")
             )
-            self.release_channel_id._shipment_advice_auto_process_notify_error(
-                self.error_message
+            _logger.info(
+                "Shipment advice %s: %s/%s transfers delivered",
+                self.name,
+                self.auto_process_done_count,
+                self.auto_process_picking_count,
+            )
+        self.auto_process_exceptions = "\n".join(exceptions) or False
+        if pickings and len(exceptions) == len(pickings):
+            self._auto_process_set_error(
+                _(
+                    "No transfer could be delivered:\n%(exceptions)s",
+                    exceptions=self.auto_process_exceptions,
+                )
             )
+            return True
+        try:
+            with self.env.cr.savepoint():
+                self.action_done()
+        except UserError as error:
+            _logger.error(error)
+            self._auto_process_set_error(self._get_error_message(error, self))
+            return True
+        self.auto_process_done_count = len(
+            pickings.filtered(lambda picking: picking.state == "done")
+        )
         return True
 
+    def _auto_process_pickings(self, pickings):
+        """Load the planned moves of the transfers and validate them
+
+        Only the transfers entirely loaded are validated here. The others
+        would get a backorder or be left open according to the backorder
+        policy applied by ``action_done``, so they are validated by it once
+        all the chunks are processed.
+        """
+        moves = self.planned_move_ids.filtered(lambda m: m.picking_id in pickings)
+        moves.move_line_ids.filtered(
+            lambda ml: ml.state not in ("done", "cancel")
+        )._load_in_shipment(self)
+        pickings.filtered(self._auto_process_is_fully_loaded)._action_done()
+
+    def _auto_process_is_fully_loaded(self, picking):
+        moves = picking.move_ids.filtered(lambda m: m.state not in ("done", "cancel"))
+        return all(
+            move.move_line_ids
+            and all(line.shipment_advice_id == self for line in move.move_line_ids)
+            and float_compare(
+                move.quantity_done,
+                move.product_uom_qty,
+                precision_rounding=move.product_uom.rounding,
+            )
+            >= 0
+            for move in moves
+        )
+
     def _postprocess_action_done(self):
         res = super()._postprocess_action_done()
         if not self.release_channel_id:
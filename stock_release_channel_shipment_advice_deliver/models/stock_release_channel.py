@@ -37,10 +37,22 @@ class StockReleaseChannel(models.Model):
         compute="_compute_is_action_delivered_allowed"
     )
     delivering_error = fields.Text(readonly=True)
+    delivered_exceptions = fields.Text(
+        readonly=True,
+        help="Transfers which could not be delivered by the automatic processing "
+        "of the shipment advices by chunks",
+    )
     in_process_shipment_advice_ids = fields.One2many(
         "shipment.advice", compute="_compute_in_process_shipment_advice_ids"
     )
     auto_deliver = fields.Boolean()
+    shipment_advice_auto_process_chunk_size = fields.Integer(
+        string="Deliver by Chunks of",
+        help="When set, the shipment advices are automatically processed by "
+        "chunks of this number of transfers. A transfer which cannot be "
+        "delivered is then reported without preventing the delivery of the "
+        "others.",
+    )
 
     @api.depends("shipment_advice_ids")
     def _compute_in_process_shipment_advice_ids(self):
@@ -197,7 +209,13 @@ class StockReleaseChannel(models.Model):
         return {}
 
     def _action_deliver(self):
-        self.write({"state": "delivering", "delivering_error": False})
+        self.write(
+            {
+                "state": "delivering",
+                "delivering_error": False,
+                "delivered_exceptions": False,
+            }
+        )
         self.with_delay(
             description=_("Delivering release channel %(name)s.", name=self.name)
         )._process_shipments()
@@ -256,6 +274,10 @@ class StockReleaseChannel(models.Model):
         not_done_states = ["confirmed", "in_progress", "in_process", "error"]
         if any(not_done_state in shipment_states for not_done_state in not_done_states):
             return
+        exceptions = self.in_process_shipment_advice_ids.filtered(
+            "auto_process_exceptions"
+        ).mapped("auto_process_exceptions")
+        self.delivered_exceptions = "\n".join(exceptions) or False
         self.action_delivered()
 
     @api.model
@@ -231,3 +231,31 @@ class TestStockReleaseChannelDeliver(TestStockReleaseChannelDeliverCommon):
         )
         wizard.with_context(test_queue_job_no_delay=True).action_deliver()
         self.assertEqual(self.channel.state, "delivered")
+
+    @mute_logger(
+        "odoo.addons.stock_release_channel_shipment_advice_deliver.models.shipment_advice"
+    )
+    def test_deliver_process_by_chunks(self):
+        """A failing transfer does not prevent the delivery of the others."""
+        self.channel.shipment_advice_auto_process_chunk_size = 2
+        self._do_internal_pickings()
+        picking = self.channel.picking_to_plan_ids[0]
+        package = self.env["stock.quant.package"].create({})
+        self.env["stock.quant"]._update_available_quantity(
+            self.product1, self.loc_stock, 2, package_id=package
+        )
+        picking.move_line_ids.result_package_id = package
+        self.channel.action_deliver()
+        self.assertEqual(self.channel.state, "delivering")
+        self.channel.with_context(test_queue_job_no_delay=True)._process_shipments()
+        shipment_advice = self.channel.shipment_advice_ids
+        self.assertEqual(shipment_advice.state, "done")
+        self.assertEqual(shipment_advice.auto_process_picking_count, 3)
+        self.assertEqual(shipment_advice.auto_process_done_count, 2)
+        self.assertIn(picking.name, shipment_advice.auto_process_exceptions)
+        self.assertEqual(picking.state, "assigned")
+        self.assertSetEqual(set((self.pickings - picking).mapped("state")), {"done"})
+        self.assertEqual(self.channel.state, "delivered")
+        self.assertEqual(
+            self.channel.delivered_exceptions, shipment_advice.auto_process_exceptions
+        )
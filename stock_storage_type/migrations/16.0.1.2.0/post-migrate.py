@@ -0,0 +1,17 @@
+# Copyright 2026 Camptocamp SA
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+
+from openupgradelib import openupgrade
+
+
+@openupgrade.migrate()
+def migrate(env, version):
+    """
+    The emptiness and the future contents of the locations are kept in
+    stock.location.occupancy, the location fields are no longer stored.
+    """
+    openupgrade.logged_query(
+        env.cr, "ALTER TABLE stock_location DROP COLUMN IF EXISTS location_is_empty"
+    )
+    for table in ("product_product_stock_location_rel", "stock_location_stock_lot_rel"):
+        openupgrade.logged_query(env.cr, f"DROP TABLE IF EXISTS {table}")
@@ -1,6 +1,9 @@
 from . import (
     product_template,
     stock_location,
+    stock_location_occupancy,
+    stock_move,
+    stock_move_line,
     stock_package_level,
     stock_package_type,
     stock_quant,
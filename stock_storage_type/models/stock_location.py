@@ -2,6 +2,7 @@
 # Copyright 2019-2021 Jacques-Etienne Baudoux (BCIM) <je@bcim.be>
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
 import logging
+from contextlib import contextmanager
 
 from psycopg2 import sql
 
@@ -10,11 +11,37 @@ from odoo.fields import Command
 from odoo.tools import float_compare, index_exists
 
 _logger = logging.getLogger(__name__)
+# fields of the locations the allowed putaway locations depend on
+STORAGE_CONFIG_FIELDS = {
+    "location_id",
+    "storage_category_id",
+    "usage",
+    "active",
+    "company_id",
+    "name",
+    "pack_putaway_strategy",
+    "package_type_putaway_sequence",
+}
 OUT_MOVE_LINE_DOMAIN = [
     ("state", "in", ("waiting", "confirmed", "partially_available", "assigned"))
 ]
 
 
+class PutawayCache:
+    """Computations shared by the putaways of a batch
+
+    The instance is carried by the context of the environment of the batch
+    (see ``StockLocation._putaway_cache``), so it is dropped with the
+    environment.
+    """
+
+    def __init__(self):
+        self.sequences = {}
+        self.leaves = {}
+        # {key: (allowed location ids, {location id: occupancy version})}
+        self.allowed = {}
+
+
 class StockLocation(models.Model):
 
     _inherit = "stock.location"
@@ -60,12 +87,10 @@ class StockLocation(models.Model):
     )
     location_is_empty = fields.Boolean(
         compute="_compute_location_is_empty",
-        store=True,
         help="technical field: True if the location is empty "
         "and there is no pending incoming products in the location. "
         " Computed only if the location needs to check for emptiness "
         '(has an "only empty" location storage type).',
-        recursive=True,
     )
     # TODO: Maybe renaming these fields as there are already such fields
     # in core but without domains. Something like 'pending_in_move_ids'
@@ -96,14 +121,12 @@ class StockLocation(models.Model):
     )
     location_will_contain_lot_ids = fields.Many2many(
         "stock.lot",
-        store=True,
         compute="_compute_location_will_contain_lot_ids",
         help="technical field: list of stock.lots in "
         "the location, either now or in pending operations",
     )
     location_will_contain_product_ids = fields.Many2many(
         "product.product",
-        store=True,
         compute="_compute_location_will_contain_product_ids",
         help="technical field: list of products in "
         "the location, either now or in pending operations",
@@ -155,6 +178,21 @@ class StockLocation(models.Model):
                 """
             )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return records
+
+    def write(self, vals):
+        if not STORAGE_CONFIG_FIELDS.isdisjoint(vals):
+            self.env["stock.location.occupancy"]._bump_config_version()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().unlink()
+
     @api.depends(
         "usage",
         "computed_storage_category_id.allow_new_product",
@@ -174,6 +212,10 @@ class StockLocation(models.Model):
                 )
                 or rec.computed_storage_category_id.allow_new_product == "same_lot"
             )
+        # the occupancy is not maintained while there is no constraint
+        self.env["stock.location.occupancy"]._mark_dirty(
+            self.filtered("do_not_mix_lots")
+        )
 
     @api.depends(
         "usage",
@@ -194,6 +236,8 @@ class StockLocation(models.Model):
                 )
                 or rec.computed_storage_category_id.allow_new_product == "empty"
             )
+        # the occupancy is not maintained while there is no constraint
+        self.env["stock.location.occupancy"]._mark_dirty(self.filtered("only_empty"))
 
     @api.depends(
         "usage",
@@ -215,6 +259,10 @@ class StockLocation(models.Model):
                 or rec.computed_storage_category_id.allow_new_product
                 in ("same", "same_lot")
             )
+        # the occupancy is not maintained while there is no constraint
+        self.env["stock.location.occupancy"]._mark_dirty(
+            self.filtered("do_not_mix_products")
+        )
 
     @api.depends(
         "location_id", "storage_category_id", "location_id.computed_storage_category_id"
@@ -272,6 +320,9 @@ class StockLocation(models.Model):
     def _should_compute_location_is_empty(self):
         return self.only_empty
 
+    def _get_occupancies(self):
+        return self.env["stock.location.occupancy"]._get_occupancies(self)
+
     @api.depends(
         "quant_ids.quantity",
         "in_move_ids",
@@ -279,19 +330,13 @@ class StockLocation(models.Model):
         "do_not_mix_products",
     )
     def _compute_location_will_contain_product_ids(self):
-        for rec in self:
-            if not rec._should_compute_will_contain_product_ids():
-                no_product = self.env["product.product"].browse()
-                rec.location_will_contain_product_ids = no_product
-            else:
-                products = (
-                    rec.mapped("quant_ids")
-                    .filtered(lambda q: q.quantity > 0)
-                    .product_id
-                    | rec.mapped("in_move_ids.product_id")
-                    | rec.mapped("in_move_line_ids.product_id")
-                )
-                rec.location_will_contain_product_ids = products
+        no_product = self.env["product.product"].browse()
+        records = self.filtered(lambda l: l._should_compute_will_contain_product_ids())
+        (self - records).location_will_contain_product_ids = no_product
+        occupancies = records._get_occupancies()
+        for rec in records:
+            product_ids = occupancies.get(rec.id, (True, [], []))[1]
+            rec.location_will_contain_product_ids = no_product.browse(product_ids)
 
     @api.depends(
         "quant_ids.quantity",
@@ -299,15 +344,13 @@ class StockLocation(models.Model):
         "do_not_mix_lots",
     )
     def _compute_location_will_contain_lot_ids(self):
-        for rec in self:
-            if not rec._should_compute_will_contain_lot_ids():
-                no_lot = self.env["stock.lot"].browse()
-                rec.location_will_contain_lot_ids = no_lot
-            else:
-                lots = rec.mapped("quant_ids").filtered(
-                    lambda q: q.quantity > 0
-                ).lot_id | rec.mapped("in_move_line_ids.lot_id")
-                rec.location_will_contain_lot_ids = lots
+        no_lot = self.env["stock.lot"].browse()
+        records = self.filtered(lambda l: l._should_compute_will_contain_lot_ids())
+        (self - records).location_will_contain_lot_ids = no_lot
+        occupancies = records._get_occupancies()
+        for rec in records:
+            lot_ids = occupancies.get(rec.id, (True, [], []))[2]
+            rec.location_will_contain_lot_ids = no_lot.browse(lot_ids)
 
     @api.depends(
         "quant_ids.quantity",
@@ -320,42 +363,38 @@ class StockLocation(models.Model):
         # No restriction should apply on customer/supplier/...
         # locations and we don't need to compute is empty
         # if there is no limit on the location
-        only_empty_locations = self.filtered(
-            lambda l: not l._should_compute_location_is_empty()
-        )
-        only_empty_locations.update({"location_is_empty": True})
-        records = self - only_empty_locations
-        if not records:
-            return
-        location_domain = [("location_id", "in", records.ids)]
-        out_qty_by_location = {}
-        qty_by_location = {}
-        for group in self.env["stock.move.line"].read_group(
-            OUT_MOVE_LINE_DOMAIN + location_domain,
-            fields=["qty_done:sum"],
-            groupby=["location_id"],
-        ):
-            location_id = group["location_id"][0]
-            out_qty_by_location[location_id] = group["qty_done"]
-        for group in self.env["stock.quant"].read_group(
-            location_domain, fields=["quantity:sum"], groupby=["location_id"]
-        ):
-            location_id = group["location_id"][0]
-            qty_by_location[location_id] = group["quantity"]
+        records = self.filtered(lambda l: l._should_compute_location_is_empty())
+        (self - records).location_is_empty = True
+        # the emptiness is kept in the occupancy table, which also enforces
+        # the concurrent transaction safety: 2 moves taking quantities in a
+        # location are executed sequentially, or the location could remain
+        # "not empty"
+        occupancies = records._get_occupancies()
         for rec in records:
-            # we do want to keep a write here even if the value is the same
-            # to enforce concurrent transaction safety: 2 moves taking
-            # quantities in a location have to be executed sequentially
-            # or the location could remain "not empty"
-            if (
-                qty_by_location.get(rec.id, 0.0) - out_qty_by_location.get(rec.id, 0.0)
-                > 0
-                or rec.in_move_ids
-                or rec.in_move_line_ids
-            ):
-                rec.location_is_empty = False
-            else:
-                rec.location_is_empty = True
+            rec.location_is_empty = occupancies.get(rec.id, (True, [], []))[0]
+
+    @api.model
+    @contextmanager
+    def _putaway_cache(self):
+        """Share the putaway computations of a batch of putaways
+
+        Yield an environment whose putaways reuse the storage sequences, the
+        sorted leaf locations and the allowed locations computed by the
+        previous putaways of the batch. As the allowed locations depend on the
+        contents of the locations, the locations whose occupancy version
+        changed since are checked again, so that a putaway takes the previous
+        ones into account. The versions are read from the database, they
+        follow the changes of quants, moves and move lines as well as the
+        rollbacks to a savepoint.
+        """
+        if self._get_putaway_cache() is not None:
+            yield self.env
+            return
+        yield self.with_context(storage_type_putaway_cache=PutawayCache()).env
+
+    @api.model
+    def _get_putaway_cache(self):
+        return self.env.context.get("storage_type_putaway_cache")
 
     # method provided by "stock_putaway_hook"
     def _putaway_strategy_finalizer(
@@ -415,11 +454,8 @@ class StockLocation(models.Model):
         # TODO: Remove this and use only putaway_location as always filled in
         dest_location = putaway_location or self
         _logger.debug("putaway location: %s", dest_location.name)
-        package_locations = self.env["stock.storage.location.sequence"].search(
-            [
-                ("package_type_id", "=", package_type.id),
-                ("location_id", "child_of", dest_location.ids),
-            ]
+        package_locations = self._get_package_type_putaway_sequences(
+            package_type, dest_location
         )
         if not package_locations:
             return dest_location
@@ -452,6 +488,22 @@ class StockLocation(models.Model):
         )
         return putaway_location
 
+    @api.model
+    def _get_package_type_putaway_sequences(self, package_type, dest_location):
+        cache = self._get_putaway_cache()
+        key = (package_type.id, dest_location.id)
+        if cache is not None and key in cache.sequences:
+            return cache.sequences[key]
+        package_locations = self.env["stock.storage.location.sequence"].search(
+            [
+                ("package_type_id", "=", package_type.id),
+                ("location_id", "child_of", dest_location.ids),
+            ]
+        )
+        if cache is not None:
+            cache.sequences[key] = package_locations
+        return package_locations
+
     def get_storage_locations(self, products=None):
         # TODO support multiple products? cf ABC
         self.ensure_one()
@@ -461,7 +513,13 @@ class StockLocation(models.Model):
             return locations
         else:
             products = products or self.env["product.product"]
+            cache = self._get_putaway_cache()
+            key = (self.id, frozenset(products.ids))
+            if cache is not None and key in cache.leaves:
+                return self.browse(cache.leaves[key])
             locations = self._get_sorted_leaf_child_locations(products)
+            if cache is not None:
+                cache.leaves[key] = locations.ids
         return locations
 
     def _get_sorted_leaf_locations_orderby(self, products):
@@ -580,6 +638,25 @@ class StockLocation(models.Model):
         """
         return self[:limit]
 
+    def _select_allowed_locations_cache_key(self, package_type, quants, products):
+        """Key of the allowed locations in the putaway cache
+
+        It must contain everything, but the contents of the locations, the
+        selection of the allowed locations depends on.
+        """
+        packages = quants.package_id
+        return (
+            tuple(self.ids),
+            package_type.id,
+            frozenset(products.ids),
+            frozenset(quants.lot_id.ids),
+            tuple(packages.mapped("height_in_m")),
+            tuple(
+                package.pack_weight_in_kg or package.estimated_pack_weight_kg
+                for package in packages
+            ),
+        )
+
     def select_allowed_locations(self, package_type, quants, products, limit=None):
         """Filter allowed locations for a storage type
 
@@ -587,6 +664,37 @@ class StockLocation(models.Model):
         putaway strategy, so beware of the return that must keep the
         same order
         """
+        cache = self._get_putaway_cache()
+        if cache is None:
+            return self._select_allowed_locations(
+                package_type, quants, products, limit=limit
+            )
+        key = self._select_allowed_locations_cache_key(package_type, quants, products)
+        versions = self.env["stock.location.occupancy"]._get_versions(self)
+        entry = cache.allowed.get(key)
+        if entry is None:
+            valid_locations = self._select_allowed_locations(
+                package_type, quants, products
+            )
+        else:
+            # only the locations whose contents changed are checked again
+            valid_ids, entry_versions = entry
+            dirty_ids = {
+                id_ for id_ in self.ids if versions.get(id_) != entry_versions.get(id_)
+            }
+            valid_locations = self.browse(valid_ids)
+            if dirty_ids:
+                checked_locations = self.browse(
+                    [id_ for id_ in self.ids if id_ in dirty_ids]
+                )._select_allowed_locations(package_type, quants, products)
+                valid_locations = self._order_allowed_locations(
+                    valid_locations.filtered(lambda l: l.id not in dirty_ids)
+                    | checked_locations
+                )
+        cache.allowed[key] = (valid_locations.ids, versions)
+        return valid_locations._select_final_valid_putaway_locations(limit=limit)
+
+    def _select_allowed_locations(self, package_type, quants, products, limit=None):
         # We have package who may be placed in a stock.location
         #
         # 1. On the stock.location there are location_storage_type and on the
@@ -0,0 +1,398 @@
+# Copyright 2026 Camptocamp SA
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+
+from odoo import api, fields, models
+
+CONFIG_KEY = "stock_storage_type.config_version"
+DIRTY_KEY = "stock_storage_type.occupancy_dirty"
+PENDING_STATES = ("waiting", "confirmed", "partially_available", "assigned")
+
+
+class StockLocationOccupancy(models.Model):
+    """Contents of the locations having storage constraints
+
+    Holds, for the locations which must be empty or must not mix products or
+    lots, whether the location is empty and the products and lots it contains
+    now or will contain once the pending operations are done. The lines are
+    refreshed for the locations whose quants, moves or move lines changed,
+    before they are read and at commit.
+
+    Refreshing the line of a location locks it: two transactions filling the
+    same location are serialized, while transactions filling different
+    locations do not wait on each other.
+
+    The lines to refresh are flagged as dirty in the table: when a savepoint
+    is rolled back after a refresh, the line gets back both its former content
+    and its flag, so it is refreshed again.
+
+    The version of a line is increased each time its content, or the quantity
+    of its quants, changes, so the results computed from the content of
+    locations can be cached, and only checked again for the locations whose
+    version changed.
+    """
+
+    _name = "stock.location.occupancy"
+    _description = "Stock Location Occupancy"
+    _log_access = False
+
+    location_id = fields.Many2one(
+        "stock.location", required=True, ondelete="cascade", readonly=True
+    )
+    is_empty = fields.Boolean(readonly=True)
+
+    _sql_constraints = [
+        (
+            "location_uniq",
+            "unique(location_id)",
+            "A location can only have one occupancy.",
+        )
+    ]
+
+    def init(self):
+        # the sets are stored as arrays, unknown by the ORM, the versions are
+        # taken from a sequence so they are never reused, even by rolled back
+        # transactions
+        self.env.cr.execute(
+            """
+            CREATE SEQUENCE IF NOT EXISTS stock_location_occupancy_version_seq;
+            ALTER TABLE stock_location_occupancy
+            ADD COLUMN IF NOT EXISTS product_ids integer[] NOT NULL DEFAULT '{}',
+            ADD COLUMN IF NOT EXISTS lot_ids integer[] NOT NULL DEFAULT '{}',
+            ADD COLUMN IF NOT EXISTS quantity numeric NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS version bigint NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS dirty boolean NOT NULL DEFAULT false;
+            CREATE INDEX IF NOT EXISTS stock_location_occupancy_dirty_index
+            ON stock_location_occupancy (location_id) WHERE dirty;
+            CREATE TABLE IF NOT EXISTS stock_storage_config_version (
+                id integer PRIMARY KEY CHECK (id = 1),
+                version bigint NOT NULL
+            );
+            INSERT INTO stock_storage_config_version (id, version)
+            VALUES (1, 0) ON CONFLICT DO NOTHING
+            """
+        )
+
+    @api.model
+    def _mark_dirty(self, locations):
+        """Flag the locations as to refresh"""
+        location_ids = [id_ for id_ in locations.ids if id_]
+        if not location_ids:
+            return
+        cr = self.env.cr
+        # the existing lines are flagged in the table, the set keeps the
+        # locations which have no line yet
+        cr.execute(
+            """
+            UPDATE stock_location_occupancy SET dirty = true
+            WHERE location_id = ANY(%s) AND NOT dirty
+            """,
+            (location_ids,),
+        )
+        dirty = cr.precommit.data.get(DIRTY_KEY)
+        if dirty is None:
+            dirty = cr.precommit.data[DIRTY_KEY] = set()
+            # the precommit data is cleared once the callbacks have run
+            cr.precommit.add(self._refresh_dirty)
+        dirty.update(location_ids)
+
+    @api.model
+    def _refresh_dirty(self):
+        dirty = self.env.cr.precommit.data.get(DIRTY_KEY)
+        location_ids = set(dirty or ())
+        if dirty:
+            dirty.clear()
+        self.env.cr.execute(
+            "SELECT location_id FROM stock_location_occupancy WHERE dirty"
+        )
+        location_ids.update(row[0] for row in self.env.cr.fetchall())
+        if location_ids:
+            self._refresh(list(location_ids))
+
+    @api.model
+    def _constrained_locations_sql(self):
+        return """
+            SELECT id FROM stock_location
+            WHERE id = ANY(%(location_ids)s)
+            AND (only_empty OR do_not_mix_products OR do_not_mix_lots)
+        """
+
+    @api.model
+    def _refresh(self, location_ids):
+        """Refresh the lines of the locations having storage constraints"""
+        self.env["stock.location"].flush_model(
+            ["only_empty", "do_not_mix_products", "do_not_mix_lots"]
+        )
+        self.env["stock.quant"].flush_model(
+            ["location_id", "product_id", "lot_id", "quantity"]
+        )
+        self.env["stock.move"].flush_model(["location_dest_id", "product_id", "state"])
+        self.env["stock.move.line"].flush_model(
+            [
+                "location_id",
+                "location_dest_id",
+                "product_id",
+                "lot_id",
+                "qty_done",
+                "state",
+            ]
+        )
+        self.env.cr.execute(
+            """
+            WITH locations AS ({locations}),
+            quants AS (
+                SELECT location_id,
+                       SUM(quantity) AS quantity,
+                       ARRAY_AGG(product_id) FILTER (WHERE quantity > 0)
+                           AS product_ids,
+                       ARRAY_AGG(lot_id) FILTER (
+                           WHERE quantity > 0 AND lot_id IS NOT NULL
+                       ) AS lot_ids
+                FROM stock_quant
+                WHERE location_id IN (SELECT id FROM locations)
+                GROUP BY location_id
+            ),
+            out_lines AS (
+                SELECT location_id, SUM(qty_done) AS qty_done
+                FROM stock_move_line
+                WHERE location_id IN (SELECT id FROM locations)
+                AND state IN %(states)s
+                GROUP BY location_id
+            ),
+            in_moves AS (
+                SELECT location_dest_id AS location_id,
+                       ARRAY_AGG(product_id) AS product_ids
+                FROM stock_move
+                WHERE location_dest_id IN (SELECT id FROM locations)
+                AND state IN %(states)s
+                GROUP BY location_dest_id
+            ),
+            in_lines AS (
+                SELECT location_dest_id AS location_id,
+                       ARRAY_AGG(product_id) AS product_ids,
+                       ARRAY_AGG(lot_id) FILTER (WHERE lot_id IS NOT NULL)
+                           AS lot_ids
+                FROM stock_move_line
+                WHERE location_dest_id IN (SELECT id FROM locations)
+                AND state IN %(states)s
+                GROUP BY location_dest_id
+            )
+            INSERT INTO stock_location_occupancy
+                (location_id, is_empty, product_ids, lot_ids, quantity, version)
+            SELECT
+                locations.id,
+                NOT (
+                    COALESCE(quants.quantity, 0) - COALESCE(out_lines.qty_done, 0) > 0
+                    OR in_moves.location_id IS NOT NULL
+                    OR in_lines.location_id IS NOT NULL
+                ),
+                ARRAY(
+                    SELECT DISTINCT unnest(
+                        COALESCE(quants.product_ids, '{{}}')
+                        || COALESCE(in_moves.product_ids, '{{}}')
+                        || COALESCE(in_lines.product_ids, '{{}}')
+                    ) ORDER BY 1
+                ),
+                ARRAY(
+                    SELECT DISTINCT unnest(
+                        COALESCE(quants.lot_ids, '{{}}')
+                        || COALESCE(in_lines.lot_ids, '{{}}')
+                    ) ORDER BY 1
+                ),
+                COALESCE(quants.quantity, 0),
+                nextval('stock_location_occupancy_version_seq')
+            FROM locations
+            LEFT JOIN quants ON quants.location_id = locations.id
+            LEFT JOIN out_lines ON out_lines.location_id = locations.id
+            LEFT JOIN in_moves ON in_moves.location_id = locations.id
+            LEFT JOIN in_lines ON in_lines.location_id = locations.id
+            ON CONFLICT (location_id) DO UPDATE
+            SET is_empty = EXCLUDED.is_empty,
+                product_ids = EXCLUDED.product_ids,
+                lot_ids = EXCLUDED.lot_ids,
+                quantity = EXCLUDED.quantity,
+                version = EXCLUDED.version
+            -- the line is locked even when its content is unchanged
+            WHERE (
+                stock_location_occupancy.is_empty,
+                stock_location_occupancy.product_ids,
+                stock_location_occupancy.lot_ids,
+                stock_location_occupancy.quantity
+            ) IS DISTINCT FROM (
+                EXCLUDED.is_empty,
+                EXCLUDED.product_ids,
+                EXCLUDED.lot_ids,
+                EXCLUDED.quantity
+            );
+            UPDATE stock_location_occupancy SET dirty = false
+            WHERE location_id = ANY(%(location_ids)s) AND dirty
+            """.format(
+                locations=self._constrained_locations_sql()
+            ),
+            {"location_ids": list(location_ids), "states": PENDING_STATES},
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _prepare_read(self, locations):
+        """Refresh the outdated lines of the locations before reading them
+
+        The lines of the locations marked as dirty are refreshed, as well as
+        the lines missing for locations having storage constraints (e.g. the
+        constraint has just been set).
+        """
+        self._refresh_dirty()
+        self.env["stock.location"].flush_model(
+            ["only_empty", "do_not_mix_products", "do_not_mix_lots"]
+        )
+        self.env.cr.execute(
+            """
+            SELECT location.id
+            FROM ({locations}) location
+            WHERE NOT EXISTS (
+                SELECT 1 FROM stock_location_occupancy occupancy
+                WHERE occupancy.location_id = location.id
+            )
+            """.format(
+                locations=self._constrained_locations_sql()
+            ),
+            {"location_ids": locations.ids},
+        )
+        missing_ids = [row[0] for row in self.env.cr.fetchall()]
+        if missing_ids:
+            self._refresh(missing_ids)
+
+    @api.model
+    def _bump_config_version(self):
+        """Give a new version to the storage configuration
+
+        Called when the locations, the storage categories and capacities or
+        the location sequences change. The transaction uses its own version
+        until it is committed, then a new version is published in its own
+        transaction: concurrent changes of the configuration do not wait on
+        each other and the results computed by other transactions with the
+        former configuration are not reused.
+        """
+        cr = self.env.cr
+        cr.execute("SELECT nextval('stock_location_occupancy_version_seq')")
+        if CONFIG_KEY not in cr.postcommit.data:
+            cr.postcommit.add(self._publish_config_version)
+        cr.postcommit.data[CONFIG_KEY] = cr.fetchone()[0]
+
+    @api.model
+    def _publish_config_version(self):
+        with self.pool.cursor() as cr:
+            cr.execute(
+                """
+                UPDATE stock_storage_config_version
+                SET version = nextval('stock_location_occupancy_version_seq')
+                """
+            )
+
+    @api.model
+    def _get_config_version(self):
+        version = self.env.cr.postcommit.data.get(CONFIG_KEY)
+        if version is None:
+            self.env.cr.execute("SELECT version FROM stock_storage_config_version")
+            version = self.env.cr.fetchone()[0]
+        return version
+
+    @api.model
+    def _get_versions(self, locations):
+        """Return {location id: version} of the locations having storage
+        constraints
+        """
+        locations = locations.browse([id_ for id_ in locations.ids if id_])
+        if not locations:
+            return {}
+        self._prepare_read(locations)
+        self.env.cr.execute(
+            """
+            SELECT location_id, version
+            FROM stock_location_occupancy
+            WHERE location_id = ANY(%s)
+            """,
+            (locations.ids,),
+        )
+        return dict(self.env.cr.fetchall())
+
+    @api.model
+    def _get_occupancies(self, locations):
+        """Return {location id: (is empty, product ids, lot ids)}
+
+        Only the locations having storage constraints are returned.
+        """
+        locations = locations.browse([id_ for id_ in locations.ids if id_])
+        if not locations:
+            return {}
+        self._prepare_read(locations)
+        self.env.cr.execute(
+            """
+            SELECT location_id, is_empty, product_ids, lot_ids
+            FROM stock_location_occupancy
+            WHERE location_id = ANY(%s)
+            """,
+            (locations.ids,),
+        )
+        return {row[0]: row[1:] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _domain_locations(self, candidate_locations, condition, params):
+        """Domain selecting the candidate locations matching the condition
+
+        The condition is a SQL expression on the location (aliased
+        ``location``) and its occupancy (aliased ``occupancy``, NULL for the
+        locations without storage constraint).
+        """
+        self._prepare_read(candidate_locations)
+        query = """
+            SELECT location.id
+            FROM stock_location location
+            LEFT JOIN stock_location_occupancy occupancy
+            ON occupancy.location_id = location.id
+            WHERE location.id = ANY(%s)
+            AND ({condition})
+        """.format(
+            condition=condition
+        )
+        return [("id", "inselect", (query, [candidate_locations.ids] + params))]
+
+    @api.model
+    def _domain_empty_locations(self, candidate_locations):
+        return self._domain_locations(
+            candidate_locations,
+            "NOT location.only_empty OR occupancy.is_empty IS NOT false",
+            [],
+        )
+
+    @api.model
+    def _domain_product_locations(self, candidate_locations, products):
+        """Locations which contain one of the products, or no product
+
+        Ideally, we would like a strict comparison: if we do not mix
+        products, we should be able to filter on the product. Here, if we can
+        create a move for product B and set it's destination in a location
+        already used by product A, then all the new moves for product B will
+        be allowed in the location.
+        """
+        return self._domain_locations(
+            candidate_locations,
+            """
+            NOT location.do_not_mix_products
+            OR COALESCE(cardinality(occupancy.product_ids), 0) = 0
+            OR occupancy.product_ids && %s::integer[]
+            """,
+            [products.ids],
+        )
+
+    @api.model
+    def _domain_lot_locations(self, candidate_locations, lots):
+        """Locations which contain one of the lots, or no lot"""
+        return self._domain_locations(
+            candidate_locations,
+            """
+            NOT location.do_not_mix_lots
+            OR COALESCE(cardinality(occupancy.lot_ids), 0) = 0
+            OR occupancy.lot_ids && %s::integer[]
+            """,
+            [lots.ids],
+        )
@@ -0,0 +1,38 @@
+# Copyright 2026 Camptocamp SA
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+
+from odoo import api, models
+
+OCCUPANCY_FIELDS = {"location_dest_id", "product_id", "state"}
+
+
+class StockMove(models.Model):
+
+    _inherit = "stock.move"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._mark_occupancy_dirty()
+        return records
+
+    def write(self, vals):
+        occupancy_changed = not OCCUPANCY_FIELDS.isdisjoint(vals)
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
+        res = super().write(vals)
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
+        return res
+
+    def unlink(self):
+        self._mark_occupancy_dirty()
+        return super().unlink()
+
+    def _mark_occupancy_dirty(self):
+        # the state of the move lines follows the state of their move
+        self.env["stock.location.occupancy"]._mark_dirty(
+            self.location_dest_id
+            | self.move_line_ids.location_id
+            | self.move_line_ids.location_dest_id
+        )
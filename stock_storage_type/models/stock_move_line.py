@@ -0,0 +1,46 @@
+# Copyright 2026 Camptocamp SA
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+
+from odoo import api, models
+
+OCCUPANCY_FIELDS = {
+    "location_id",
+    "location_dest_id",
+    "product_id",
+    "lot_id",
+    "qty_done",
+    "move_id",
+}
+
+
+class StockMoveLine(models.Model):
+
+    _inherit = "stock.move.line"
+
+    def _apply_putaway_strategy(self):
+        with self.env["stock.location"]._putaway_cache() as env:
+            return super(StockMoveLine, self.with_env(env))._apply_putaway_strategy()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._mark_occupancy_dirty()
+        return records
+
+    def write(self, vals):
+        occupancy_changed = not OCCUPANCY_FIELDS.isdisjoint(vals)
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
+        res = super().write(vals)
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
+        return res
+
+    def unlink(self):
+        self._mark_occupancy_dirty()
+        return super().unlink()
+
+    def _mark_occupancy_dirty(self):
+        self.env["stock.location.occupancy"]._mark_dirty(
+            self.location_id | self.location_dest_id
+        )
@@ -1,7 +1,7 @@
 # Copyright 2020 Camptocamp SA
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
 
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 
 
 class StockPackageLevel(models.Model):
@@ -35,17 +35,29 @@ class StockPackageLevel(models.Model):
         We compute here a recordset that will be used in a domain like
         [("id", "in", allowed_location_dest_ids)]
         """
+        occupancy_model = self.env["stock.location.occupancy"]
+        child_locations = {}
+        versions = {}
         for pack_level in self:
-            picking_child_location_dest_ids = self.env["stock.location"].search(
-                [("id", "child_of", pack_level.picking_id.location_dest_id.id)]
-            )
+            dest_location = pack_level.picking_id.location_dest_id
+            if dest_location not in child_locations:
+                child_locations[dest_location] = self.env["stock.location"].search(
+                    [("id", "child_of", dest_location.id)]
+                )
+            picking_child_location_dest_ids = child_locations[dest_location]
             # For outgoing type, we don't set the location dest so avoid
             # computing the domain
             if (
                 pack_level.package_id.package_type_id
                 and pack_level.picking_type_code != "outgoing"
             ):
-                allowed_locations = pack_level._get_allowed_location_dest_ids()
+                if dest_location and dest_location not in versions:
+                    versions[dest_location] = occupancy_model._get_versions(
+                        picking_child_location_dest_ids
+                    )
+                allowed_locations = pack_level._get_allowed_location_dest_ids(
+                    versions=versions.get(dest_location)
+                )
                 # TODO check if intersect is needed as we use picking dest loc
                 #  in _get_allowed_location_dest_ids
                 intersect_locations = (
@@ -62,7 +74,77 @@ class StockPackageLevel(models.Model):
             else:
                 pack_level.allowed_location_dest_ids = picking_child_location_dest_ids
 
-    def _get_allowed_location_dest_ids(self):
+    def _get_allowed_location_dest_ids_cache_key(self, config_version):
+        """Key of the allowed destinations in the cache
+
+        The allowed destinations are shared by the package levels of the same
+        package type, products, lots and package dimensions going to the same
+        destination, until the storage configuration changes (locations,
+        storage categories and capacities, location sequences).
+        """
+        package = self.package_id
+        return (
+            package.package_type_id.id,
+            self.picking_id.location_dest_id.id,
+            tuple(sorted(set(self.move_line_ids.product_id.ids))),
+            tuple(sorted(set(package.quant_ids.lot_id.ids))),
+            package.height_in_m,
+            package.pack_weight_in_kg or package.estimated_pack_weight_kg,
+            config_version,
+        )
+
+    def _get_allowed_location_dest_ids(self, versions=None):
+        """Return the allowed destinations, from the cache when possible
+
+        ``versions`` are the versions of the occupancies of the locations
+        under the destination (see ``stock.location.occupancy``): the cached
+        destinations are only checked again for the locations whose version
+        changed since they were computed.
+        """
+        dest_location = self.picking_id.location_dest_id
+        if not dest_location:
+            return self._compute_allowed_location_dest_ids_for_key()
+        occupancy_model = self.env["stock.location.occupancy"]
+        if versions is None:
+            versions = occupancy_model._get_versions(
+                dest_location.search([("id", "child_of", dest_location.id)])
+            )
+        key = self._get_allowed_location_dest_ids_cache_key(
+            occupancy_model._get_config_version()
+        )
+        entry = self._get_cached_allowed_location_dest_entry(key)
+        cached = entry.get("allowed")
+        if cached is None:
+            allowed_ids = set(self._compute_allowed_location_dest_ids_for_key().ids)
+        else:
+            cached_ids, cached_versions = cached
+            dirty_ids = {
+                id_
+                for id_ in versions.keys() | cached_versions.keys()
+                if versions.get(id_) != cached_versions.get(id_)
+            }
+            allowed_ids = cached_ids - dirty_ids
+            if dirty_ids:
+                allowed_ids |= set(
+                    self._compute_allowed_location_dest_ids_for_key(
+                        location_ids=dirty_ids
+                    ).ids
+                )
+        # replaced at once, the entry is shared by the threads of the worker
+        entry["allowed"] = (frozenset(allowed_ids), versions)
+        return self.env["stock.location"].browse(sorted(allowed_ids))
+
+    @tools.ormcache("self.env.uid", "tuple(self.env.companies.ids)", "key")
+    def _get_cached_allowed_location_dest_entry(self, key):
+        # the allowed destinations only depend on the key, the entry is shared
+        # by the package levels having this key
+        return {}
+
+    def _compute_allowed_location_dest_ids_for_key(self, location_ids=None):
+        """Compute the allowed destinations
+
+        Only the locations in ``location_ids`` are checked when given.
+        """
         package_locations = self.env["stock.storage.location.sequence"].search(
             [
                 (
@@ -78,6 +160,10 @@ class StockPackageLevel(models.Model):
         for pack_loc in package_locations:
             pref_loc = pack_loc.location_id
             storage_locations = pref_loc.get_storage_locations(products=products)
+            if location_ids is not None:
+                storage_locations = storage_locations.filtered(
+                    lambda l: l.id in location_ids
+                )
             allowed_locations = storage_locations.select_allowed_locations(
                 self.package_id.package_type_id,
                 self.package_id.quant_ids,
@@ -87,6 +173,16 @@ class StockPackageLevel(models.Model):
         return self.env["stock.location"].browse(all_allowed_locations)
 
     def recompute_pack_putaway(self):
+        """Recompute the putaway destination of the package levels
+
+        The levels are put away one after the other in a shared putaway
+        cache, each one taking the destinations of the previous ones into
+        account.
+        """
+        with self.env["stock.location"]._putaway_cache() as env:
+            self.with_env(env)._recompute_pack_putaway()
+
+    def _recompute_pack_putaway(self):
         for level in self:
             if not level.package_id.quant_ids:
                 continue
@@ -3,6 +3,8 @@
 from odoo import _, api, models
 from odoo.exceptions import ValidationError
 
+OCCUPANCY_FIELDS = {"location_id", "product_id", "lot_id", "quantity"}
+
 
 class StockQuant(models.Model):
 
@@ -14,12 +16,22 @@ class StockQuant(models.Model):
         Check if at least one storage capacity allows the package type
         into the quant's location
         """
-        for quant in self:
+        quants = self.filtered(
+            lambda q: q.package_id.package_type_id
+            and q.location_id.computed_storage_category_id.capacity_ids
+        )
+        if not quants:
+            return
+        contents = quants._get_storage_location_contents()
+        checked = set()
+        for quant in quants:
             location = quant.location_id
             package_type = quant.package_id.package_type_id
             storage_capacities = location.computed_storage_category_id.capacity_ids
-            if not quant.package_id or not package_type or not storage_capacities:
+            # the checks only depend on the package and its location
+            if (quant.package_id, location) in checked:
                 continue
+            checked.add((quant.package_id, location))
             allowed_capacities = storage_capacities.filtered(
                 lambda capacity: package_type == capacity.package_type_id
             )
@@ -35,18 +47,21 @@ class StockQuant(models.Model):
                 quant.package_id.pack_weight_in_kg
                 or quant.package_id.estimated_pack_weight_kg
             )
-            package_quants = quant.package_id.mapped("quant_ids")
-            package_products = package_quants.mapped("product_id")
-            package_lots = package_quants.mapped("lot_id")
-            other_quants_in_location = self.search(
-                [
-                    ("location_id", "=", location.id),
-                    ("id", "not in", package_quants.ids),
-                    ("quantity", ">", 0),
-                ]
-            )
-            products_in_location = other_quants_in_location.mapped("product_id")
-            lots_in_location = other_quants_in_location.mapped("lot_id")
+            package_quants = quant.package_id.quant_ids
+            package_products = set(package_quants.product_id.ids)
+            package_lots = set(package_quants.lot_id.ids)
+            # content of the location, apart from the package
+            other_quants_in_location = False
+            products_in_location = set()
+            lots_in_location = set()
+            for package_id, (product_ids, lot_ids) in contents.get(
+                location.id, {}
+            ).items():
+                if package_id == quant.package_id.id:
+                    continue
+                other_quants_in_location = True
+                products_in_location.update(product_ids)
+                lots_in_location.update(lot_ids)
             capacity_fails = []
             for capacity in allowed_capacities:
                 # Check content constraints
@@ -138,17 +153,57 @@ class StockQuant(models.Model):
                     )
                 )
 
+    def _get_storage_location_contents(self):
+        """Return the content of the locations of the quants, by package
+
+        Return {location id: {package id: (product ids, lot ids)}}, computed
+        from the quants having a positive quantity, in a single query for all
+        the locations.
+        """
+        self.flush_model(
+            ["location_id", "package_id", "product_id", "lot_id", "quantity"]
+        )
+        self.env.cr.execute(
+            """
+            SELECT location_id, package_id,
+                   ARRAY_AGG(DISTINCT product_id),
+                   ARRAY_REMOVE(ARRAY_AGG(DISTINCT lot_id), NULL)
+            FROM stock_quant
+            WHERE location_id = ANY(%s)
+            AND quantity > 0
+            GROUP BY location_id, package_id
+            """,
+            (self.location_id.ids,),
+        )
+        contents = {}
+        for location_id, package_id, product_ids, lot_ids in self.env.cr.fetchall():
+            contents.setdefault(location_id, {})[package_id] = (product_ids, lot_ids)
+        return contents
+
     def write(self, vals):
+        occupancy_changed = not OCCUPANCY_FIELDS.isdisjoint(vals)
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
         res = super().write(vals)
         self._invalidate_package_level_allowed_location_dest_ids()
+        if occupancy_changed:
+            self._mark_occupancy_dirty()
         return res
 
     @api.model_create_multi
     def create(self, vals_list):
         res = super().create(vals_list)
         self._invalidate_package_level_allowed_location_dest_ids()
+        res._mark_occupancy_dirty()
         return res
 
+    def unlink(self):
+        self._mark_occupancy_dirty()
+        return super().unlink()
+
+    def _mark_occupancy_dirty(self):
+        self.env["stock.location.occupancy"]._mark_dirty(self.location_id)
+
     def _invalidate_package_level_allowed_location_dest_ids(self):
         self.env["stock.package_level"].invalidate_model(
             fnames=["allowed_location_dest_ids"]
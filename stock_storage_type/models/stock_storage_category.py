@@ -73,6 +73,20 @@ class StockStorageCategory(models.Model):
         ),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return records
+
+    def write(self, vals):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().unlink()
+
     @api.depends("max_height", "length_uom_id")
     def _compute_max_height_in_m(self):
         uom_m = self.env.ref("uom.product_uom_meter")
@@ -26,6 +26,20 @@ class StorageCategoryProductCapacity(models.Model):
         help="Technical: This is used to check if we need to display warning message",
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return records
+
+    def write(self, vals):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().unlink()
+
     @api.model
     def _get_display_name_attributes(self):
         """
@@ -66,21 +80,13 @@ class StorageCategoryProductCapacity(models.Model):
                 ]
             )
 
-    def _get_product_location_domain(self, products):
+    def _get_product_location_domain(self, candidate_locations, products):
         """
         Helper to get products location domain
         """
-        return [
-            "|",
-            # Ideally, we would like a domain which is a strict comparison:
-            # if we do not mix products, we should be able to filter on ==
-            # product.id. Here, if we can create a move for product B and
-            # set it's destination in a location already used by product A,
-            # then all the new moves for product B will be allowed in the
-            # location.
-            ("location_will_contain_product_ids", "in", products.ids),
-            ("location_will_contain_product_ids", "=", False),
-        ]
+        return self.env["stock.location.occupancy"]._domain_product_locations(
+            candidate_locations, products
+        )
 
     def _domain_location_storage_type(self, candidate_locations, quants, products):
         """
@@ -93,19 +99,23 @@ class StorageCategoryProductCapacity(models.Model):
             ("id", "in", candidate_locations.ids),
             ("computed_storage_category_id.capacity_ids", "in", self.ids),
         ]
+        occupancy_model = self.env["stock.location.occupancy"]
         # Build the domain using the 'allow_new_product' field
         if self.allow_new_product == "empty":
-            location_domain.append(("location_is_empty", "=", True))
+            location_domain += occupancy_model._domain_empty_locations(
+                candidate_locations
+            )
         elif self.allow_new_product == "same":
-            location_domain += self._get_product_location_domain(products)
+            location_domain += self._get_product_location_domain(
+                candidate_locations, products
+            )
         elif self.allow_new_product == "same_lot":
             lots = quants.mapped("lot_id")
             # As same lot should filter also on same product
-            location_domain += self._get_product_location_domain(products)
-            location_domain += [
-                "|",
-                # same comment as for the products
-                ("location_will_contain_lot_ids", "in", lots.ids),
-                ("location_will_contain_lot_ids", "=", False),
-            ]
+            location_domain += self._get_product_location_domain(
+                candidate_locations, products
+            )
+            location_domain += occupancy_model._domain_lot_locations(
+                candidate_locations, lots
+            )
         return location_domain
@@ -1,6 +1,6 @@
 # Copyright 2019 Camptocamp SA
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
-from odoo import _, fields, models
+from odoo import _, api, fields, models
 
 
 class StockStorageLocationSequence(models.Model):
@@ -24,6 +24,20 @@ class StockStorageLocationSequence(models.Model):
         relation="stock_location_sequence_cond_rel",
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return records
+
+    def write(self, vals):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["stock.location.occupancy"]._bump_config_version()
+        return super().unlink()
+
     def _format_package_storage_type_message(self, last=False):
         self.ensure_one()
         # TODO improve ugly code
@@ -3,6 +3,7 @@ from . import (
     test_package_height_required,
     test_package_type_message,
     test_stock_location,
+    test_storage_capacity_benchmark,
     test_storage_type,
     test_storage_type_move,
     test_storage_type_putaway_strategy,
@@ -1,5 +1,7 @@
 # Copyright 2020 Camptocamp SA
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+from odoo.exceptions import ValidationError
+
 from .common import TestStorageTypeCommon
 
 
@@ -291,3 +293,65 @@ class TestStockLocation(TestStorageTypeCommon):
             lambda c: c.allow_new_product == "empty"
         ).allow_new_product = "mixed"
         self.assertTrue(location.location_is_empty)
+
+    def test_location_occupancy(self):
+        location = self.pallets_reserve_bin_1_location
+        other_location = self.pallets_reserve_bin_2_location
+        occupancy_model = self.env["stock.location.occupancy"]
+        candidates = location | other_location
+        self.assertEqual(
+            location.search(occupancy_model._domain_empty_locations(candidates)),
+            candidates,
+        )
+        self._update_qty_in_location(location, self.product, 10)
+        occupancies = occupancy_model._get_occupancies(candidates)
+        self.assertEqual(occupancies[location.id], (False, [self.product.id], []))
+        self.assertEqual(occupancies[other_location.id], (True, [], []))
+        self.assertEqual(
+            location.search(occupancy_model._domain_empty_locations(candidates)),
+            other_location,
+        )
+        # the pending incoming moves fill the location as well
+        move = self.env["stock.move"].create(
+            {
+                "name": "test",
+                "product_id": self.product2.id,
+                "location_id": self.stock_location.id,
+                "location_dest_id": other_location.id,
+                "product_uom": self.product2.uom_id.id,
+                "product_uom_qty": 10,
+            }
+        )
+        move._action_confirm()
+        self.assertFalse(other_location.location_is_empty)
+        self.assertFalse(
+            location.search(occupancy_model._domain_empty_locations(candidates))
+        )
+
+    def test_location_occupancy_savepoint(self):
+        location = self.pallets_reserve_bin_1_location
+        occupancy_model = self.env["stock.location.occupancy"]
+        occupancy_model._get_occupancies(location)
+        self._update_qty_in_location(location, self.product, 10)
+        # the line refreshed in a rolled back savepoint is refreshed again
+        with self.env.cr.savepoint() as savepoint:
+            occupancy_model._get_occupancies(location)
+            savepoint.close(rollback=True)
+        self.assertEqual(
+            occupancy_model._get_occupancies(location)[location.id],
+            (False, [self.product.id], []),
+        )
+
+    def test_check_storage_capacities_mixed_products(self):
+        location = self.cardboxes_bin_1_location
+        self.cardboxes_location_storage_type.allow_new_product = "same"
+        package_model = self.env["stock.quant.package"]
+        package_type = self.cardboxes_package_storage_type
+        package = package_model.create({"package_type_id": package_type.id})
+        self._update_qty_in_location(location, self.product, 10, package=package)
+        # another package of the same product is accepted
+        package = package_model.create({"package_type_id": package_type.id})
+        self._update_qty_in_location(location, self.product, 10, package=package)
+        package = package_model.create({"package_type_id": package_type.id})
+        with self.assertRaisesRegex(ValidationError, "'do not mix products'"):
+            self._update_qty_in_location(location, self.product2, 10, package=package)
@@ -0,0 +1,78 @@
+# Copyright 2026 Camptocamp SA
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+
+import logging
+import time
+
+from odoo.tests import tagged
+
+from .common import TestStorageTypeCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged("-standard", "storage_capacity_benchmark")
+class TestStorageCapacityBenchmark(TestStorageTypeCommon):
+    """Measure the storage capacities check on large pallet receipts
+
+    Not part of the standard tests, run with
+    ``--test-tags storage_capacity_benchmark``.
+    """
+
+    def _receive_pallets(self, count):
+        """Create the quants of ``count`` pallets spread over the bins"""
+        self.pallets_location_storage_type.allow_new_product = "same"
+        bins = self.env["stock.location"].create(
+            [
+                {
+                    "name": "Benchmark bin %s" % index,
+                    "location_id": self.pallets_location.id,
+                }
+                for index in range(count // 10)
+            ]
+        )
+        packages = self.env["stock.quant.package"].create(
+            [
+                {"package_type_id": self.pallets_package_storage_type.id}
+                for __ in range(count)
+            ]
+        )
+        quant_model = self.env["stock.quant"]
+        for index, package in enumerate(packages):
+            quant_model._update_available_quantity(
+                self.product, bins[index % len(bins)], 10, package_id=package
+            )
+        quants = quant_model.search([("package_id", "in", packages.ids)])
+        return quants
+
+    def _benchmark(self, count):
+        quants = self._receive_pallets(count)
+        # check all the quants at once, as when validating a receipt
+        self.env.invalidate_all()
+        start = time.perf_counter()
+        query_count = self.cr.sql_log_count
+        quants._check_storage_capacities()
+        batch_time = time.perf_counter() - start
+        batch_queries = self.cr.sql_log_count - query_count
+        self.env.invalidate_all()
+        start = time.perf_counter()
+        query_count = self.cr.sql_log_count
+        for quant in quants:
+            quant._check_storage_capacities()
+        single_time = time.perf_counter() - start
+        single_queries = self.cr.sql_log_count - query_count
+        _logger.info(
+            "Storage capacities check of %s pallets: "
+            "batch %.3fs (%s queries), one by one %.3fs (%s queries)",
+            count,
+            batch_time,
+            batch_queries,
+            single_time,
+            single_queries,
+        )
+
+    def test_benchmark_500(self):
+        self._benchmark(500)
+
+    def test_benchmark_5000(self):
+        self._benchmark(5000)
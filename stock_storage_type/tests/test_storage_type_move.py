@@ -1,5 +1,7 @@
 # Copyright 2020 Camptocamp SA
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+from unittest import mock
+
 from odoo.exceptions import ValidationError
 from odoo.tools.safe_eval import const_eval
 
@@ -466,3 +468,44 @@ class TestStorageTypeMove(TestStorageTypeCommon):
             len(set(lot_ids)),
             len(lot_ids),
         )
+
+    def test_package_level_allowed_location_dest_cache(self):
+        self.pallets_location_storage_type.write({"allow_new_product": "empty"})
+        move = self._test_confirmed_move()
+        picking = move.picking_id
+        picking._check_entire_pack()
+        level = picking.package_level_ids
+        self.assertEqual(len(level), 1)
+        level_model = type(level)
+        level.clear_caches()
+        with mock.patch.object(
+            level_model,
+            "_compute_allowed_location_dest_ids_for_key",
+            autospec=True,
+            side_effect=level_model._compute_allowed_location_dest_ids_for_key,
+        ) as compute:
+            allowed_locations = level.allowed_location_dest_ids
+            self.assertEqual(compute.call_count, 1)
+            # computed once for any read until a location changes
+            level.invalidate_recordset(["allowed_location_dest_ids"])
+            self.assertEqual(level.allowed_location_dest_ids, allowed_locations)
+            self.assertEqual(compute.call_count, 1)
+            # filling an empty location computes them again
+            location = (allowed_locations - level.location_dest_id)[0]
+            self._update_qty_in_location(location, self.product, 1.0)
+            level.invalidate_recordset(["allowed_location_dest_ids"])
+            self.assertNotIn(location, level.allowed_location_dest_ids)
+            self.assertEqual(compute.call_count, 2)
+            # only the filled location is checked again
+            self.assertEqual(compute.call_args.kwargs["location_ids"], {location.id})
+
+    def test_storage_config_version(self):
+        occupancy_model = self.env["stock.location.occupancy"]
+        version = occupancy_model._get_config_version()
+        # each change of the configuration gives a new version, even in the
+        # same transaction
+        self.pallets_location_storage_type.write({"allow_new_product": "empty"})
+        new_version = occupancy_model._get_config_version()
+        self.assertNotEqual(new_version, version)
+        self.pallets_location_storage_type.write({"allow_new_product": "mixed"})
+        self.assertNotEqual(occupancy_model._get_config_version(), new_version)
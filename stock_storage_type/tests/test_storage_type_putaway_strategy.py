@@ -1,5 +1,7 @@
 # Copyright 2019 Camptocamp SA
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl)
+from unittest import mock
+
 from .common import TestStorageTypeCommon
 
 
@@ -812,3 +814,93 @@ class TestPutawayStorageTypeStrategy(TestStorageTypeCommon):
             "the move line's destination must stay in Stock as we have"
             " a 'none' strategy on it and it is in the sequence",
         )
+
+    def test_storage_strategy_putaway_cache(self):
+        self.pallets_location_storage_type.write({"allow_new_product": "empty"})
+        location_model = self.env["stock.location"]
+        quants = self.env["stock.quant"].browse()
+        with location_model._putaway_cache() as env:
+            pallets_location = self.pallets_location.with_env(env)
+            storage_locations = pallets_location.get_storage_locations(
+                products=self.product
+            )
+            location = storage_locations.select_first_allowed_location(
+                self.pallets_package_storage_type, quants, self.product
+            )
+            self.assertEqual(location, self.pallets_bin_1_location)
+            with mock.patch.object(
+                type(location_model),
+                "_select_allowed_locations",
+                autospec=True,
+                side_effect=type(location_model)._select_allowed_locations,
+            ) as select_mock:
+                # the allowed locations are read from the cache
+                location = storage_locations.select_first_allowed_location(
+                    self.pallets_package_storage_type, quants, self.product
+                )
+                self.assertEqual(location, self.pallets_bin_1_location)
+                select_mock.assert_not_called()
+                # only the location whose contents changed is checked again
+                self.env["stock.quant"].with_env(env)._update_available_quantity(
+                    self.product, self.pallets_bin_1_location, 1.0
+                )
+                location = storage_locations.select_first_allowed_location(
+                    self.pallets_package_storage_type, quants, self.product
+                )
+                self.assertEqual(location, self.pallets_bin_2_location)
+                self.assertEqual(select_mock.call_count, 1)
+                self.assertEqual(
+                    select_mock.call_args[0][0], self.pallets_bin_1_location
+                )
+        self.assertIsNone(location_model._get_putaway_cache())
+
+    def _putaway_cache_first_location(self, env):
+        storage_locations = self.pallets_location.with_env(env).get_storage_locations(
+            products=self.product
+        )
+        return storage_locations.select_first_allowed_location(
+            self.pallets_package_storage_type,
+            self.env["stock.quant"].browse(),
+            self.product,
+        )
+
+    def test_storage_strategy_putaway_cache_savepoint_rollback(self):
+        self.pallets_location_storage_type.write({"allow_new_product": "empty"})
+        with self.env["stock.location"]._putaway_cache() as env:
+            self.assertEqual(
+                self._putaway_cache_first_location(env), self.pallets_bin_1_location
+            )
+            savepoint = self.env.cr.savepoint()
+            self.env["stock.quant"].with_env(env)._update_available_quantity(
+                self.product, self.pallets_bin_1_location, 1.0
+            )
+            self.assertEqual(
+                self._putaway_cache_first_location(env), self.pallets_bin_2_location
+            )
+            savepoint.close(rollback=True)
+            # the location is empty again
+            self.assertEqual(
+                self._putaway_cache_first_location(env), self.pallets_bin_1_location
+            )
+
+    def test_storage_strategy_putaway_cache_moves(self):
+        self.pallets_location_storage_type.write({"allow_new_product": "empty"})
+        with self.env["stock.location"]._putaway_cache() as env:
+            self.assertEqual(
+                self._putaway_cache_first_location(env), self.pallets_bin_1_location
+            )
+            # a pending move to the location makes it not empty
+            move = self.env["stock.move"].create(
+                {
+                    "name": self.product.name,
+                    "location_id": self.suppliers_location.id,
+                    "location_dest_id": self.pallets_bin_1_location.id,
+                    "product_id": self.product.id,
+                    "product_uom_qty": 1.0,
+                    "product_uom": self.product.uom_id.id,
+                }
+            )
+            move._action_confirm()
+            self.assertEqual(
+                self._putaway_cache_first_location(env), self.pallets_bin_2_location
+            )
@@ -11,18 +11,14 @@ class StockMove(models.Model):
     def _action_confirm(self, merge=True, merge_into=False):
         # Apply the flow configuration on the move before it generates
         # its chained moves (if any)
-        FLOW = self.env["stock.warehouse.flow"]
-        move_ids_to_confirm = []
-        for move in self:
-            if not move._apply_flow_on_action_confirm():
-                move_ids_to_confirm.append(move.id)
-                continue
-            # Do not assign a picking within the _apply_on_move method
-            # because it gets called later from _action_confirm itself
-            move_ids_to_confirm += FLOW._search_and_apply_for_move(
-                move, assign_picking=False
-            ).ids
-        moves_to_confirm = self.browse(move_ids_to_confirm)
+        moves_with_flow = self.filtered(lambda m: m._apply_flow_on_action_confirm())
+        # Do not assign a picking within the _apply_on_moves method
+        # because it gets called later from _action_confirm itself
+        moves_with_flow = self.env["stock.warehouse.flow"]._search_and_apply_for_moves(
+            moves_with_flow, assign_picking=False
+        )
+        # the moves split by the flows are confirmed after the others
+        moves_to_confirm = self | moves_with_flow
         return super(StockMove, moves_to_confirm)._action_confirm(
             merge=merge, merge_into=merge_into
         )
@@ -7,7 +7,7 @@ import logging
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
 from odoo.osv import expression
-from odoo.tools import float_compare
+from odoo.tools import float_compare, groupby
 from odoo.tools.safe_eval import safe_eval
 
 logger = logging.getLogger(__name__)
@@ -397,12 +397,15 @@ class StockWarehouseFlow(models.Model):
         return expression.AND([domain, qty_uom_domain])
 
     def _is_domain_valid_for_move(self, move):
+        return self._is_domain_valid_for_moves(move)
+
+    def _is_domain_valid_for_moves(self, moves):
         if not self.move_domain:
-            return move
+            return moves
         domain = safe_eval(self.move_domain or "[]")
         if not domain:
-            return move
-        return move.filtered_domain(domain)
+            return moves
+        return moves.filtered_domain(domain)
 
     def _is_qty_valid_for_move(self, move):
         if not self.qty:
@@ -416,10 +419,16 @@ class StockWarehouseFlow(models.Model):
 
     def _is_valid_for_move(self, move):
         self.ensure_one()
-        move = self._is_domain_valid_for_move(move)
-        if not move:
-            return move
-        return self._is_qty_valid_for_move(move)
+        return self._is_valid_for_moves(move)
+
+    def _is_valid_for_moves(self, moves):
+        """Return the moves the flow can be applied on
+
+        The domain of the flow is evaluated once for all the moves.
+        """
+        self.ensure_one()
+        moves = self._is_domain_valid_for_moves(moves)
+        return moves.filtered(lambda move: self._is_qty_valid_for_move(move))
 
     @api.model
     def _search_for_move(self, move):
@@ -427,32 +436,79 @@ class StockWarehouseFlow(models.Model):
         domain = self._search_for_move_domain(move)
         return self.search(domain)
 
+    @api.model
+    def _get_flows_group_key(self, move):
+        """Key of the moves sharing the same candidate flows
+
+        It must match the criteria of ``_search_for_move_domain``.
+        """
+        return (
+            move.picking_type_id,
+            move.group_id.carrier_id,
+            move.product_uom_category_id,
+        )
+
     @api.model
     def _search_and_apply_for_move(self, move, assign_picking=True):
         move.ensure_one()
-        flows = self._search_for_move(move)
-        if not flows:
-            return move
-        return flows.apply_on_move(move, assign_picking)
+        return self._search_and_apply_for_moves(move, assign_picking=assign_picking)
+
+    @api.model
+    def _search_and_apply_for_moves(self, moves, assign_picking=True):
+        """Apply the matching flows on the moves
+
+        The candidate flows are searched once per group of moves sharing the
+        same operation type, carrier and unit of measure category, then
+        applied on the whole group (see ``apply_on_moves``).
+
+        Return the moves including the moves split by the flows.
+        """
+        result = moves.browse()
+        for __, group in groupby(moves, key=self._get_flows_group_key):
+            group_moves = moves.browse([move.id for move in group])
+            flows = self._search_for_move(group_moves[0])
+            if not flows:
+                result |= group_moves
+                continue
+            result |= flows.apply_on_moves(group_moves, assign_picking)
+        return result
 
     def apply_on_move(self, move, assign_picking=True):
-        move_ids = []
+        return self.apply_on_moves(move, assign_picking=assign_picking)
+
+    def apply_on_moves(self, moves, assign_picking=True):
+        """Apply on each move the first flow valid for it
+
+        The flows are tried in order, each one on all the moves for which no
+        flow has been found yet. The moves split by a flow get the other
+        flows applied on them.
+
+        Return the moves including the moves split by the flows.
+        """
         flows = self
-        for flow in self:
-            if not flow._is_valid_for_move(move):
+        result = moves
+        remaining_moves = moves
+        for flow in flows:
+            if not remaining_moves:
+                break
+            flow_moves = flow._is_valid_for_moves(remaining_moves)
+            if not flow_moves:
                 continue
-            move_ids.append(move.id)
-            split_moves = flow.split_move(move)
-            # Try to apply the rest of the flows to the split move
-            for split_move in split_moves:
-                move_ids += (flows - flow).apply_on_move(split_move).ids
-            flow._apply_on_move(move, assign_picking)
-            return move.browse(move_ids)
-        raise UserError(
-            _(
-                "No routing flow available for the move {move} in transfer {picking}."
-            ).format(move=move.display_name, picking=move.picking_id.name)
-        )
+            remaining_moves -= flow_moves
+            split_moves = flow.split_moves(flow_moves)
+            # Try to apply the rest of the flows to the split moves
+            if split_moves:
+                result |= (flows - flow).apply_on_moves(split_moves, assign_picking)
+            flow._apply_on_moves(flow_moves, assign_picking)
+        if remaining_moves:
+            move = remaining_moves[0]
+            raise UserError(
+                _(
+                    "No routing flow available for the move {move} in transfer "
+                    "{picking}."
+                ).format(move=move.display_name, picking=move.picking_id.name)
+            )
+        return result
 
     def _get_rule_from_delivery_route(self, html_exc=False):
         rule = self.delivery_route_id.rule_ids.filtered(
@@ -485,12 +541,27 @@ class StockWarehouseFlow(models.Model):
         return move._prepare_move_split_vals(split_qty_uom)
 
     def _split_move(self, move, split_qty):
-        split_move = move.copy(self._prepare_move_split_vals(move, split_qty))
-        new_product_qty = move.product_id.uom_id._compute_quantity(
-            move.product_qty - split_qty, move.product_uom, round=False
-        )
-        move.product_uom_qty = new_product_qty
-        return split_move
+        return self._split_moves({move: split_qty})
+
+    def _split_moves(self, split_qties):
+        """Split the quantities out of the moves
+
+        :param split_qties: dict {move: quantity to split, in the product's
+                            unit of measure}
+        :return: the new moves
+        """
+        if not split_qties:
+            return self.env["stock.move"].browse()
+        vals_list = [
+            move.copy_data(self._prepare_move_split_vals(move, split_qty))[0]
+            for move, split_qty in split_qties.items()
+        ]
+        split_moves = self.env["stock.move"].create(vals_list)
+        for move, split_qty in split_qties.items():
+            move.product_uom_qty = move.product_id.uom_id._compute_quantity(
+                move.product_qty - split_qty, move.product_uom, round=False
+            )
+        return split_moves
 
     def _get_split_qty_multiple_of(self, move, qty, uom=None):
         """Returns the qty to split
@@ -510,35 +581,51 @@ class StockWarehouseFlow(models.Model):
         return split_qty
 
     def _split_move_simple(self, move):
-        split_moves = move.browse([])
-        split_qty = self._get_split_qty_multiple_of(move, self.qty, self.uom_id)
-        if not split_qty:
-            return split_moves
-        return self._split_move(move, split_qty)
+        return self._split_moves_simple(move)
+
+    def _split_moves_simple(self, moves):
+        split_qties = {}
+        for move in moves:
+            split_qty = self._get_split_qty_multiple_of(move, self.qty, self.uom_id)
+            if split_qty:
+                split_qties[move] = split_qty
+        return self._split_moves(split_qties)
 
     def split_move(self, move):
+        return self.split_moves(move)
+
+    def split_moves(self, moves):
         self.ensure_one()
-        split_moves = move.browse([])
+        split_moves = moves.browse([])
         if self.split_method == "simple":
-            return self._split_move_simple(move)
+            return self._split_moves_simple(moves)
         return split_moves
 
     def _apply_on_move(self, move, assign_picking=True):
         """Apply the flow configuration on the move."""
+        return self._apply_on_moves(move, assign_picking=assign_picking)
+
+    def _prepare_apply_on_moves_vals(self):
+        rule = self._get_rule_from_delivery_route()
+        return {
+            "picking_id": False,
+            "picking_type_id": self.to_picking_type_id.id,
+            "location_id": (
+                self.to_output_stock_loc_id
+                or self.to_picking_type_id.default_location_src_id
+            ).id,
+            "procure_method": rule.procure_method,
+            "rule_id": rule.id,
+        }
+
+    def _apply_on_moves(self, moves, assign_picking=True):
+        """Apply the flow configuration on the moves, with one write"""
         if not self:
             return False
-        logger.info("Applying flow '%s' on '%s'", self.name, move)
-        rule = self._get_rule_from_delivery_route()
-        move.picking_id = False
-        move.picking_type_id = self.to_picking_type_id
-        move.location_id = (
-            self.to_output_stock_loc_id
-            or self.to_picking_type_id.default_location_src_id
-        )
-        move.procure_method = rule.procure_method
-        move.rule_id = rule
+        logger.info("Applying flow '%s' on '%s'", self.name, moves)
+        moves.write(self._prepare_apply_on_moves_vals())
         if assign_picking:
-            move._assign_picking()
+            moves._assign_picking()
 
     def write(self, vals):
         res = super().write(vals)
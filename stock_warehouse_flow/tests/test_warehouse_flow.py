@@ -2,6 +2,9 @@
 # Copyright 2023 Michael Tietz (MT Software) <mtietz@mt-software.de>
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
 
+from unittest import mock
+
+from odoo import fields
 from odoo.exceptions import UserError
 
 from . import common
@@ -132,3 +135,49 @@ class TestWarehouseFlow(common.CommonFlow):
         ship_flow.unlink()
         with self.assertRaises(UserError):
             self._run_split_flow()
+
+    def test_split_several_moves(self):
+        """The flows are searched and applied once for moves sharing them."""
+        ship_flow, pick_flow = self._prepare_split_test()
+        proc_group = self.env["procurement.group"]
+        group = proc_group.create({"carrier_id": pick_flow.carrier_ids[:1].id})
+        today = fields.Date.today()
+        values = {
+            "group_id": group,
+            "date_planned": today,
+            "date_deadline": today,
+            "warehouse_id": self.wh,
+            "company_id": self.company,
+        }
+        procurements = [
+            proc_group.Procurement(
+                self.product,
+                qty,
+                self.product.uom_id,
+                self.loc_customer,
+                self.product.name,
+                "PROC TEST",
+                self.company,
+                values,
+            )
+            for qty in (5, 4)
+        ]
+        FLOW = self.env.registry["stock.warehouse.flow"]
+        moves_before = self.env["stock.move"].search([])
+        with mock.patch.object(
+            FLOW, "_search_for_move", autospec=True, side_effect=FLOW._search_for_move
+        ) as search:
+            proc_group.run(procurements)
+        self.assertEqual(search.call_count, 1)
+        moves = self.env["stock.move"].search([]) - moves_before
+        moves_ship = moves.filtered(lambda m: m.picking_type_id.code == "outgoing")
+        # the quantity left by the split of the first move goes to the ship
+        # flow, the rest (maybe merged) to the pick flow
+        move_split = moves_ship.filtered(
+            lambda m: m.picking_type_id == ship_flow.to_picking_type_id
+        )
+        self.assertEqual(move_split.product_qty, 1)
+        self.assertEqual(sum((moves_ship - move_split).mapped("product_qty")), 8)
+        self.assertEqual(
+            (moves_ship - move_split).picking_type_id, pick_flow.to_picking_type_id
+        )